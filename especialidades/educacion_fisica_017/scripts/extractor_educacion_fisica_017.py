@@ -7,7 +7,7 @@ Especialidad con alto volumen de candidatos
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
 
 import pdfplumber
 import re
@@ -15,6 +15,9 @@ import csv
 from pathlib import Path
 import yaml
 
+from estadisticas_online import AcumuladorEstadisticas
+from puntuacion import array
+
 def cargar_configuracion():
     """Carga la configuración desde config.yaml"""
     config_path = Path(__file__).parent.parent / "config.yaml"
@@ -45,6 +48,7 @@ def extraer_puntuaciones_educacion_fisica():
         return []
     
     puntuaciones_extraidas = []
+    estadisticas = AcumuladorEstadisticas()
     paginas_procesadas = 0
     paginas_con_datos = 0
     
@@ -86,6 +90,7 @@ def extraer_puntuaciones_educacion_fisica():
                 
                 if puntuaciones_pagina:
                     puntuaciones_extraidas.extend(puntuaciones_pagina)
+                    estadisticas.actualizar_lote(array(puntuaciones_pagina))
                     paginas_con_datos += 1
                     
                     # Log detallado para las primeras y últimas páginas
@@ -97,6 +102,7 @@ def extraer_puntuaciones_educacion_fisica():
                 # Progreso cada 50 páginas
                 if paginas_procesadas % 50 == 0:
                     print(f"🔄 Progreso: {paginas_procesadas}/{total_paginas} páginas ({paginas_procesadas/total_paginas*100:.1f}%)")
+                    print(f"   📊 {estadisticas.linea_progreso()}")
     
     except Exception as e:
         print(f"❌ Error al procesar PDF: {str(e)}")
@@ -109,7 +115,8 @@ def extraer_puntuaciones_educacion_fisica():
     
     if puntuaciones_extraidas:
         print(f"   📈 Rango: {min(puntuaciones_extraidas):.4f} - {max(puntuaciones_extraidas):.4f}")
-        print(f"   📊 Media aproximada: {sum(puntuaciones_extraidas)/len(puntuaciones_extraidas):.2f}")
+        print(f"   📊 Media: {estadisticas.media:.4f} | Mediana: {estadisticas.mediana:.4f} | "
+              f"Desviación estándar: {estadisticas.desviacion:.4f}")
     
     return puntuaciones_extraidas
 
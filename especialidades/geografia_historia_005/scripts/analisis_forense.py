@@ -4,9 +4,13 @@ Análisis forense de Geografía e Historia (005) - Páginas 360-365
 Para entender la estructura y depurar el extractor
 """
 
-import pdfplumber
+import os
+import sys
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+from cache_paginas import PaginasPDF
+
 def analizar_estructura_geografia_historia():
     """Analiza las primeras páginas de Geografía e Historia para entender la estructura"""
     
@@ -15,17 +19,16 @@ def analizar_estructura_geografia_historia():
     print("🗺️ ANÁLISIS FORENSE - Geografía e Historia (005)")
     print("=" * 60)
     
-    with pdfplumber.open(pdf_path) as pdf:
+    with PaginasPDF(pdf_path) as pdf:
         # Analizar páginas 360-365 (índices 359-364)
         for num_pagina in range(359, 365):
-            if num_pagina >= len(pdf.pages):
+            if num_pagina >= pdf.num_paginas():
                 break
                 
             print(f"\n📄 PÁGINA {num_pagina + 1}:")
             print("-" * 30)
             
-            pagina = pdf.pages[num_pagina]
-            texto = pagina.extract_text()
+            texto = pdf.texto(num_pagina)
             
             if texto:
                 lineas = texto.split('\n')
@@ -6,13 +6,14 @@ Procesa páginas 360-661 del PDF oficial de baremos
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
 
-import pdfplumber
 import re
 import yaml
 from pathlib import Path
 
+from cache_paginas import PaginasPDF
+
 def cargar_configuracion():
     """Carga la configuración desde config.yaml"""
     config_path = Path(__file__).parent.parent / "config.yaml"
@@ -43,14 +44,13 @@ def extraer_puntuaciones_geografia_historia():
     patron_numero = r'(\d+[,\.]\d+|\d+)'
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with PaginasPDF(pdf_path) as pdf:
             # Procesar el rango de páginas especificado
             for num_pagina in range(config['extraccion']['pagina_inicio'] - 1, config['extraccion']['pagina_fin']):
-                if num_pagina >= len(pdf.pages):
+                if num_pagina >= pdf.num_paginas():
                     break
                     
-                pagina = pdf.pages[num_pagina]
-                texto = pagina.extract_text()
+                texto = pdf.texto(num_pagina)  # caché persistente por página
                 
                 if texto:
                     lineas = texto.split('\n')
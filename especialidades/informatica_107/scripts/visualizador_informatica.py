@@ -22,6 +22,9 @@ ESPECIALIDAD_DIR = SCRIPT_DIR.parent
 CONFIG_PATH = ESPECIALIDAD_DIR / "config.yaml"
 OUTPUT_DIR = ESPECIALIDAD_DIR / "output"
 
+sys.path.append(str(ESPECIALIDAD_DIR.parent.parent / "src"))
+from datos import cargar_puntuaciones
+
 def cargar_configuracion():
     """Carga la configuración desde config.yaml"""
     try:
@@ -32,27 +35,13 @@ def cargar_configuracion():
         sys.exit(1)
 
 def cargar_datos():
-    """Carga los datos extraídos"""
-    
-    # Intentar cargar desde el archivo Python generado
-    lista_py = OUTPUT_DIR / "lista_informatica_107.py"
-    
-    if lista_py.exists():
-        try:
-            # Leer y ejecutar el archivo Python
-            with open(lista_py, 'r', encoding='utf-8') as f:
-                contenido = f.read()
-            
-            # Crear un namespace local para exec
-            namespace = {}
-            exec(contenido, namespace)
-            
-            if 'puntuaciones_informatica' in namespace:
-                datos = namespace['puntuaciones_informatica']
-                print(f"✅ Datos cargados desde Python: {len(datos)} candidatos")
-                return np.array(datos)
-        except Exception as e:
-            print(f"⚠️ Error leyendo archivo Python: {e}")
+    """Carga los datos extraídos (artefacto binario, ver src/datos.py)"""
+    try:
+        datos = cargar_puntuaciones("107", como_float=True)
+        print(f"✅ Datos cargados: {len(datos)} candidatos")
+        return datos
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⚠️ Error leyendo datos: {e}")
     
     print("❌ No se pueden cargar los datos")
     print("🔄 Ejecuta primero: python extractor_informatica.py")
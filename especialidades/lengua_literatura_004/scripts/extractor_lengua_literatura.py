@@ -12,6 +12,9 @@ import pdfplumber
 import re
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+from puntuacion import a_fijo, a_float, parsear, formatear, es_valida
+
 def cargar_configuracion():
     """Carga la configuración desde config.yaml"""
     config_path = Path(__file__).parent.parent / "config.yaml"
@@ -19,7 +22,7 @@ def cargar_configuracion():
         return yaml.safe_load(file)
 
 def extraer_puntuaciones_pagina(page):
-    """Extrae puntuaciones de una página usando múltiples métodos"""
+    """Extrae puntuaciones de una página (diezmilésimas) usando múltiples métodos"""
     puntuaciones = []
     
     try:
@@ -30,8 +33,8 @@ def extraer_puntuaciones_pagina(page):
             matches = re.findall(r'\b\d+[,\.]\d{4}\b', text)
             for match in matches:
                 try:
-                    puntuacion = float(match.replace(',', '.'))
-                    if 0.0 <= puntuacion <= 10.0:
+                    puntuacion = parsear(match)
+                    if es_valida(puntuacion):
                         puntuaciones.append(puntuacion)
                 except ValueError:
                     continue
@@ -49,8 +52,8 @@ def extraer_puntuaciones_pagina(page):
                                     matches = re.findall(r'\b\d+[,\.]\d{4}\b', cell)
                                     for match in matches:
                                         try:
-                                            puntuacion = float(match.replace(',', '.'))
-                                            if 0.0 <= puntuacion <= 10.0:
+                                            puntuacion = parsear(match)
+                                            if es_valida(puntuacion):
                                                 puntuaciones.append(puntuacion)
                                         except ValueError:
                                             continue
@@ -61,22 +64,23 @@ def extraer_puntuaciones_pagina(page):
     return puntuaciones
 
 def validar_pagina(puntuaciones_extraidas, puntuaciones_esperadas, numero_pagina):
-    """Valida que las puntuaciones extraídas coincidan con las esperadas"""
+    """Valida que las puntuaciones extraídas coincidan con las esperadas (exacto en diezmilésimas)"""
     coincidencias = 0
     total_esperadas = len(puntuaciones_esperadas)
     
     print(f"\n=== VALIDACIÓN PÁGINA {numero_pagina} ===")
     print(f"Puntuaciones esperadas: {puntuaciones_esperadas}")
-    print(f"Puntuaciones extraídas (primeras {len(puntuaciones_esperadas)}): {puntuaciones_extraidas[:len(puntuaciones_esperadas)]}")
+    print(f"Puntuaciones extraídas (primeras {len(puntuaciones_esperadas)}): "
+          f"{[formatear(p) for p in puntuaciones_extraidas[:len(puntuaciones_esperadas)]]}")
     
     for i, esperada in enumerate(puntuaciones_esperadas):
         if i < len(puntuaciones_extraidas):
             extraida = puntuaciones_extraidas[i]
-            if abs(extraida - esperada) < 0.0001:
+            if extraida == a_fijo(esperada):
                 coincidencias += 1
-                print(f"✓ Posición {i+1}: {extraida} == {esperada}")
+                print(f"✓ Posición {i+1}: {formatear(extraida)} == {esperada}")
             else:
-                print(f"✗ Posición {i+1}: {extraida} != {esperada}")
+                print(f"✗ Posición {i+1}: {formatear(extraida)} != {esperada}")
         else:
             print(f"✗ Posición {i+1}: No encontrada")
     
@@ -161,7 +165,7 @@ def main():
         return False
     
     # Estadísticas básicas
-    df = pd.DataFrame({'Total': todas_puntuaciones})
+    df = pd.DataFrame({'Total': [a_float(p) for p in todas_puntuaciones]})     # solo para presentar
     print(f"\n📈 ESTADÍSTICAS")
     print("-" * 30)
     print(f"Puntuación máxima: {df['Total'].max():.4f}")
@@ -173,7 +177,7 @@ def main():
     try:
         # CSV
         csv_path = output_dir / "puntuaciones_lengua_literatura_011.csv"
-        df.to_csv(csv_path, index=False, encoding='utf-8')
+        pd.DataFrame({'Total': [formatear(p) for p in todas_puntuaciones]}).to_csv(csv_path, index=False, encoding='utf-8')
         print(f"✅ CSV guardado: {csv_path}")
         
         # TXT (lista legible)
@@ -182,7 +186,7 @@ def main():
             f.write("# Puntuaciones Lengua Castellana y Literatura (011) - Baremo 2025\n")
             f.write(f"# Total candidatos: {len(todas_puntuaciones)}\n\n")
             for i, puntuacion in enumerate(todas_puntuaciones, 1):
-                f.write(f"{i:4d}: {puntuacion:.4f}\n")
+                f.write(f"{i:4d}: {formatear(puntuacion)}\n")
         print(f"✅ TXT guardado: {txt_path}")
         
         # Python array
@@ -195,7 +199,7 @@ def main():
             f.write('"""\n\n')
             f.write("puntuaciones_lengua_literatura_011 = [\n")
             for puntuacion in todas_puntuaciones:
-                f.write(f"    {puntuacion:.4f},\n")
+                f.write(f"    {formatear(puntuacion)},\n")
             f.write("]\n")
         print(f"✅ Python guardado: {py_path}")
         
@@ -288,10 +292,10 @@ if __name__ == "__main__":
             # Limpiar y normalizar
             numero_str = texto.strip().replace(',', '.')
             
-            # Extraer solo la parte numérica
-            match = re.search(r'\d+\.?\d*', numero_str)
+            # Extraer solo la parte numérica (análisis exacto con puntuacion.parsear)
+            match = re.search(r'\d+(?:\.\d{1,4})?', numero_str)
             if match:
-                return float(match.group())
+                return a_float(parsear(match.group()))
             return None
         except:
             return None
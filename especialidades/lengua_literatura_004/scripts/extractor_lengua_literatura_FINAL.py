@@ -13,6 +13,9 @@ import pdfplumber
 import re
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+from puntuacion import ESCALA, MAXIMO, a_fijo, a_float, parsear, formatear, es_valida
+
 def cargar_configuracion():
     """Carga la configuración desde config.yaml"""
     config_path = Path(__file__).parent.parent / "config.yaml"
@@ -36,7 +39,7 @@ def extraer_puntuaciones_lengua(config):
     print(f"📊 Páginas: {pdf_config['pagina_inicio']}-{pdf_config['pagina_fin']}")
     print(f"📁 Salida: {Path(__file__).parent.parent / 'output'}")
     
-    puntuaciones = []  # Lista ordenada como en el PDF
+    puntuaciones = []  # Lista ordenada como en el PDF (diezmilésimas)
     
     try:
         with pdfplumber.open(pdf_path) as pdf:
@@ -69,8 +72,8 @@ def extraer_puntuaciones_lengua(config):
                                 if numeros:
                                     primer_numero = numeros[0]  # El primer número es la puntuación total
                                     try:
-                                        valor = float(primer_numero.replace(',', '.'))
-                                        if 0.0 <= valor <= 10.0:  # Rango válido de puntuaciones
+                                        valor = parsear(primer_numero)
+                                        if es_valida(valor):  # Rango válido de puntuaciones
                                             puntuaciones.append(valor)
                                             puntuaciones_pagina.append(valor)
                                     except ValueError:
@@ -100,22 +103,23 @@ def extraer_puntuaciones_lengua(config):
     return puntuaciones
 
 def validar_pagina(puntuaciones_extraidas, puntuaciones_esperadas, numero_pagina):
-    """Valida que las puntuaciones extraídas coincidan con las esperadas"""
+    """Valida que las puntuaciones extraídas coincidan con las esperadas (exacto en diezmilésimas)"""
     coincidencias = 0
     total_esperadas = len(puntuaciones_esperadas)
     
     print(f"\n=== VALIDACIÓN PÁGINA {numero_pagina} ===")
     print(f"Puntuaciones esperadas: {puntuaciones_esperadas}")
-    print(f"Puntuaciones extraídas (primeras {total_esperadas}): {puntuaciones_extraidas[:total_esperadas]}")
+    print(f"Puntuaciones extraídas (primeras {total_esperadas}): "
+          f"{[formatear(p) for p in puntuaciones_extraidas[:total_esperadas]]}")
     
     for i, esperada in enumerate(puntuaciones_esperadas):
         if i < len(puntuaciones_extraidas):
             extraida = puntuaciones_extraidas[i]
-            if abs(extraida - esperada) < 0.0001:
+            if extraida == a_fijo(esperada):
                 coincidencias += 1
-                print(f"✓ Posición {i+1}: {extraida} == {esperada}")
+                print(f"✓ Posición {i+1}: {formatear(extraida)} == {esperada}")
             else:
-                print(f"✗ Posición {i+1}: {extraida} != {esperada}")
+                print(f"✗ Posición {i+1}: {formatear(extraida)} != {esperada}")
         else:
             print(f"✗ Posición {i+1}: No encontrada")
     
@@ -125,16 +129,17 @@ def validar_pagina(puntuaciones_extraidas, puntuaciones_esperadas, numero_pagina
     return porcentaje >= 70.0  # Consideramos válido si coincide al menos el 70%
 
 def calcular_estadisticas(puntuaciones):
-    """Calcula estadísticas básicas"""
+    """Calcula estadísticas básicas (entrada en diezmilésimas, salida en puntos)"""
     if not puntuaciones:
         return None
         
+    media = sum(puntuaciones) / len(puntuaciones)
     return {
         'total': len(puntuaciones),
-        'max': max(puntuaciones),
-        'min': min(puntuaciones),
-        'media': sum(puntuaciones) / len(puntuaciones),
-        'desviacion': (sum((x - sum(puntuaciones) / len(puntuaciones))**2 for x in puntuaciones) / len(puntuaciones))**0.5
+        'max': a_float(max(puntuaciones)),
+        'min': a_float(min(puntuaciones)),
+        'media': a_float(media),
+        'desviacion': a_float((sum((x - media)**2 for x in puntuaciones) / len(puntuaciones))**0.5)
     }
 
 def guardar_resultados(puntuaciones, config):
@@ -147,7 +152,7 @@ def guardar_resultados(puntuaciones, config):
     # CSV
     df = pd.DataFrame({
         'posicion': range(1, len(puntuaciones) + 1),
-        'puntuacion': puntuaciones
+        'puntuacion': [formatear(p) for p in puntuaciones]
     })
     csv_path = output_dir / f"{base_name}.csv"
     df.to_csv(csv_path, index=False, encoding='utf-8')
@@ -159,7 +164,7 @@ def guardar_resultados(puntuaciones, config):
         f.write("# Puntuaciones Lengua Castellana y Literatura (004) - Baremo 2025\n")
         f.write(f"# Total candidatos: {len(puntuaciones)}\n\n")
         for i, punt in enumerate(puntuaciones, 1):
-            f.write(f"{i:4d}: {punt:.4f}\n")
+            f.write(f"{i:4d}: {formatear(punt)}\n")
     print(f"✅ TXT guardado: {txt_path}")
     
     # Python array
@@ -172,7 +177,7 @@ def guardar_resultados(puntuaciones, config):
         f.write('"""\n\n')
         f.write('puntuaciones_lengua_literatura_004 = [\n')
         for punt in puntuaciones:
-            f.write(f'    {punt:.4f},\n')
+            f.write(f'    {formatear(punt)},\n')
         f.write(']\n')
     print(f"✅ Python guardado: {py_path}")
     
@@ -190,22 +195,23 @@ def guardar_resultados(puntuaciones, config):
             f.write(f"Puntuación máxima: {stats['max']:.4f}\n")
             f.write(f"Puntuación mínima: {stats['min']:.4f}\n")
             f.write(f"Puntuación media: {stats['media']:.4f}\n")
-            f.write(f"Mediana: {sorted(puntuaciones)[len(puntuaciones)//2]:.4f}\n")
+            ordenadas = sorted(puntuaciones)
+            f.write(f"Mediana: {formatear(ordenadas[len(puntuaciones)//2])}\n")
             f.write(f"Desviación estándar: {stats['desviacion']:.4f}\n")
-            f.write(f"Percentil 25: {sorted(puntuaciones)[len(puntuaciones)//4]:.4f}\n")
-            f.write(f"Percentil 75: {sorted(puntuaciones)[3*len(puntuaciones)//4]:.4f}\n\n")
+            f.write(f"Percentil 25: {formatear(ordenadas[len(puntuaciones)//4])}\n")
+            f.write(f"Percentil 75: {formatear(ordenadas[3*len(puntuaciones)//4])}\n\n")
             
             # Distribución por rangos
             f.write("DISTRIBUCIÓN POR RANGOS:\n")
             f.write("-" * 25 + "\n")
             rangos = [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10)]
             for min_r, max_r in rangos:
-                count = sum(1 for p in puntuaciones if min_r <= p < max_r)
+                count = sum(1 for p in puntuaciones if min_r * ESCALA <= p < max_r * ESCALA)
                 porcentaje = (count / len(puntuaciones)) * 100
                 f.write(f"{min_r}-{max_r} puntos: {count} candidatos ({porcentaje:.1f}%)\n")
             
             # Puntuación exacta 10
-            count_10 = sum(1 for p in puntuaciones if p == 10.0)
+            count_10 = sum(1 for p in puntuaciones if p == MAXIMO)
             if count_10 > 0:
                 porcentaje_10 = (count_10 / len(puntuaciones)) * 100
                 f.write(f"10.0 puntos exactos: {count_10} candidatos ({porcentaje_10:.1f}%)\n")
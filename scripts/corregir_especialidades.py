@@ -12,6 +12,10 @@ from pathlib import Path
 import os
 import sys
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
+from estadisticas import calcular
+from puntuacion import array
+
 def corregir_puntuaciones(puntuaciones):
     """Corrige puntuaciones limitándolas al rango 0.0-10.0"""
     puntuaciones_corregidas = np.array(puntuaciones)
@@ -22,18 +26,18 @@ def corregir_puntuaciones(puntuaciones):
     return puntuaciones_corregidas.tolist()
 
 def generar_estadisticas(puntuaciones, nombre_especialidad):
-    """Genera estadísticas descriptivas"""
-    puntuaciones = np.array(puntuaciones)
+    """Genera estadísticas descriptivas (núcleo común de src/estadisticas.py)"""
+    est = calcular(array(puntuaciones))[0]
     
     estadisticas = {
-        'total_candidatos': len(puntuaciones),
-        'media': np.mean(puntuaciones),
-        'mediana': np.median(puntuaciones),
-        'desviacion': np.std(puntuaciones),
-        'minimo': np.min(puntuaciones),
-        'maximo': np.max(puntuaciones),
-        'q1': np.percentile(puntuaciones, 25),
-        'q3': np.percentile(puntuaciones, 75)
+        'total_candidatos': est['total'],
+        'media': est['media'],
+        'mediana': est['percentiles']['p50'],
+        'desviacion': est['desviacion'],
+        'minimo': est['minimo'],
+        'maximo': est['maximo'],
+        'q1': est['percentiles']['p25'],
+        'q3': est['percentiles']['p75']
     }
     
     print(f"\n📊 {nombre_especialidad} - Estadísticas Corregidas:")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Almacén columnar de todos los candidatos - Baremos 2025
+Une en un único conjunto de datos los candidatos de todas las especialidades
+(cada una con su CSV de formato distinto) a partir de sus artefactos
+binarios (datos.py) y, cuando existen, de los apartados del extractor por
+columnas (apartados_<especialidad>.csv).
+
+Cada columna es un .npy en output/almacen/ que se abre con memoria mapeada:
+
+    especialidad.npy   uint8, índice en meta.json['especialidades'] (categórica)
+    orden.npy          int32, orden dentro de su especialidad (1-based)
+    pagina.npy         int32, página del PDF completo (-1 si no se conoce)
+    puntuacion.npy     int32, diezmilésimas (ver puntuacion.py)
+    apartados.npy      int32 [n, k], diezmilésimas de cada apartado (-1 si falta)
+    contadores.npy     int16 [n, k], contador 'x/N' de cada apartado (-1 si no hay)
+    ordenadas.npy      int32, puntuaciones ordenadas dentro de cada especialidad
+
+Las filas están agrupadas por especialidad y en orden del PDF; meta.json
+guarda el tramo [inicio, fin) de cada una. Las consultas entre
+especialidades son operaciones vectorizadas sobre estas columnas.
+
+Uso:
+    almacen = cargar_almacen()
+    almacen.puntuacion[almacen.puntuacion >= parsear('9,0000')]
+    almacen.conteo_por_pagina()
+
+    python src/almacen.py [--construir] [--por-encima 9,0000]
+
+Autor: @joanh
+"""
+
+import csv
+import sys
+import json
+import argparse
+from datetime import date
+import numpy as np
+
+from baremo_comun import RAIZ, cargar_especialidades, nombres_salida
+from datos import cargar_puntuaciones, cargar_paginas, cargar_cabecera, codigos_disponibles
+from puntuacion import TIPO, parsear, formatear
+
+ALMACEN_DIR = RAIZ / "output" / "almacen"
+COLUMNAS = ('especialidad', 'orden', 'pagina', 'puntuacion', 'apartados', 'contadores')
+SIN_VALOR = -1
+
+
+def leer_apartados(codigo, total):
+    """
+    (apartados, contadores) de apartados_<especialidad>.csv como arrays
+    [total, k] o None si no existe o no cuadra con el total de candidatos.
+    """
+    salida = nombres_salida(codigo)
+    ruta = salida['directorio'] / f"apartados_{salida['directorio'].parent.name}.csv"
+    if not ruta.exists():
+        return None
+
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lector = csv.reader(f)
+        cabecera = next(lector)
+        filas = list(lector)
+    if len(filas) != total:
+        print(f"⚠️ {codigo}: {ruta.name} tiene {len(filas)} filas y el binario {total}; se ignoran los apartados")
+        return None
+
+    columnas = [i for i, nombre in enumerate(cabecera) if nombre.startswith('A') and not nombre.endswith('_n')]
+    apartados = np.full((total, len(columnas)), SIN_VALOR, dtype=TIPO)
+    contadores = np.full((total, len(columnas)), SIN_VALOR, dtype=np.int16)
+    for i, fila in enumerate(filas):
+        for j, col in enumerate(columnas):
+            if fila[col]:
+                apartados[i, j] = parsear(fila[col])
+            if col + 1 < len(fila) and fila[col + 1]:
+                contadores[i, j] = int(fila[col + 1])
+    return apartados, contadores
+
+
+def construir_almacen(codigos=None, directorio=ALMACEN_DIR):
+    """Reconstruye el almacén con las especialidades que tienen artefacto binario"""
+    config = cargar_especialidades()
+    nombres = {e['codigo']: e['nombre'] for e in config['especialidades'].values()}
+
+    partes, especialidades = [], []
+    for codigo in codigos or codigos_disponibles():
+        try:
+            puntuaciones = np.asarray(cargar_puntuaciones(codigo))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"⚠️ {codigo}: {e}")
+            continue
+        total = puntuaciones.size
+        paginas = cargar_paginas(codigo)
+        partes.append({
+            'puntuacion': puntuaciones,
+            'pagina': np.asarray(paginas) if paginas is not None else np.full(total, SIN_VALOR, dtype=np.int32),
+            'orden': np.arange(1, total + 1, dtype=np.int32),
+            'especialidad': np.full(total, len(especialidades), dtype=np.uint8),
+            'apartados': leer_apartados(codigo, total),
+        })
+        especialidades.append({
+            'codigo': codigo,
+            'nombre': nombres.get(codigo, codigo),
+            'total': int(total),
+            'sha256': cargar_cabecera(codigo)['sha256'],
+            'apartados': partes[-1]['apartados'] is not None,
+        })
+
+    num_apartados = max((p['apartados'][0].shape[1] for p in partes if p['apartados'] is not None), default=0)
+    apartados, contadores = [], []
+    for p in partes:
+        total = p['puntuacion'].size
+        bloque = np.full((total, num_apartados), SIN_VALOR, dtype=TIPO)
+        bloque_n = np.full((total, num_apartados), SIN_VALOR, dtype=np.int16)
+        if p['apartados'] is not None:
+            k = p['apartados'][0].shape[1]
+            bloque[:, :k], bloque_n[:, :k] = p['apartados']
+        apartados.append(bloque)
+        contadores.append(bloque_n)
+
+    directorio.mkdir(parents=True, exist_ok=True)
+    tipos = {'especialidad': np.uint8, 'orden': np.int32, 'pagina': np.int32, 'puntuacion': TIPO}
+    columnas = {nombre: np.concatenate([p[nombre] for p in partes]) if partes else np.empty(0, dtype=tipo)
+                for nombre, tipo in tipos.items()}
+    columnas['apartados'] = np.concatenate(apartados) if partes else np.empty((0, 0), dtype=TIPO)
+    columnas['contadores'] = np.concatenate(contadores) if partes else np.empty((0, 0), dtype=np.int16)
+    for nombre, valores in columnas.items():
+        np.save(directorio / f"{nombre}.npy", valores)
+    # Índice de puntuaciones ordenadas por especialidad (consulta_rango.py)
+    orden = np.lexsort((columnas['puntuacion'], columnas['especialidad']))
+    np.save(directorio / "ordenadas.npy", columnas['puntuacion'][orden])
+
+    inicio = 0
+    for esp in especialidades:
+        esp['inicio'], esp['fin'] = inicio, inicio + esp['total']
+        inicio = esp['fin']
+
+    meta = {
+        'total': int(inicio),
+        'num_apartados': num_apartados,
+        'especialidades': especialidades,
+        'generado': date.today().isoformat(),
+    }
+    with open(directorio / "meta.json", 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+class Almacen:
+    """Columnas del almacén abiertas con memoria mapeada (sin copia)"""
+
+    def __init__(self, directorio=ALMACEN_DIR):
+        with open(directorio / "meta.json", 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        for nombre in COLUMNAS:
+            setattr(self, nombre, np.load(directorio / f"{nombre}.npy", mmap_mode='r'))
+        self.codigos = [e['codigo'] for e in self.meta['especialidades']]
+
+    def __len__(self):
+        return self.meta['total']
+
+    def tramo(self, codigo):
+        """slice de las filas de una especialidad"""
+        esp = self.meta['especialidades'][self.codigos.index(codigo)]
+        return slice(esp['inicio'], esp['fin'])
+
+    def codigo_de(self, filas):
+        """Códigos de especialidad de las filas indicadas (índices o máscara)"""
+        return np.asarray(self.codigos)[self.especialidad[filas]]
+
+    def por_encima(self, umbral):
+        """Índices de los candidatos con puntuación >= umbral (diezmilésimas)"""
+        return np.flatnonzero(self.puntuacion >= umbral)
+
+    def conteo_por_especialidad(self, mascara=None):
+        """Candidatos por especialidad (opcionalmente solo los de la máscara)"""
+        categorias = self.especialidad if mascara is None else self.especialidad[mascara]
+        conteos = np.bincount(categorias, minlength=len(self.codigos))
+        return dict(zip(self.codigos, conteos.tolist()))
+
+    def conteo_por_pagina(self):
+        """{pagina: candidatos} de las filas con página conocida"""
+        paginas = self.pagina[self.pagina != SIN_VALOR]
+        conteos = np.bincount(paginas)
+        con_candidatos = np.flatnonzero(conteos)
+        return dict(zip(con_candidatos.tolist(), conteos[con_candidatos].tolist()))
+
+
+def cargar_almacen(directorio=ALMACEN_DIR):
+    """Abre el almacén (construyéndolo si todavía no existe)"""
+    if not (directorio / "meta.json").exists():
+        construir_almacen(directorio=directorio)
+    return Almacen(directorio)
+
+
+def main():
+    """Construye el almacén y muestra un resumen"""
+    parser = argparse.ArgumentParser(description="Almacén columnar de todas las especialidades")
+    parser.add_argument('--construir', action='store_true', help="Reconstruir desde los artefactos binarios")
+    parser.add_argument('--por-encima', default=None, help="Contar candidatos con puntuación >= valor (p.ej. 9,0000)")
+    args = parser.parse_args()
+
+    if args.construir:
+        construir_almacen()
+    almacen = cargar_almacen()
+    if not len(almacen):
+        print("❌ Almacén vacío: genera antes los artefactos con python src/datos.py")
+        sys.exit(1)
+
+    print(f"🗄️ Almacén: {len(almacen)} candidatos de {len(almacen.codigos)} especialidades "
+          f"({almacen.meta['num_apartados']} apartados)")
+    for esp in almacen.meta['especialidades']:
+        print(f"   {esp['codigo']} {esp['nombre']:<25} {esp['total']:5d}"
+              + (" + apartados" if esp['apartados'] else ""))
+
+    if args.por_encima:
+        umbral = parsear(args.por_encima)
+        filas = almacen.por_encima(umbral)
+        print(f"\n🎯 Puntuación >= {formatear(umbral)}: {filas.size} candidatos")
+        for codigo, n in almacen.conteo_por_especialidad(filas).items():
+            if n:
+                print(f"   {codigo}: {n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Análisis por apartados del baremo - Baremos 2025
+Trabaja con una matriz [candidatos × apartados] por especialidad (puntos
+en diezmilésimas, -1 si el apartado falta) obtenida de:
+
+    - apartados_<especialidad>.csv del extractor por columnas, o
+    - la columna Linea_Completa del CSV de puntuaciones: tras el nombre
+      vienen el total y los valores de cada apartado ('0,3333/4' = valor y
+      contador)
+
+Las columnas no son independientes: en Linea_Completa (006) A1 es el
+apartado 1 completo, A1 = A2 + A5 + A8 + A11, y A2 = A3 + A4, A5 = A6 + A7,
+A8 = A9 + A10 (los que llevan contador 'x/N'). jerarquia() reconstruye ese
+árbol a partir de los contadores y comprueba las sumas; contribuciones,
+correlaciones y topes se calculan solo sobre las hojas (sus contribuciones
+suman la del apartado, sin contar dos veces), y los nodos intermedios se
+resumen aparte. Sobre esa matriz, sin bucles por candidato:
+
+    contribuciones  media de cada hoja y % que supone de la suma de totales
+    correlaciones   matriz de correlación entre hojas (np.corrcoef)
+    topes           % de candidatos en el máximo de cada columna
+    desempate       orden oficial simulado: total y, a igualdad, el apartado y
+                    sus subapartados de primer nivel por orden (np.lexsort);
+                    cuántos empates resuelve
+
+El desempate es parcial: el orden oficial compara antes los apartados 2 y 3
+del baremo, que Linea_Completa no trae (solo el apartado 1), así que los
+empates resueltos y los que quedan son una aproximación. La matriz y el
+análisis se guardan en .cache/apartados/ con clave SHA-256 del fichero de
+origen.
+
+Uso:
+    analizar('006')
+    python src/analisis_apartados.py 006 [--columnas 1 2 5]
+
+Autor: @joanh
+"""
+
+import re
+import csv
+import sys
+import json
+import argparse
+import numpy as np
+
+from baremo_comun import RAIZ, nombres_salida
+from almacen import cargar_almacen, leer_apartados, SIN_VALOR
+from datos import sha256_fichero
+from puntuacion import ESCALA, TIPO, parsear
+
+CACHE_DIR = RAIZ / ".cache" / "apartados"
+PATRON_VALOR = re.compile(r"\b(\d{1,2},\d{4})(?:/(\d+))?")
+VERSION = 2     # cambiar si cambia el análisis para invalidar la caché
+
+
+def leer_linea_completa(ruta):
+    """(totales, valores, contadores) a partir de la columna Linea_Completa de un CSV"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lector = csv.DictReader(f)
+        if 'Linea_Completa' not in (lector.fieldnames or []):
+            return None
+        tokens = [PATRON_VALOR.findall(fila['Linea_Completa']) for fila in lector]
+    if not tokens or not all(tokens):
+        return None
+
+    k = max(len(t) for t in tokens) - 1
+    totales = np.array([parsear(t[0][0]) for t in tokens], dtype=TIPO)
+    valores = np.full((len(tokens), k), SIN_VALOR, dtype=TIPO)
+    contadores = np.full((len(tokens), k), SIN_VALOR, dtype=np.int16)
+    for i, t in enumerate(tokens):
+        for j, (valor, contador) in enumerate(t[1:]):
+            valores[i, j] = parsear(valor)
+            if contador:
+                contadores[i, j] = int(contador)
+    return totales, valores, contadores
+
+
+def fuente_apartados(codigo):
+    """Fichero de origen de los apartados de una especialidad (o None)"""
+    salida = nombres_salida(codigo)
+    for ruta in (salida['directorio'] / f"apartados_{salida['directorio'].parent.name}.csv",
+                 salida['directorio'] / salida['csv']):
+        if ruta.exists():
+            with open(ruta, 'r', encoding='utf-8') as f:
+                cabecera = next(csv.reader(f), [])
+            if 'Linea_Completa' in cabecera or any(c.startswith('A') and c[1:].isdigit() for c in cabecera):
+                return ruta
+    return None
+
+
+def matriz_apartados(codigo, almacen=None):
+    """
+    {'totales': [n], 'valores': [n, k], 'contadores': [n, k]} en diezmilésimas
+    (con caché); FileNotFoundError si la especialidad no tiene apartados.
+    """
+    ruta = fuente_apartados(codigo)
+    if ruta is None:
+        raise FileNotFoundError(f"La especialidad {codigo} no tiene apartados (ni apartados_*.csv ni Linea_Completa)")
+    cache = CACHE_DIR / f"{codigo}_{sha256_fichero(ruta)[:16]}_v{VERSION}.npz"
+    if cache.exists():
+        with np.load(cache) as datos:
+            return {clave: datos[clave] for clave in datos.files}
+
+    if ruta.name.startswith('apartados_'):
+        almacen = almacen or cargar_almacen()
+        tramo = almacen.tramo(codigo)
+        leidos = leer_apartados(codigo, tramo.stop - tramo.start)
+        if leidos is None:
+            raise ValueError(f"{ruta.name} no cuadra con el almacén")
+        matriz = {'totales': np.asarray(almacen.puntuacion[tramo]), 'valores': leidos[0], 'contadores': leidos[1]}
+    else:
+        leidos = leer_linea_completa(ruta)
+        if leidos is None:
+            raise ValueError(f"No se pudieron leer los apartados de {ruta.name}")
+        matriz = dict(zip(('totales', 'valores', 'contadores'), leidos))
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temporal = cache.with_suffix('.tmp.npz')
+    np.savez(temporal, **matriz)
+    temporal.replace(cache)
+    return matriz
+
+
+def jerarquia(valores, contadores):
+    """
+    Árbol de columnas {padre: [hijos]} (índices). Cada subapartado (columna con
+    contador) cuelga de la columna sin contador anterior; la primera columna es
+    la raíz (el apartado completo) si es la suma de las demás columnas sin
+    contador. ValueError si algún padre no es la suma de sus hijos.
+    """
+    con_contador = np.any(contadores != SIN_VALOR, axis=0)
+    arbol, padre = {}, None
+    for j in range(valores.shape[1]):
+        if con_contador[j]:
+            if padre is None:
+                raise ValueError(f"El subapartado A{j + 1} no tiene apartado anterior")
+            arbol.setdefault(padre, []).append(j)
+        else:
+            padre = j
+
+    presentes = np.all(valores != SIN_VALOR, axis=1)
+    completas = valores[presentes].astype(np.int64)
+    sin_contador = np.flatnonzero(~con_contador)
+    if sin_contador.size > 1 and sin_contador[0] == 0 and \
+            np.array_equal(completas[:, 0], completas[:, sin_contador[1:]].sum(axis=1)):
+        arbol[0] = sin_contador[1:].tolist()
+
+    for p, hijos in arbol.items():
+        if not np.array_equal(completas[:, p], completas[:, hijos].sum(axis=1)):
+            raise ValueError(f"A{p + 1} no es la suma de {', '.join(f'A{h + 1}' for h in hijos)}")
+    return arbol
+
+
+def hojas(arbol, k):
+    """Columnas sin hijos: juntas suman el apartado sin contar nada dos veces"""
+    return [j for j in range(k) if j not in arbol]
+
+
+def orden_desempate(arbol, k):
+    """Columnas de nivel superior por orden; si solo está la raíz, la raíz y sus hijos"""
+    hijos = {h for hs in arbol.values() for h in hs}
+    superiores = [j for j in range(k) if j not in hijos]
+    if superiores == [0] and 0 in arbol:
+        return [0] + arbol[0]
+    return superiores
+
+
+def contribuciones(totales, valores):
+    """Media de cada columna (puntos) y % sobre la suma de totales"""
+    presentes = valores != SIN_VALOR
+    suma = np.where(presentes, valores, 0).sum(axis=0, dtype=np.int64)
+    n = presentes.sum(axis=0)
+    media = np.divide(suma, n, out=np.zeros(valores.shape[1]), where=n > 0) / ESCALA
+    return media, suma / max(int(np.sum(totales, dtype=np.int64)), 1) * 100
+
+
+def correlaciones(valores):
+    """Matriz de correlación entre apartados (filas completas; NaN si un apartado es constante)"""
+    completas = valores[np.all(valores != SIN_VALOR, axis=1)].astype(np.float64)
+    if completas.shape[0] < 2:
+        return np.full((valores.shape[1],) * 2, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.corrcoef(completas, rowvar=False)
+
+
+def topes(valores, maximos=None):
+    """(máximos, % de candidatos en el máximo) de cada apartado; por defecto el máximo observado"""
+    presentes = valores != SIN_VALOR
+    maximos = valores.max(axis=0) if maximos is None else np.asarray(maximos)
+    en_tope = (valores == maximos) & presentes
+    n = presentes.sum(axis=0)
+    return maximos, np.divide(en_tope.sum(axis=0) * 100, n, out=np.zeros(valores.shape[1]), where=n > 0)
+
+
+def desempate(totales, valores, columnas):
+    """
+    Orden oficial simulado: total descendente y, a igualdad, los apartados
+    indicados (descendente) por orden; después, el orden del PDF. Devuelve
+    (orden, empatados por total, empatados tras el desempate).
+    """
+    claves = np.column_stack([totales] + [valores[:, c] for c in columnas]).astype(np.int64)
+    # np.lexsort ordena por la última clave primero
+    orden = np.lexsort((np.arange(totales.size),) + tuple(-claves[:, j] for j in range(claves.shape[1] - 1, -1, -1)))
+    ordenadas = claves[orden]
+
+    def empatados(iguales):
+        # candidatos cuyo vecino anterior o siguiente tiene la misma clave
+        marca = np.zeros(totales.size, dtype=bool)
+        marca[1:] |= iguales
+        marca[:-1] |= iguales
+        return int(marca.sum())
+
+    por_total = empatados(ordenadas[1:, 0] == ordenadas[:-1, 0]) if totales.size else 0
+    tras_desempate = empatados(np.all(ordenadas[1:] == ordenadas[:-1], axis=1)) if totales.size else 0
+    return orden, por_total, tras_desempate
+
+
+def analizar(codigo, columnas=None):
+    """Análisis completo de una especialidad (con caché en JSON)"""
+    matriz = matriz_apartados(codigo)
+    totales, valores, contadores = matriz['totales'], matriz['valores'], matriz['contadores']
+    k = valores.shape[1]
+    arbol = jerarquia(valores, contadores)
+    columnas = orden_desempate(arbol, k) if columnas is None else list(columnas)
+
+    ruta = fuente_apartados(codigo)
+    clave = f"{codigo}_{sha256_fichero(ruta)[:16]}_v{VERSION}_{'-'.join(map(str, columnas))}"
+    cache = CACHE_DIR / f"{clave}.json"
+    if cache.exists():
+        return json.loads(cache.read_text(encoding='utf-8'))
+
+    media, porcentaje = contribuciones(totales, valores)
+    maximos, en_tope = topes(valores)
+    _, por_total, tras_desempate = desempate(totales, valores, columnas)
+    nombres = [f"A{j + 1}" for j in range(k)]
+    finales = hojas(arbol, k)
+    resultado = {
+        'codigo': codigo,
+        'candidatos': int(totales.size),
+        'apartados': nombres,
+        'jerarquia': {nombres[p]: [nombres[h] for h in hijos] for p, hijos in sorted(arbol.items())},
+        'hojas': [nombres[j] for j in finales],
+        'contribucion': {
+            nombres[j]: {'media': round(float(media[j]), 4), 'porcentaje_total': round(float(porcentaje[j]), 2),
+                         'maximo': int(maximos[j]) / ESCALA, 'porcentaje_en_maximo': round(float(en_tope[j]), 2)}
+            for j in finales
+        },
+        'agregados': {
+            nombres[p]: {'media': round(float(media[p]), 4), 'porcentaje_total': round(float(porcentaje[p]), 2),
+                         'maximo': int(maximos[p]) / ESCALA, 'porcentaje_en_maximo': round(float(en_tope[p]), 2)}
+            for p in sorted(arbol)
+        },
+        'correlaciones': np.round(correlaciones(valores[:, finales]), 4).tolist(),
+        'desempate': {
+            'columnas': [nombres[c] for c in columnas],
+            'parcial': True,    # faltan los apartados 2 y 3 del baremo
+            'empatados_por_total': por_total,
+            'empatados_tras_desempate': tras_desempate,
+        },
+    }
+    cache.write_text(json.dumps(resultado, ensure_ascii=False), encoding='utf-8')
+    return resultado
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Análisis por apartados de una especialidad")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 006)")
+    parser.add_argument('--columnas', type=int, nargs='*', default=None,
+                        help="Apartados del desempate, en orden (1 = A1; por defecto: A1 y sus subapartados de primer nivel)")
+    args = parser.parse_args()
+
+    try:
+        columnas = None if args.columnas is None else [c - 1 for c in args.columnas]
+        r = analizar(args.codigo, columnas)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🧮 {args.codigo}: {r['candidatos']} candidatos × {len(r['apartados'])} apartados")
+    for padre, hijos in r['jerarquia'].items():
+        a = r['agregados'][padre]
+        print(f"🌳 {padre} = {' + '.join(hijos)}: media {a['media']:.4f} | {a['porcentaje_total']:5.2f}% del total")
+    for nombre, c in r['contribucion'].items():
+        print(f"   {nombre:>4}: media {c['media']:.4f} | {c['porcentaje_total']:5.2f}% del total | "
+              f"máx. {c['maximo']:.4f} ({c['porcentaje_en_maximo']:.1f}% en el máximo)")
+    corr = np.array(r['correlaciones'], dtype=float)
+    np.fill_diagonal(corr, np.nan)
+    if np.isfinite(corr).any():
+        i, j = np.unravel_index(np.nanargmax(np.abs(corr)), corr.shape)
+        print(f"🔗 Mayor correlación: {r['hojas'][i]}-{r['hojas'][j]} ({corr[i, j]:.3f})")
+    d = r['desempate']
+    print(f"⚖️ Desempate (parcial, solo apartado 1) por {', '.join(d['columnas'])}: "
+          f"{d['empatados_por_total']} empatados por total → {d['empatados_tras_desempate']} siguen empatados")
+
+
+if __name__ == "__main__":
+    main()
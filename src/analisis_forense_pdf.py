@@ -1,23 +1,22 @@
-import pdfplumber
 import re
+from cache_paginas import PaginasPDF
 
 print("=== ANÁLISIS FORENSE DEL PDF ===")
 print("Analizando estructura real de las páginas de Informática...")
 
-with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
+with PaginasPDF("rh03_257_2025_590_12_baremo_prov.pdf") as paginas:
     
     # Analizar las primeras 3 páginas que conocemos (2649, 2650, 2651)
     paginas_test = [2648, 2649, 2650]  # índices 0-based
     
     for i, num_pagina in enumerate(paginas_test):
-        page = pdf.pages[num_pagina]
         print(f"\n{'='*60}")
         print(f"PÁGINA {num_pagina + 1} (conocemos: página {2649 + i})")
         print(f"{'='*60}")
         
         # 1. ANÁLISIS DE TABLAS
         print("\n1. ESTRUCTURA DE TABLAS:")
-        tables = page.extract_tables()
+        tables = paginas.tablas(num_pagina)  # caché persistente por página
         print(f"   Número de tablas: {len(tables)}")
         
         for j, table in enumerate(tables):
@@ -37,7 +36,7 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
         
         # 2. ANÁLISIS DE TEXTO CRUDO
         print(f"\n2. TEXTO CRUDO (primeras 20 líneas):")
-        texto = page.extract_text()
+        texto = paginas.texto(num_pagina)  # caché persistente por página
         if texto:
             lineas = texto.split('\n')
             for idx, linea in enumerate(lineas[:20]):
@@ -67,7 +66,7 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
         
         # 5. COORDENADAS Y POSICIONAMIENTO
         print(f"\n5. ANÁLISIS DE COORDENADAS:")
-        chars = page.chars
+        chars = paginas.chars(num_pagina)
         if chars:
             # Buscar caracteres que forman números conocidos
             valores_conocidos = ['2,4167', '7,3333', '3,6500'] if i == 0 else \
@@ -91,9 +90,8 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
     
     # Comparar estructuras
     for i, num_pagina in enumerate(paginas_test):
-        page = pdf.pages[num_pagina]
-        tables = page.extract_tables()
-        texto = page.extract_text()
+        tables = paginas.tablas(num_pagina)
+        texto = paginas.texto(num_pagina)
         
         lineas_dni = len([l for l in texto.split('\n') if '****' in l]) if texto else 0
         numeros_total = len(re.findall(r'\b(\d{1,2},\d{4})\b', texto)) if texto else 0
@@ -3,6 +3,8 @@ import matplotlib.pyplot as plt
 from scipy import stats
 import matplotlib.colors as mcolors
 
+from datos import cargar_puntuaciones
+
 # DATOS REALES INFORMÁTICA 107 - 2025
 # Extraídos del PDF oficial páginas 2649-2697
 # Ejecutar primero: extractor_ORDEN_REAL.py
@@ -11,12 +13,10 @@ print("=== ANÁLISIS BAREMO INFORMÁTICA 107 - 2025 ===")
 
 # Cargar datos reales
 try:
-    # Intentar cargar desde el archivo generado
-    with open('lista_informatica_107.py', 'r') as f:
-        exec(f.read())
-    datos = puntuaciones_informatica
+    # Artefacto binario de la especialidad (ver datos.py)
+    datos = cargar_puntuaciones('107', como_float=True)
     print(f"✅ Datos cargados: {len(datos)} candidatos")
-except:
+except (FileNotFoundError, ValueError):
     print("❌ Ejecuta primero 'extractor_ORDEN_REAL.py'")
     print("Usando datos de muestra...")
     # Datos de muestra para testing
@@ -40,6 +40,11 @@ valores_unicos = len(np.unique(puntuaciones))
 print(f"🎯 Puntuaciones diferentes: {valores_unicos}")
 print(f"🔄 Repeticiones: {len(puntuaciones) - valores_unicos}")
 
+# Mayores bloques de empate (el desempate por subapartados decide el puesto)
+from indice_empates import TablaEmpates
+for bloque in TablaEmpates(puntuaciones).mayores_bloques(3):
+    print(f"   {bloque['puntuacion']:.4f}: {bloque['candidatos']} candidatos (puestos {bloque['primero']}-{bloque['ultimo']})")
+
 # Cuartiles
 q1, q2, q3 = np.percentile(puntuaciones, [25, 50, 75])
 print(f"📊 Q1 (25%): {q1:.4f}")
@@ -78,6 +83,11 @@ y_normal_scaled = y_normal * scale_factor
 ax1.plot(x, y_normal_scaled, 'red', linewidth=3, 
          label=f'Distribución Normal\nμ={mu:.2f}, σ={sigma:.2f}')
 
+# Densidad KDE (FFT sobre la rejilla de 0,0001; recoge los picos que la normal no ve)
+from kde import kde_puntuaciones
+x_kde, y_kde = kde_puntuaciones(puntuaciones)
+ax1.plot(x_kde, y_kde * scale_factor, 'darkorange', linewidth=2.5, label='Densidad KDE')
+
 ax1.set_xlabel('Puntuación (0-10)', fontweight='bold')
 ax1.set_ylabel('Número de Candidatos', fontweight='bold')
 ax1.set_title('Distribución de Puntuaciones', fontweight='bold', pad=20)
@@ -168,16 +178,20 @@ for percentil in [10, 25, 50, 75, 90, 95]:
     valor = np.percentile(puntuaciones, percentil)
     print(f"P{percentil:2d}: {valor:.4f}")
 
-# Test de normalidad simplificado
-from scipy.stats import shapiro
-if len(puntuaciones) <= 5000:
-    statistic, p_value = shapiro(puntuaciones)
-    print(f"\n📊 NORMALIDAD (Shapiro-Wilk):")
-    print(f"p-value: {p_value:.6f}")
-    if p_value > 0.05:
-        print("✅ Distribución normal (p > 0.05)")
-    else:
-        print("❌ No sigue distribución normal (p < 0.05)")
+# Tests de normalidad (sin el límite de 5.000 datos de Shapiro-Wilk)
+from normalidad import pruebas_normalidad
+normalidad = pruebas_normalidad(puntuaciones)
+print(f"\n📊 NORMALIDAD:")
+print(f"Anderson-Darling: {normalidad['anderson']['estadistico']:.4f} (crítico 5%: {normalidad['anderson']['critico']:.4f})")
+print(f"D'Agostino K²: p-value {normalidad['dagostino']['p_valor']:.6f}")
+if 'lilliefors' in normalidad:
+    print(f"Lilliefors (KS con media y σ estimadas): p-value {normalidad['lilliefors']['p_valor']:.6f}")
+if 'shapiro' in normalidad:
+    print(f"Shapiro-Wilk: p-value {normalidad['shapiro']['p_valor']:.6f}")
+if all(normalidad[prueba]['normal'] for prueba in ('anderson', 'dagostino', 'lilliefors') if prueba in normalidad):
+    print("✅ Distribución normal (p > 0.05)")
+else:
+    print("❌ No sigue distribución normal (p < 0.05)")
 
 print(f"\n🎉 ANÁLISIS COMPLETADO")
 print(f"📈 {len(puntuaciones)} candidatos analizados")
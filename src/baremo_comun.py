@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Utilidades comunes para los extractores de Baremos 2025
+Configuración global, rutas por especialidad, análisis de líneas de
+candidato y escritura de los ficheros de salida (CSV, TXT, lista Python
+y estadísticas).
+
+Autor: @joanh
+"""
+
+import re
+import yaml
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+from typing import NamedTuple
+
+from puntuacion import parsear, formatear, es_valida
+
+# Configurar rutas
+RAIZ = Path(__file__).resolve().parent.parent
+CONFIG_GLOBAL = RAIZ / "config" / "especialidades.yaml"
+INDICE_PATH = RAIZ / "config" / "indice_especialidades.yaml"
+DATA_DIR = RAIZ / "data"
+ESPECIALIDADES_DIR = RAIZ / "especialidades"
+
+# Patrón: ****XXXX* APELLIDOS, NOMBRE TOTAL apartados...
+PATRON_CANDIDATO = re.compile(r"^\*{4}\d{4}\*\s+[^\d]+?\s+(\d{1,2}[,\.]\d{4})\b")
+CARACTERES_LIMPIAR = ['€', '‚', 'Ç', '§']
+
+
+class Candidato(NamedTuple):
+    """
+    Línea de candidato extraída del PDF (orden dentro de su especialidad).
+    puntuacion en diezmilésimas (48333 = 4,8333), ver puntuacion.py
+    """
+    orden: int
+    pagina: int
+    linea: str
+    puntuacion: int
+
+
+def cargar_indice():
+    """Devuelve config/indice_especialidades.yaml o None si no se ha generado"""
+    if not INDICE_PATH.exists():
+        return None
+    with open(INDICE_PATH, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def cargar_especialidades(aplicar_indice=True):
+    """
+    Carga config/especialidades.yaml (especialidades + configuración general).
+    Si existe el índice generado por indice_especialidades.py, sus rangos de
+    páginas y totales de candidatos sustituyen a los escritos a mano.
+    """
+    with open(CONFIG_GLOBAL, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    indice = cargar_indice() if aplicar_indice else None
+    if indice:
+        for esp in config['especialidades'].values():
+            detectado = indice['especialidades'].get(esp['codigo'])
+            if detectado:
+                esp.update(detectado)
+    return config
+
+
+def buscar_especialidad(config, codigo):
+    """Devuelve la entrada de config/especialidades.yaml con ese código (o None)"""
+    return next((e for e in config['especialidades'].values() if e['codigo'] == codigo), None)
+
+
+def ruta_pdf_original(config=None):
+    """Ruta del PDF provisional completo indicado en la configuración general"""
+    config = config or cargar_especialidades()
+    return DATA_DIR / config['configuracion']['pdf_original']
+
+
+def directorio_especialidad(codigo):
+    """Devuelve la carpeta especialidades/<nombre>_<codigo>"""
+    candidatas = sorted(ESPECIALIDADES_DIR.glob(f"*_{codigo}"))
+    if not candidatas:
+        raise FileNotFoundError(f"No existe carpeta para la especialidad {codigo}")
+    return candidatas[0]
+
+
+def nombres_salida(codigo):
+    """
+    Nombres de los ficheros de salida de una especialidad.
+    Respeta la sección 'output' de su config.yaml y completa lo que falte
+    con los nombres por defecto (puntuaciones_<dir>.csv, lista_<dir>.py...).
+    'origen_lista' es la lista que lee datos.convertir_lista (por defecto la
+    misma 'lista'); guardar_salidas nunca la escribe si es otra.
+    """
+    esp_dir = directorio_especialidad(codigo)
+    base = esp_dir.name
+    output = {}
+    config_path = esp_dir / "config.yaml"
+    if config_path.exists():
+        with open(config_path, 'r', encoding='utf-8') as f:
+            output = (yaml.safe_load(f) or {}).get('output', {}) or {}
+
+    lista = output.get('lista', output.get('python', f"lista_{base}.py"))
+
+    # Mantener el nombre de variable de la lista existente (lo usan los visualizadores)
+    variable = output.get('variable_lista')
+    lista_existente = esp_dir / "output" / lista
+    if variable is None and lista_existente.exists():
+        match = re.search(r'^(\w+)\s*=\s*\[', lista_existente.read_text(encoding='utf-8'), re.M)
+        variable = match.group(1) if match else None
+
+    return {
+        'directorio': esp_dir / "output",
+        'csv': output.get('csv', f"puntuaciones_{base}.csv"),
+        'txt': output.get('txt', f"puntuaciones_{base}.txt"),
+        'lista': lista,
+        'origen_lista': output.get('origen_lista', lista),
+        'estadisticas': output.get('estadisticas', f"estadisticas_{base}.txt"),
+        'variable_lista': variable or f"puntuaciones_{base}",
+    }
+
+
+def limpiar_texto(texto):
+    """Elimina los caracteres problemáticos que introduce el PDF"""
+    for char in CARACTERES_LIMPIAR:
+        texto = texto.replace(char, '')
+    return texto
+
+
+def lineas_candidato(texto):
+    """
+    Devuelve [(linea, puntuacion_total)] de las líneas de candidato del texto
+    de una página. La puntuación total es el primer número con 4 decimales
+    tras el nombre, en diezmilésimas (entero exacto).
+    """
+    resultado = []
+    if not texto:
+        return resultado
+
+    for linea in limpiar_texto(texto).split('\n'):
+        linea = linea.strip()
+        match = PATRON_CANDIDATO.match(linea)
+        if not match:
+            continue
+        try:
+            puntuacion = parsear(match.group(1))
+        except ValueError:
+            continue
+        if es_valida(puntuacion):
+            resultado.append((linea, puntuacion))
+    return resultado
+
+
+def cabeceras_salida(codigo, descripcion, salida):
+    """Líneas previas al primer candidato en CSV, TXT y lista"""
+    return ("Orden,Linea_Completa,Puntuacion_Total,Pagina\n",
+            "",
+            f"# {descripcion} ({codigo}) - Baremo 2025\n"
+            "# Extraídas en orden original del PDF\n\n"
+            f"{salida['variable_lista']} = [\n")
+
+
+def lineas_salida(c):
+    """Línea de un candidato en CSV, TXT y lista"""
+    linea = c.linea.replace('"', '""')
+    valor = formatear(c.puntuacion)
+    return (f"{c.orden},\"{linea}\",{valor},{c.pagina}\n",
+            f"{c.orden}. {valor} - {c.linea}\n",
+            f"    {valor},\n")
+
+
+def cabeceras_coinciden(rutas, cabeceras):
+    """True si todos los ficheros existen y empiezan con su cabecera"""
+    for ruta, cabecera in zip(rutas, cabeceras):
+        if not ruta.exists():
+            return False
+        with open(ruta, 'rb') as f:
+            if f.read(len(cabecera)) != cabecera:
+                return False
+    return True
+
+
+def guardar_salidas(codigo, descripcion, candidatos, conservar=0):
+    """
+    Escribe CSV, TXT, lista Python, estadísticas y el artefacto binario
+    (datos.py) de una especialidad.
+    candidatos: iterable de Candidato en orden del PDF. Se consume en una sola
+    pasada y se escribe a medida que llega (acepta generadores); para el
+    binario solo se acumulan 8 bytes por candidato.
+    conservar: primeros registros que probablemente no cambian
+    (re-extracción incremental). CSV, TXT y lista se leen en lugar de
+    escribirse mientras coincidan con lo que se escribiría; desde el primer
+    registro distinto (o tras 'conservar') se truncan y se escribe el resto.
+    """
+    from datos import guardar_binario
+    from estadisticas import calcular, extremos, escribir_estadisticas
+
+    salida = nombres_salida(codigo)
+    output_dir = salida['directorio']
+    output_dir.mkdir(exist_ok=True)
+    rutas = [output_dir / salida[tipo] for tipo in ('csv', 'txt', 'lista')]
+    cabeceras = [c.encode('utf-8') for c in cabeceras_salida(codigo, descripcion, salida)]
+
+    # Comparar solo si los tres ficheros existen y empiezan con la misma cabecera
+    if conservar and not cabeceras_coinciden(rutas, cabeceras):
+        conservar = 0
+
+    total = conservados = 0
+    comparando = conservar > 0
+    puntuaciones, paginas = array('i'), array('i')
+    pagina_min = pagina_max = None
+
+    with ExitStack() as pila:
+        ficheros = [pila.enter_context(open(ruta, 'r+b' if conservar else 'wb')) for ruta in rutas]
+        if comparando:
+            for f, cabecera in zip(ficheros, cabeceras):
+                f.seek(len(cabecera))
+        else:
+            for f, cabecera in zip(ficheros, cabeceras):
+                f.write(cabecera)
+
+        for c in candidatos:
+            lineas = [l.encode('utf-8') for l in lineas_salida(c)]
+            if comparando:
+                posiciones = [f.tell() for f in ficheros]
+                if c.orden <= conservar and all(f.readline() == l for f, l in zip(ficheros, lineas)):
+                    conservados += 1
+                else:
+                    comparando = False
+                    for f, posicion in zip(ficheros, posiciones):
+                        f.seek(posicion)
+                        f.truncate()
+            if not comparando:
+                for f, l in zip(ficheros, lineas):
+                    f.write(l)
+
+            total += 1
+            puntuaciones.append(c.puntuacion)
+            paginas.append(c.pagina)
+            pagina_min = c.pagina if pagina_min is None else min(pagina_min, c.pagina)
+            pagina_max = c.pagina if pagina_max is None else max(pagina_max, c.pagina)
+
+        if comparando:
+            for f in ficheros:
+                f.truncate()
+        pie = "]\n" + (f"# Total: {total} candidatos | Páginas {pagina_min}-{pagina_max}\n" if total else "")
+        ficheros[2].write(pie.encode('utf-8'))
+
+    guardar_binario(codigo, descripcion, puntuaciones, paginas, origen=salida['csv'])
+
+    # Estadísticas (mismo núcleo y formato que estadisticas.py)
+    est = calcular(puntuaciones)[0] or {'total': 0}
+    est['paginas'] = [pagina_min, pagina_max] if total else None
+    est.update(extremos(puntuaciones))
+    escribir_estadisticas(codigo, descripcion, est)
+
+    salida['total'] = total
+    salida['reescritos'] = total - conservados
+    return salida
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Intervalos de confianza bootstrap - Baremos 2025
+Calcula intervalos de confianza (método percentil) para la media, mediana,
+desviación estándar y el porcentaje de candidatos de cada rango de
+puntuación de todas las especialidades del almacén columnar.
+
+El remuestreo es vectorizado: cada tarea genera una matriz de índices
+[remuestras, n] y calcula todos los estadísticos por filas. El tamaño del
+bloque se fija por el pico de memoria de la tarea, no solo por la matriz de
+índices: MEMORIA_BLOQUE / (n × BYTES_POR_ELEMENTO). Las tareas se reparten en un pool de procesos; cada
+una tiene su propia semilla derivada con np.random.SeedSequence de
+(semilla, especialidad, bloque), así que el resultado es reproducible sea
+cual sea el número de procesos.
+
+Uso:
+    python src/bootstrap.py [--remuestras 10000] [--procesos 8] [--semilla 2025] [--nivel 0.95]
+
+Autor: @joanh
+"""
+
+import os
+import json
+import time
+import argparse
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from baremo_comun import RAIZ
+from almacen import cargar_almacen
+from puntuacion import ESCALA
+from estadisticas import LIMITES_RANGOS
+
+RESULTADO_PATH = RAIZ / "output" / "bootstrap_2025.json"
+MEMORIA_BLOQUE = 64 * 1024 * 1024   # bytes de pico por tarea
+# Pico por elemento de la matriz [b, n]: muestras int32 (4) + temporal float64
+# de la desviación (8); los índices int32 se liberan antes y los conteos por
+# rango solo usan máscaras bool (1)
+BYTES_POR_ELEMENTO = 12
+ESTADISTICOS = ('media', 'mediana', 'desviacion') + tuple(
+    f"rango_{a}-{b}" for a, b in zip(LIMITES_RANGOS, LIMITES_RANGOS[1:]))
+
+
+def estadisticos(muestras):
+    """
+    Estadísticos por fila de una matriz de muestras [b, n] (diezmilésimas).
+    Devuelve [b, len(ESTADISTICOS)].
+    """
+    b, n = muestras.shape
+    resultado = np.empty((b, len(ESTADISTICOS)))
+    resultado[:, 0] = muestras.mean(axis=1) / ESCALA
+    resultado[:, 1] = np.median(muestras, axis=1) / ESCALA
+    resultado[:, 2] = muestras.std(axis=1) / ESCALA
+    # Candidatos por debajo de cada límite interior (2, 4, 6, 8): sus diferencias son los rangos
+    menores = [np.count_nonzero(muestras < limite * ESCALA, axis=1) for limite in LIMITES_RANGOS[1:-1]]
+    acumulados = np.column_stack([np.zeros(b, dtype=np.int64)] + menores + [np.full(b, n)])
+    resultado[:, 3:] = np.diff(acumulados, axis=1) / n * 100
+    return resultado
+
+
+def tarea_bootstrap(puntuaciones, remuestras, semilla):
+    """Trabajo de cada proceso: 'remuestras' filas de estadísticos con su propia semilla"""
+    rng = np.random.default_rng(semilla)
+    n = puntuaciones.size
+    indices = rng.integers(0, n, size=(remuestras, n), dtype=np.int32)
+    muestras = puntuaciones[indices]
+    del indices
+    return estadisticos(muestras)
+
+
+def planificar(almacen, remuestras, semilla):
+    """Tareas (codigo, bloque, puntuaciones, tamaño, semilla) con memoria acotada"""
+    tareas = []
+    for i, codigo in enumerate(almacen.codigos):
+        puntuaciones = np.asarray(almacen.puntuacion[almacen.tramo(codigo)])
+        por_bloque = max(1, MEMORIA_BLOQUE // (puntuaciones.size * BYTES_POR_ELEMENTO))
+        for j, inicio in enumerate(range(0, remuestras, por_bloque)):
+            semilla_bloque = np.random.SeedSequence(semilla, spawn_key=(i, j))
+            tareas.append((codigo, j, puntuaciones, min(por_bloque, remuestras - inicio), semilla_bloque))
+    return tareas
+
+
+def bootstrap(almacen=None, remuestras=10000, procesos=None, semilla=2025, nivel=0.95):
+    """{codigo: {estadistico: {'estimacion', 'ic_inferior', 'ic_superior'}}}"""
+    almacen = almacen or cargar_almacen()
+    tareas = planificar(almacen, remuestras, semilla)
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1:
+        bloques = [tarea_bootstrap(p, b, s) for _, _, p, b, s in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            bloques = list(pool.map(tarea_bootstrap, *zip(*((p, b, s) for _, _, p, b, s in tareas))))
+
+    alfa = (1 - nivel) / 2 * 100
+    resultados = {}
+    for codigo in almacen.codigos:
+        puntuaciones = np.asarray(almacen.puntuacion[almacen.tramo(codigo)])
+        replicas = np.concatenate([bloque for (c, *_), bloque in zip(tareas, bloques) if c == codigo])
+        estimacion = estadisticos(puntuaciones[None, :])[0]
+        inferior, superior = np.percentile(replicas, [alfa, 100 - alfa], axis=0)
+        resultados[codigo] = {
+            nombre: {
+                'estimacion': round(float(estimacion[k]), 4),
+                'ic_inferior': round(float(inferior[k]), 4),
+                'ic_superior': round(float(superior[k]), 4),
+            }
+            for k, nombre in enumerate(ESTADISTICOS)
+        }
+    return resultados
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Intervalos de confianza bootstrap por especialidad")
+    parser.add_argument('--remuestras', type=int, default=10000, help="Remuestras por especialidad")
+    parser.add_argument('--procesos', type=int, default=None, help="Número de procesos (por defecto: CPUs)")
+    parser.add_argument('--semilla', type=int, default=2025, help="Semilla (resultados reproducibles)")
+    parser.add_argument('--nivel', type=float, default=0.95, help="Nivel de confianza")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    resultados = bootstrap(remuestras=args.remuestras, procesos=args.procesos,
+                           semilla=args.semilla, nivel=args.nivel)
+    duracion = time.perf_counter() - inicio
+
+    for codigo, est in resultados.items():
+        print(f"📊 {codigo}: " + " | ".join(
+            f"{nombre} {est[nombre]['estimacion']:.2f} [{est[nombre]['ic_inferior']:.2f}, {est[nombre]['ic_superior']:.2f}]"
+            for nombre in ('media', 'mediana', 'desviacion')))
+
+    RESULTADO_PATH.parent.mkdir(exist_ok=True)
+    with open(RESULTADO_PATH, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generado': date.today().isoformat(),
+            'remuestras': args.remuestras,
+            'semilla': args.semilla,
+            'nivel': args.nivel,
+            'especialidades': resultados,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"⏱️ {args.remuestras} remuestras × {len(resultados)} especialidades en {duracion:.1f}s")
+    print(f"💾 {RESULTADO_PATH.relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Caché persistente de páginas del PDF - Baremos 2025
+Guarda en disco el texto, los caracteres y las tablas extraídos de cada página, con
+clave SHA-256 del PDF + índice de página + ajustes de extracción, para
+no repetir el análisis de pdfplumber/pdfminer en cada iteración de los
+extractores o de los análisis forenses.
+
+El tamaño total está acotado: al superarse se eliminan las entradas usadas
+hace más tiempo (LRU por fecha de modificación, que se renueva en cada
+acierto).
+
+Uso:
+    paginas = PaginasPDF("data/rh03_257_2025_590_12_baremo_prov.pdf")
+    texto = paginas.texto(2648)        # índice 0-based
+    chars = paginas.chars(2648)
+    tablas = paginas.tablas(2648)
+
+    python src/cache_paginas.py          # resumen de la caché
+    python src/cache_paginas.py --vaciar
+
+Autor: @joanh
+"""
+
+import os
+import sys
+import json
+import pickle
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+
+from baremo_comun import RAIZ
+
+CACHE_DIR = RAIZ / ".cache" / "paginas"
+TAM_MAXIMO = 512 * 1024 * 1024  # 512 MB
+ENTRADAS_MEMORIA = 256
+
+# Claves de page.chars que se conservan (las demás no son serializables o no se usan)
+CLAVES_CHAR = ('text', 'x0', 'x1', 'top', 'bottom', 'y0', 'y1', 'fontname', 'size')
+
+_huellas = {}
+
+
+def hash_pdf(pdf_path):
+    """SHA-256 del contenido del PDF (memorizado por ruta, tamaño y fecha)"""
+    ruta = Path(pdf_path).resolve()
+    info = ruta.stat()
+    clave = (str(ruta), info.st_size, info.st_mtime_ns)
+    if clave not in _huellas:
+        sha = hashlib.sha256()
+        with open(ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(bloque)
+        _huellas[clave] = sha.hexdigest()
+    return _huellas[clave]
+
+
+class CachePaginas:
+    """Almacén clave → objeto en disco con expulsión LRU acotada por tamaño"""
+
+    def __init__(self, directorio=CACHE_DIR, tam_maximo=TAM_MAXIMO):
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self.tam_maximo = tam_maximo
+        self.memoria = OrderedDict()
+        self.tam_actual = sum(f.stat().st_size for f in self.directorio.glob("*.pkl"))
+
+    @staticmethod
+    def clave(huella_pdf, indice, tipo, ajustes=None):
+        """Clave de una entrada: PDF + página + tipo (texto/chars) + ajustes"""
+        ajustes_json = json.dumps(ajustes or {}, sort_keys=True)
+        return hashlib.sha256(f"{huella_pdf}:{indice}:{tipo}:{ajustes_json}".encode()).hexdigest()
+
+    def _ruta(self, clave):
+        return self.directorio / f"{clave}.pkl"
+
+    def _recordar(self, clave, valor):
+        self.memoria[clave] = valor
+        self.memoria.move_to_end(clave)
+        while len(self.memoria) > ENTRADAS_MEMORIA:
+            self.memoria.popitem(last=False)
+
+    def obtener(self, clave, calcular):
+        """Devuelve la entrada; si no existe la calcula con calcular() y la guarda"""
+        if clave in self.memoria:
+            self.memoria.move_to_end(clave)
+            return self.memoria[clave]
+
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, 'rb') as f:
+                valor = pickle.load(f)
+            os.utime(ruta)  # renovar posición LRU
+        except (OSError, pickle.UnpicklingError, EOFError):
+            valor = calcular()
+            self.guardar(clave, valor)
+
+        self._recordar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        """Escribe la entrada de forma atómica y aplica el límite de tamaño"""
+        ruta = self._ruta(clave)
+        temporal = ruta.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporal, 'wb') as f:
+            pickle.dump(valor, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            anterior = ruta.stat().st_size  # al sobrescribir, descontar la entrada previa
+        except OSError:
+            anterior = 0
+        os.replace(temporal, ruta)
+        self.tam_actual += ruta.stat().st_size - anterior
+        if self.tam_actual > self.tam_maximo:
+            self.expulsar()
+
+    def expulsar(self):
+        """Elimina las entradas menos usadas hasta quedar al 90% del máximo"""
+        entradas = []
+        for ruta in self.directorio.glob("*.pkl"):
+            try:
+                info = ruta.stat()
+            except OSError:
+                continue
+            entradas.append((info.st_mtime, info.st_size, ruta))
+        entradas.sort()
+
+        self.tam_actual = sum(tam for _, tam, _ in entradas)
+        objetivo = self.tam_maximo * 0.9
+        for _, tam, ruta in entradas:
+            if self.tam_actual <= objetivo:
+                break
+            ruta.unlink(missing_ok=True)
+            self.memoria.pop(ruta.stem, None)
+            self.tam_actual -= tam
+
+    def vaciar(self):
+        """Elimina todas las entradas"""
+        for ruta in self.directorio.glob("*.pkl"):
+            ruta.unlink(missing_ok=True)
+        self.memoria.clear()
+        self.tam_actual = 0
+
+
+class PaginasPDF:
+    """
+    Acceso a texto, caracteres y tablas por página con caché persistente.
+    El PDF solo se abre con pdfplumber cuando hay un fallo de caché.
+    """
+
+    def __init__(self, pdf_path, cache=None):
+        self.pdf_path = Path(pdf_path)
+        self.huella = hash_pdf(self.pdf_path)
+        self.cache = cache or CachePaginas()
+        self._pdf = None
+
+    def _abrir(self):
+        if self._pdf is None:
+            import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    def _pagina(self, indice):
+        return self._abrir().pages[indice]
+
+    def num_paginas(self):
+        """Número de páginas del PDF"""
+        clave = CachePaginas.clave(self.huella, -1, 'num_paginas')
+        return self.cache.obtener(clave, lambda: len(self._abrir().pages))
+
+    def texto(self, indice, **ajustes):
+        """Texto de la página (índice 0-based); ajustes se pasan a extract_text"""
+        clave = CachePaginas.clave(self.huella, indice, 'texto', ajustes)
+        return self.cache.obtener(clave, lambda: self._pagina(indice).extract_text(**ajustes))
+
+    def chars(self, indice):
+        """Caracteres de la página con sus coordenadas (claves de CLAVES_CHAR)"""
+        clave = CachePaginas.clave(self.huella, indice, 'chars')
+        return self.cache.obtener(clave, lambda: [
+            {k: c.get(k) for k in CLAVES_CHAR} for c in self._pagina(indice).chars
+        ])
+
+    def tablas(self, indice, **ajustes):
+        """Tablas de la página (listas de filas); ajustes se pasan a extract_tables"""
+        clave = CachePaginas.clave(self.huella, indice, 'tablas', ajustes)
+        return self.cache.obtener(clave, lambda: self._pagina(indice).extract_tables(ajustes or None))
+
+    def cerrar(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def main():
+    """Resumen o vaciado de la caché"""
+    cache = CachePaginas()
+    if '--vaciar' in sys.argv:
+        cache.vaciar()
+        print(f"🗑️ Caché vaciada: {cache.directorio}")
+        return
+
+    entradas = len(list(cache.directorio.glob("*.pkl")))
+    print(f"📦 Caché de páginas: {cache.directorio}")
+    print(f"   Entradas: {entradas}")
+    print(f"   Tamaño: {cache.tam_actual / 1024 / 1024:.1f} MB de {cache.tam_maximo / 1024 / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+API de candidatos en streaming - Baremos 2025
+iter_candidatos(especialidad) produce registros Candidato a medida que se
+analizan las páginas, sin construir listas completas en memoria. Los
+escritores (guardar_salidas), las estadísticas y los validadores pueden
+consumirlo de forma incremental; la memoria se mantiene constante sea cual
+sea el tamaño de la especialidad y los primeros resultados llegan antes de
+analizar la última página.
+
+Uso:
+    for c in iter_candidatos('006'):
+        print(c.orden, c.pagina, formatear(c.puntuacion))
+
+    python src/candidatos.py 006 [--pdf ruta]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+
+from baremo_comun import (Candidato, cargar_especialidades, buscar_especialidad,
+                          lineas_candidato, guardar_salidas)
+from cache_paginas import PaginasPDF
+from dividir_pdf import ruta_pdf_especialidad
+from puntuacion import a_fijo, formatear
+from estadisticas_online import AcumuladorEstadisticas
+
+
+def resolver_especialidad(especialidad, config=None):
+    """Acepta código ('006'), clave ('MATEMATICAS') o la propia entrada de configuración"""
+    if isinstance(especialidad, dict):
+        return especialidad
+    config = config or cargar_especialidades()
+    esp = config['especialidades'].get(str(especialidad).upper()) or buscar_especialidad(config, especialidad)
+    if esp is None:
+        raise KeyError(f"Especialidad {especialidad} no encontrada en config/especialidades.yaml")
+    return esp
+
+
+def iter_paginas(pdf_path, paginas):
+    """Produce (pagina, [(linea, puntuacion)]) página a página (1-based)"""
+    with PaginasPDF(pdf_path) as pdf:
+        total_paginas = pdf.num_paginas()
+        for num_pagina in paginas:
+            if num_pagina > total_paginas:
+                print(f"⚠️ Página {num_pagina} fuera del PDF ({total_paginas} páginas)")
+                return
+            yield num_pagina, lineas_candidato(pdf.texto(num_pagina - 1))
+
+
+def iter_candidatos(especialidad, pdf_path=None):
+    """
+    Produce los Candidato de una especialidad en orden del PDF.
+    Sin pdf_path se usa el sub-PDF de la especialidad (dividir_pdf.py) si
+    existe; la página de cada Candidato siempre es la del PDF completo.
+    """
+    config = cargar_especialidades()
+    esp = resolver_especialidad(especialidad, config)
+    pdf_path, primera_pagina = (pdf_path, 1) if pdf_path else ruta_pdf_especialidad(esp)
+    desplazamiento = primera_pagina - 1
+
+    orden = 0
+    paginas = range(esp['pagina_inicio'] - desplazamiento, esp['pagina_fin'] - desplazamiento + 1)
+    for num_pagina, lineas in iter_paginas(pdf_path, paginas):
+        for linea, puntuacion in lineas:
+            orden += 1
+            yield Candidato(orden, num_pagina + desplazamiento, linea, puntuacion)
+
+
+def validar_en_curso(candidatos, esperados_inicio=(), esperados_fin=()):
+    """
+    Validador incremental: deja pasar los candidatos y comprueba al vuelo los
+    primeros contra esperados_inicio y, al terminar, los últimos contra
+    esperados_fin (solo guarda una ventana de len(esperados_fin) valores).
+    La comparación es exacta en diezmilésimas.
+    """
+    esperados_inicio = [a_fijo(v) for v in esperados_inicio]
+    esperados_fin = [a_fijo(v) for v in esperados_fin]
+    ventana = []
+    for c in candidatos:
+        if c.orden <= len(esperados_inicio) and c.puntuacion != esperados_inicio[c.orden - 1]:
+            print(f"⚠️ Candidato {c.orden}: {formatear(c.puntuacion)} "
+                  f"(esperado {formatear(esperados_inicio[c.orden - 1])})")
+        if esperados_fin:
+            ventana = (ventana + [c.puntuacion])[-len(esperados_fin):]
+        yield c
+
+    if esperados_fin:
+        coincidencias = sum(1 for a, b in zip(ventana, esperados_fin) if a == b)
+        print(f"🔍 Validación final: {coincidencias}/{len(esperados_fin)} coincidencias")
+
+
+def mostrar_progreso(candidatos, cada=500):
+    """Deja pasar los candidatos mostrando los primeros y el avance con estadísticas exactas hasta el momento"""
+    estadisticas = AcumuladorEstadisticas()
+    for c in candidatos:
+        estadisticas.actualizar(c.puntuacion)
+        if c.orden <= 3:
+            print(f"   {c.orden:5d}. {formatear(c.puntuacion)} (página {c.pagina})")
+        elif c.orden % cada == 0:
+            print(f"   🔄 Página {c.pagina}: {estadisticas.linea_progreso()}")
+        yield c
+
+
+def main():
+    """Extracción en streaming de una especialidad"""
+    parser = argparse.ArgumentParser(description="Extracción en streaming de una especialidad")
+    parser.add_argument('codigo', help="Código o clave de especialidad (p.ej. 006)")
+    parser.add_argument('--pdf', default=None, help="PDF provisional completo")
+    args = parser.parse_args()
+
+    try:
+        esp = resolver_especialidad(args.codigo)
+    except KeyError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🌊 Extracción en streaming {esp['codigo']} {esp['nombre']}")
+    flujo = iter_candidatos(esp, args.pdf)
+    flujo = validar_en_curso(flujo, esp.get('validacion_inicial', ()), esp.get('validacion_final', ()))
+    salida = guardar_salidas(esp['codigo'], esp['descripcion'], mostrar_progreso(flujo))
+
+    print(f"📊 Total candidatos: {salida['total']}")
+    print(f"✅ Archivos guardados en: {salida['directorio']}")
+
+
+if __name__ == "__main__":
+    main()
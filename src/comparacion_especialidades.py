@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Comparación entre especialidades - Baremos 2025
+Compara por parejas las distribuciones de puntuaciones de todas las
+especialidades a partir de sus histogramas exactos (histograma_exacto.py),
+así que cada pareja cuesta O(100.001 contadores) y no O(n·m):
+
+    - Kolmogorov-Smirnov de dos muestras: D = max |F_a - F_b| y p-valor
+      asintótico con la distribución exacta de una muestra para el tamaño
+      efectivo round(n·m / (n + m)) (como scipy.stats.ks_2samp, method='asymp')
+    - Mann-Whitney U con corrección por empates (aproximación normal con
+      corrección de continuidad, como scipy.stats.mannwhitneyu) y la
+      probabilidad de que un candidato de A supere a uno de B
+    - Distancia de Wasserstein (en puntos): Σ |F_a - F_b| · 0,0001
+
+Las parejas se reparten en un pool de procesos. El resultado es una matriz
+por métrica (output/comparacion_especialidades.npz) y un mapa de calor
+(img/comparacion_especialidades_2025.png).
+
+Uso:
+    python src/comparacion_especialidades.py [--procesos 8] [--metrica wasserstein]
+
+Autor: @joanh
+"""
+
+import os
+import argparse
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy import stats
+
+from baremo_comun import RAIZ
+from almacen import cargar_almacen
+from histograma_exacto import histograma_exacto
+from puntuacion import ESCALA
+
+RESULTADO_PATH = RAIZ / "output" / "comparacion_especialidades.npz"
+IMAGEN_PATH = RAIZ / "img" / "comparacion_especialidades_2025.png"
+METRICAS = ('ks', 'ks_p', 'mannwhitney_u', 'mannwhitney_p', 'prob_superior', 'wasserstein')
+
+
+def comparar_histogramas(ha, hb):
+    """Métricas de A frente a B a partir de sus contadores por diezmilésima"""
+    ha = np.asarray(ha, dtype=np.float64)
+    hb = np.asarray(hb, dtype=np.float64)
+    n, m = ha.sum(), hb.sum()
+    fa, fb = np.cumsum(ha), np.cumsum(hb)      # candidatos con puntuación <= v
+
+    # Kolmogorov-Smirnov
+    d = float(np.max(np.abs(fa / n - fb / m)))
+    efectivo = np.round(n * m / (n + m))
+    ks_p = float(np.clip(stats.kstwo.sf(d, efectivo), 0, 1))
+
+    # Mann-Whitney: U_A = Σ_v h_a[v] · (B < v + ½ · B == v)
+    menores_b = fb - hb
+    u = float(np.dot(ha, menores_b + hb / 2))
+    total = n + m
+    t = ha + hb
+    empates = float(np.dot(t, t * t - 1))
+    sigma = np.sqrt(n * m / 12 * ((total + 1) - empates / (total * (total - 1))))
+    z = (abs(u - n * m / 2) - 0.5) / sigma if sigma else 0.0
+    u_p = float(min(1.0, 2 * stats.norm.sf(z)))
+
+    return {
+        'ks': d,
+        'ks_p': ks_p,
+        'mannwhitney_u': u,
+        'mannwhitney_p': u_p,
+        'prob_superior': float(u / (n * m)),
+        'wasserstein': float(np.sum(np.abs(fa / n - fb / m)) / ESCALA),
+    }
+
+
+def comparar_pareja(codigo_a, codigo_b):
+    """Trabajo de cada proceso: abre los dos histogramas (mmap) y los compara"""
+    return comparar_histogramas(histograma_exacto(codigo_a), histograma_exacto(codigo_b))
+
+
+def matriz_comparacion(codigos=None, procesos=None):
+    """{'codigos': [...], métrica: matriz k×k} para todas las parejas"""
+    codigos = list(codigos or cargar_almacen().codigos)
+    for codigo in codigos:
+        histograma_exacto(codigo)       # crea la caché antes de repartir el trabajo
+    parejas = list(combinations(range(len(codigos)), 2))
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1:
+        resultados = [comparar_pareja(codigos[i], codigos[j]) for i, j in parejas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(comparar_pareja,
+                                       [codigos[i] for i, _ in parejas],
+                                       [codigos[j] for _, j in parejas]))
+
+    k = len(codigos)
+    totales = [int(np.sum(histograma_exacto(c))) for c in codigos]
+    matrices = {'codigos': np.array(codigos)}
+    for metrica in METRICAS:
+        diagonal = {'ks_p': 1.0, 'mannwhitney_p': 1.0, 'prob_superior': 0.5}.get(metrica, 0.0)
+        matrices[metrica] = np.full((k, k), diagonal)
+    for (i, j), r in zip(parejas, resultados):
+        for metrica in METRICAS:
+            matrices[metrica][i, j] = r[metrica]
+        # Simétricas salvo U y P(A > B), que se complementan
+        for metrica in ('ks', 'ks_p', 'mannwhitney_p', 'wasserstein'):
+            matrices[metrica][j, i] = r[metrica]
+        matrices['mannwhitney_u'][j, i] = totales[i] * totales[j] - r['mannwhitney_u']
+        matrices['prob_superior'][j, i] = 1 - r['prob_superior']
+    return matrices
+
+
+def guardar_matriz(matrices, ruta=RESULTADO_PATH):
+    """Guarda todas las matrices en un .npz"""
+    ruta.parent.mkdir(exist_ok=True)
+    np.savez(ruta, **matrices)
+    return ruta
+
+
+def dibujar_mapa_calor(matrices, metrica='wasserstein', ruta=IMAGEN_PATH):
+    """Mapa de calor de una métrica con los valores anotados"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    codigos = [str(c) for c in matrices['codigos']]
+    valores = matrices[metrica]
+    fig, ax = plt.subplots(figsize=(10, 8))
+    imagen = ax.imshow(valores, cmap='viridis')
+    ax.set_xticks(range(len(codigos)), codigos)
+    ax.set_yticks(range(len(codigos)), codigos)
+    for i in range(len(codigos)):
+        for j in range(len(codigos)):
+            ax.text(j, i, f"{valores[i, j]:.2f}", ha='center', va='center', fontsize=8,
+                    color='white' if valores[i, j] < valores.max() / 2 else 'black')
+    fig.colorbar(imagen, ax=ax, label=metrica)
+    ax.set_title(f'Comparación entre especialidades ({metrica}) - Baremos 2025', fontweight='bold')
+    plt.tight_layout()
+    ruta.parent.mkdir(exist_ok=True)
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Comparación por parejas de las especialidades")
+    parser.add_argument('--procesos', type=int, default=None, help="Número de procesos (por defecto: CPUs)")
+    parser.add_argument('--metrica', choices=METRICAS, default='wasserstein', help="Métrica del mapa de calor")
+    args = parser.parse_args()
+
+    matrices = matriz_comparacion(procesos=args.procesos)
+    codigos = list(matrices['codigos'])
+    print(f"📊 {len(codigos)} especialidades, {len(codigos) * (len(codigos) - 1) // 2} parejas")
+    orden = np.dstack(np.unravel_index(np.argsort(-matrices['wasserstein'], axis=None), matrices['wasserstein'].shape))[0]
+    print("🔝 Parejas más distintas (Wasserstein):")
+    for i, j in [(i, j) for i, j in orden if i < j][:5]:
+        print(f"   {codigos[i]} vs {codigos[j]}: W {matrices['wasserstein'][i, j]:.3f} | "
+              f"KS D {matrices['ks'][i, j]:.3f} | P({codigos[i]} > {codigos[j]}) {matrices['prob_superior'][i, j]:.3f}")
+
+    print(f"💾 {guardar_matriz(matrices).relative_to(RAIZ)}")
+    print(f"🖼️ {dibujar_mapa_calor(matrices, args.metrica).relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
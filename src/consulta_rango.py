@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Consulta de puesto y percentil por especialidad - Baremos 2025
+Usa el índice que construir_almacen() guarda junto al almacén columnar: las
+puntuaciones de cada especialidad ordenadas de menor a mayor
+(output/almacen/ordenadas.npy, mismos tramos que meta.json). Cada consulta
+es una búsqueda binaria O(log n):
+
+    rango('006', '6,8333')
+    → {'puesto': 563, 'empatados': 6, 'por_encima': 562, 'por_debajo': 1240,
+       'percentil': 68.92, 'total': 1808}
+
+puesto = candidatos con más puntuación + 1; percentil = % de candidatos con
+puntuación menor o igual. Los números se interpretan como puntos
+(rango('006', 7) = 7,0000); para enteros ya en diezmilésimas hay que pasar
+en_diezmilesimas=True. La variante por lotes (rangos) responde miles de
+consultas con una sola llamada a np.searchsorted.
+
+Uso:
+    python src/consulta_rango.py 006 6,8333 [7,5000 ...]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+from functools import lru_cache
+import numpy as np
+
+from almacen import ALMACEN_DIR, cargar_almacen
+from puntuacion import a_fijo, array, formatear
+
+
+def rangos_ordenadas(ordenadas, consultas):
+    """
+    Núcleo de IndiceRangos.rangos sobre un array ya ordenado de menor a mayor;
+    ordenadas y consultas en diezmilésimas.
+    """
+    consultas = np.asarray(consultas, dtype=np.int64)
+    total = ordenadas.size
+    # Enteros: searchsorted(x, 'right') == searchsorted(x + 1, 'left') → una sola búsqueda
+    posiciones = np.searchsorted(ordenadas, np.concatenate((consultas, consultas + 1)))
+    por_debajo, hasta = posiciones[:consultas.size], posiciones[consultas.size:]
+    por_encima = total - hasta
+    return {
+        'puesto': por_encima + 1,
+        'empatados': hasta - por_debajo,
+        'por_encima': por_encima,
+        'por_debajo': por_debajo,
+        'percentil': np.round(hasta / total * 100, 2) if total else np.zeros(consultas.size),
+        'total': total,
+    }
+
+
+class IndiceRangos:
+    """Puntuaciones ordenadas por especialidad con consultas de puesto"""
+
+    def __init__(self, almacen=None):
+        self.almacen = almacen or cargar_almacen()
+        ruta = ALMACEN_DIR / "ordenadas.npy"
+        if ruta.exists():
+            self.ordenadas = np.load(ruta, mmap_mode='r')
+        else:
+            orden = np.lexsort((self.almacen.puntuacion, self.almacen.especialidad))
+            self.ordenadas = np.asarray(self.almacen.puntuacion)[orden]
+
+    def puntuaciones(self, codigo):
+        """Puntuaciones ordenadas (ascendente) de una especialidad"""
+        if codigo not in self.almacen.codigos:
+            raise KeyError(f"Especialidad {codigo} no está en el almacén")
+        return self.ordenadas[self.almacen.tramo(codigo)]
+
+    def rangos(self, codigo, puntuaciones, en_diezmilesimas=False):
+        """
+        Consulta por lotes. puntuaciones: puntos (números o cadenas) o, con
+        en_diezmilesimas=True, enteros en punto fijo. Devuelve arrays 'puesto',
+        'empatados', 'por_encima', 'por_debajo', 'percentil' y el 'total' de
+        la especialidad.
+        """
+        consultas = array(np.atleast_1d(puntuaciones), en_diezmilesimas)
+        return rangos_ordenadas(self.puntuaciones(codigo), consultas)
+
+    def rango(self, codigo, puntuacion, en_diezmilesimas=False):
+        """Puesto, empates y percentil de una puntuación en su especialidad"""
+        r = self.rangos(codigo, [a_fijo(puntuacion, en_diezmilesimas)], en_diezmilesimas=True)
+        return {clave: (valor if clave == 'total' else valor[0].item()) for clave, valor in r.items()}
+
+
+@lru_cache(maxsize=1)
+def indice_por_defecto():
+    """Índice sobre el almacén de output/almacen (se abre una sola vez)"""
+    return IndiceRangos()
+
+
+def rango(codigo, puntuacion, en_diezmilesimas=False):
+    """rango('006', '6,8333') | rango('006', 7) | rango('006', 68333, en_diezmilesimas=True)"""
+    return indice_por_defecto().rango(codigo, puntuacion, en_diezmilesimas)
+
+
+def rangos(codigo, puntuaciones, en_diezmilesimas=False):
+    """Variante por lotes de rango()"""
+    return indice_por_defecto().rangos(codigo, puntuaciones, en_diezmilesimas)
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Puesto y percentil de puntuaciones en una especialidad")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 006)")
+    parser.add_argument('puntuaciones', nargs='+', help="Puntuaciones (p.ej. 6,8333)")
+    args = parser.parse_args()
+
+    try:
+        consultas = [a_fijo(p) for p in args.puntuaciones]
+        r = rangos(args.codigo, consultas, en_diezmilesimas=True)
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🏅 Especialidad {args.codigo} ({r['total']} candidatos)")
+    for i, valor in enumerate(consultas):
+        empate = f" | {r['empatados'][i]} con la misma nota" if r['empatados'][i] > 1 else ""
+        print(f"   {formatear(valor)}: puesto {r['puesto'][i]} | {r['por_encima'][i]} por encima"
+              f" | percentil {r['percentil'][i]:.2f}{empate}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Formato binario de puntuaciones por especialidad - Baremos 2025
+Sustituye la carga de lista_<especialidad>.py con exec() por un artefacto
+binario que se abre con memoria mapeada:
+
+    output/puntuaciones_<especialidad>.npy   int32, diezmilésimas en orden del PDF
+    output/paginas_<especialidad>.npy        int32, página de cada candidato
+    output/puntuaciones_<especialidad>.json  cabecera (total, escala, páginas, descartadas, sha256)
+
+guardar_salidas() los escribe junto al CSV/TXT/lista. Para las especialidades
+extraídas antes de existir el formato, convertir_lista() lee la lista Python
+(output.origen_lista del config.yaml, o la lista de salida) con
+ast.literal_eval (sin ejecutar código) y, si el CSV tiene columna Pagina,
+las páginas de cada candidato. Los totales fuera de 0-10 no se corrigen: se
+dejan fuera del artefacto y se cuentan en la cabecera ('descartadas').
+
+Uso:
+    from datos import cargar_puntuaciones
+    puntuaciones = cargar_puntuaciones('006')              # memmap int32
+    puntuaciones = cargar_puntuaciones('006', como_float=True)
+
+    python src/datos.py [--convertir] [006 107 ...]
+
+Autor: @joanh
+"""
+
+import ast
+import csv
+import sys
+import json
+import hashlib
+import argparse
+from datetime import date
+import numpy as np
+
+from baremo_comun import ESPECIALIDADES_DIR, nombres_salida
+from puntuacion import ESCALA, MAXIMO, TIPO, array, a_float, formatear
+
+
+def rutas_binario(codigo):
+    """Rutas del artefacto binario: {'puntuaciones', 'paginas', 'cabecera'}"""
+    salida = nombres_salida(codigo)
+    base = salida['directorio'].parent.name
+    return {
+        'puntuaciones': salida['directorio'] / f"puntuaciones_{base}.npy",
+        'paginas': salida['directorio'] / f"paginas_{base}.npy",
+        'cabecera': salida['directorio'] / f"puntuaciones_{base}.json",
+    }
+
+
+def sha256_fichero(ruta):
+    """SHA-256 del contenido de un fichero"""
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+def guardar_binario(codigo, descripcion, puntuaciones, paginas=None, origen=None, descartadas=0):
+    """
+    Escribe el artefacto binario de una especialidad.
+    puntuaciones: enteros en diezmilésimas; paginas: página de cada candidato o None;
+    descartadas: totales del origen que no entran en el artefacto (fuera de 0-10)
+    """
+    rutas = rutas_binario(codigo)
+    puntuaciones = array(puntuaciones, en_diezmilesimas=True)
+    np.save(rutas['puntuaciones'], puntuaciones)
+
+    cabecera = {
+        'codigo': codigo,
+        'descripcion': descripcion,
+        'total': int(puntuaciones.size),
+        'escala': ESCALA,
+        'dtype': np.dtype(TIPO).str,
+        'paginas': None,
+        'origen': origen,
+        'descartadas': descartadas,
+        'generado': date.today().isoformat(),
+        'sha256': sha256_fichero(rutas['puntuaciones']),
+    }
+    if paginas is not None and len(paginas) == puntuaciones.size:
+        paginas = np.asarray(paginas, dtype=np.int32)
+        np.save(rutas['paginas'], paginas)
+        if paginas.size:
+            cabecera['paginas'] = [int(paginas.min()), int(paginas.max())]
+    elif rutas['paginas'].exists():
+        rutas['paginas'].unlink()
+
+    with open(rutas['cabecera'], 'w', encoding='utf-8') as f:
+        json.dump(cabecera, f, ensure_ascii=False, indent=2)
+    return rutas
+
+
+def leer_lista(ruta):
+    """Lista de puntuaciones de un lista_*.py analizando el literal (sin exec)"""
+    arbol = ast.parse(ruta.read_text(encoding='utf-8'), filename=str(ruta))
+    for nodo in arbol.body:
+        if isinstance(nodo, ast.Assign) and isinstance(nodo.value, ast.List):
+            return ast.literal_eval(nodo.value)
+    raise ValueError(f"{ruta.name} no contiene ninguna lista de puntuaciones")
+
+
+def leer_paginas_csv(ruta):
+    """Columna Pagina del CSV de salida (None si no existe)"""
+    if not ruta.exists():
+        return None
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lector = csv.DictReader(f)
+        if 'Pagina' not in (lector.fieldnames or []):
+            return None
+        return [int(fila['Pagina']) for fila in lector]
+
+
+def convertir_lista(codigo, descripcion=None):
+    """
+    Genera el artefacto binario a partir de la lista Python existente. Los
+    totales imposibles (fuera de 0-10; Filosofía llega a 14,6068) se excluyen
+    y se cuentan en la cabecera, sin inventar puntuaciones.
+    """
+    salida = nombres_salida(codigo)
+    lista = salida['directorio'] / salida['origen_lista']
+    if not lista.exists():
+        raise FileNotFoundError(f"No existe {lista.name} para la especialidad {codigo}")
+    puntuaciones = array(leer_lista(lista))     # la lista está en puntos
+    paginas = leer_paginas_csv(salida['directorio'] / salida['csv'])
+    validas = (puntuaciones >= 0) & (puntuaciones <= MAXIMO)
+    descartadas = int(np.count_nonzero(~validas))
+    if descartadas:
+        print(f"⚠️ {codigo}: {descartadas} puntuaciones fuera de 0-10 en {lista.name}, excluidas del artefacto")
+        if paginas is not None and len(paginas) == puntuaciones.size:
+            paginas = np.asarray(paginas)[validas]
+        puntuaciones = puntuaciones[validas]
+    return guardar_binario(codigo, descripcion, puntuaciones, paginas, origen=lista.name,
+                           descartadas=descartadas)
+
+
+def cargar_cabecera(codigo):
+    """Cabecera JSON del artefacto binario"""
+    with open(rutas_binario(codigo)['cabecera'], 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def cargar_puntuaciones(codigo, como_float=False):
+    """
+    Puntuaciones de una especialidad en orden del PDF como memmap int32 de
+    diezmilésimas (sin copia). Con como_float=True devuelve float64 en puntos.
+    No genera artefactos: si falta el binario lanza FileNotFoundError (se
+    crea con guardar_salidas() o con 'python src/datos.py --convertir').
+    """
+    rutas = rutas_binario(codigo)
+    if not rutas['puntuaciones'].exists():
+        raise FileNotFoundError(
+            f"No existe {rutas['puntuaciones'].name}; "
+            f"ejecuta: python src/datos.py --convertir {codigo}")
+    puntuaciones = np.load(rutas['puntuaciones'], mmap_mode='r')
+    return a_float(puntuaciones) if como_float else puntuaciones
+
+
+def cargar_paginas(codigo):
+    """Página de cada candidato (memmap int32) o None si no se conoce"""
+    ruta = rutas_binario(codigo)['paginas']
+    return np.load(ruta, mmap_mode='r') if ruta.exists() else None
+
+
+def codigos_disponibles():
+    """Códigos de las especialidades con carpeta en especialidades/"""
+    return sorted(d.name.rsplit('_', 1)[1] for d in ESPECIALIDADES_DIR.iterdir()
+                  if d.is_dir() and '_' in d.name)
+
+
+def main():
+    """Convierte las listas existentes y muestra un resumen de los artefactos"""
+    parser = argparse.ArgumentParser(description="Artefactos binarios de puntuaciones")
+    parser.add_argument('codigos', nargs='*', help="Códigos de especialidad (por defecto: todas)")
+    parser.add_argument('--convertir', action='store_true', help="Regenerar desde lista_*.py")
+    args = parser.parse_args()
+
+    errores = 0
+    for codigo in args.codigos or codigos_disponibles():
+        try:
+            if args.convertir:
+                convertir_lista(codigo)
+            puntuaciones = cargar_puntuaciones(codigo)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"⚠️ {codigo}: {e}")
+            errores += 1
+            continue
+        cabecera = cargar_cabecera(codigo)
+        paginas = cabecera['paginas']
+        print(f"✅ {codigo}: {cabecera['total']} candidatos | "
+              f"máx {formatear(puntuaciones.max())} | mín {formatear(puntuaciones.min())}"
+              + (f" | páginas {paginas[0]}-{paginas[1]}" if paginas else ""))
+    sys.exit(1 if errores and args.codigos else 0)
+
+
+if __name__ == "__main__":
+    main()
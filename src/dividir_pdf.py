@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Divisor del PDF provisional en sub-PDFs por especialidad - Baremos 2025
+Usa los rangos de páginas (índice detectado o config/especialidades.yaml)
+para escribir una sola vez data/particiones/baremo_<especialidad>_2025.pdf
+por especialidad y registra sus huellas SHA-256 en
+data/particiones/particiones.yaml. El directorio está en .gitignore: los
+sub-PDFs se regeneran desde el PDF completo y no pisan los ficheros
+versionados de data/.
+Los extractores abren así un fichero de 40-280 páginas en lugar de indexar
+un documento de 2.700 páginas.
+
+Si una partición ya existe, su origen no ha cambiado y su huella coincide,
+no se vuelve a escribir; los extractores solo la usan si además viene del
+PDF completo actual (sha256_origen).
+
+Uso:
+    python src/dividir_pdf.py [ruta_pdf] [--forzar]
+
+Autor: @joanh
+"""
+
+import os
+import sys
+import argparse
+import yaml
+from datetime import date
+
+from baremo_comun import DATA_DIR, RAIZ, cargar_especialidades, ruta_pdf_original, directorio_especialidad
+from cache_paginas import hash_pdf
+
+PARTICIONES_DIR = DATA_DIR / "particiones"
+PARTICIONES_PATH = PARTICIONES_DIR / "particiones.yaml"
+
+
+def ruta_particion(codigo):
+    """data/particiones/baremo_<carpeta>_2025.pdf (p.ej. baremo_matematicas_006_2025.pdf)"""
+    return PARTICIONES_DIR / f"baremo_{directorio_especialidad(codigo).name}_2025.pdf"
+
+
+def cargar_particiones():
+    """Registro de particiones o {} si no existe"""
+    if not PARTICIONES_PATH.exists():
+        return {}
+    with open(PARTICIONES_PATH, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
+def particion_valida(registro, codigo, sha_origen=None):
+    """La partición existe, su huella coincide y (si se indica) viene del mismo PDF"""
+    entrada = (registro.get('especialidades') or {}).get(codigo)
+    if not entrada:
+        return False
+    if sha_origen is not None and registro.get('sha256_origen') != sha_origen:
+        return False
+    ruta = PARTICIONES_DIR / entrada['archivo']
+    return ruta.exists() and hash_pdf(ruta) == entrada['sha256']
+
+
+def ruta_pdf_especialidad(esp):
+    """
+    PDF a abrir para una especialidad y número (1-based en el PDF completo)
+    de su primera página: (sub-PDF, pagina_inicio) si hay partición válida y
+    generada a partir del PDF completo actual, (PDF completo, 1) en otro caso.
+    Sin el PDF completo en disco solo se comprueba la huella del sub-PDF.
+    """
+    original = ruta_pdf_original()
+    sha_origen = hash_pdf(original) if original.exists() else None
+    registro = cargar_particiones()
+    if particion_valida(registro, esp['codigo'], sha_origen):
+        entrada = registro['especialidades'][esp['codigo']]
+        if (entrada['pagina_inicio'], entrada['pagina_fin']) == (esp['pagina_inicio'], esp['pagina_fin']):
+            return PARTICIONES_DIR / entrada['archivo'], entrada['pagina_inicio']
+    return original, 1
+
+
+def dividir(pdf_path, especialidades, forzar=False):
+    """Escribe los sub-PDFs que falten o estén desactualizados; devuelve el registro"""
+    import pypdfium2 as pdfium
+
+    sha_origen = hash_pdf(pdf_path)
+    registro = cargar_particiones()
+    nuevas = dict(registro.get('especialidades') or {})
+
+    PARTICIONES_DIR.mkdir(parents=True, exist_ok=True)
+    origen = pdfium.PdfDocument(str(pdf_path))
+    total_paginas = len(origen)
+    try:
+        for esp in sorted(especialidades.values(), key=lambda e: e['codigo']):
+            codigo = esp['codigo']
+            entrada = nuevas.get(codigo, {})
+            mismo_rango = (entrada.get('pagina_inicio'), entrada.get('pagina_fin')) == \
+                (esp['pagina_inicio'], esp['pagina_fin'])
+            if not forzar and mismo_rango and particion_valida(registro, codigo, sha_origen):
+                print(f"✅ {codigo} {esp['nombre']}: partición al día")
+                continue
+
+            fin = min(esp['pagina_fin'], total_paginas)
+            destino = ruta_particion(codigo)
+            nuevo = pdfium.PdfDocument.new()
+            nuevo.import_pages(origen, list(range(esp['pagina_inicio'] - 1, fin)))
+            nuevo.save(str(destino))
+            nuevo.close()
+
+            nuevas[codigo] = {
+                'archivo': destino.name,
+                'pagina_inicio': esp['pagina_inicio'],
+                'pagina_fin': fin,
+                'paginas': fin - esp['pagina_inicio'] + 1,
+                'sha256': hash_pdf(destino),
+            }
+            print(f"💾 {codigo} {esp['nombre']}: {destino.name} "
+                  f"({nuevas[codigo]['paginas']} páginas, {destino.stat().st_size / 1024:.0f} KB)")
+    finally:
+        origen.close()
+
+    registro = {
+        'pdf_origen': os.path.basename(str(pdf_path)),
+        'sha256_origen': sha_origen,
+        'generado': date.today().isoformat(),
+        'especialidades': {codigo: nuevas[codigo] for codigo in sorted(nuevas)},
+    }
+    with open(PARTICIONES_PATH, 'w', encoding='utf-8') as f:
+        f.write("# Generado por src/dividir_pdf.py - no editar a mano\n")
+        yaml.safe_dump(registro, f, allow_unicode=True, sort_keys=False)
+    return registro
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Divide el PDF provisional por especialidad")
+    parser.add_argument('pdf', nargs='?', default=None, help="PDF provisional completo")
+    parser.add_argument('--forzar', action='store_true', help="Reescribir todas las particiones")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    pdf_path = args.pdf or ruta_pdf_original(config)
+    if not os.path.exists(pdf_path):
+        print(f"❌ PDF no encontrado: {pdf_path}")
+        sys.exit(1)
+
+    print("=== DIVISIÓN DEL PDF POR ESPECIALIDAD - BAREMOS 2025 ===")
+    dividir(pdf_path, config['especialidades'], args.forzar)
+    print(f"\n📋 Registro: {PARTICIONES_PATH.relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Núcleo vectorizado de estadísticas - Baremos 2025
+Calcula en una sola pasada ordenada (np.lexsort por especialidad y
+puntuación) las estadísticas de todas las especialidades a la vez:
+total, media, desviación, mínimo/máximo, cuartiles, deciles, candidatos por
+rangos de puntuación y empates ('repetidos' = total - puntuaciones distintas,
+la cifra histórica de "Candidatos con misma nota"; 'candidatos_empatados' =
+candidatos que comparten nota con otro). Trabaja con puntuaciones en diezmilésimas
+(puntuacion.py), así que sumas y empates son exactos.
+
+El resumen se guarda en output/estadisticas_2025.json y todos los
+estadisticas_<especialidad>.txt se generan a partir de él (también los que
+escribe guardar_salidas al extraer).
+
+Uso:
+    python src/estadisticas.py [--escribir]
+
+Autor: @joanh
+"""
+
+import json
+import argparse
+from datetime import date
+import numpy as np
+
+from baremo_comun import RAIZ, cargar_especialidades, nombres_salida
+from puntuacion import ESCALA
+
+RESUMEN_PATH = RAIZ / "output" / "estadisticas_2025.json"
+LIMITES_RANGOS = (0, 2, 4, 6, 8, 10)   # el último rango incluye el 10
+PERCENTILES = (10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90)
+EXTREMOS = 10       # primeros y últimos candidatos (orden del PDF) del fichero de estadísticas
+
+
+def calcular(puntuaciones, categorias=None, num_categorias=None):
+    """
+    Estadísticas de cada categoría (especialidad) en una sola pasada.
+    puntuaciones: diezmilésimas; categorias: índice de especialidad de cada
+    candidato (None = una sola). Devuelve una lista con un dict por categoría
+    (None si no tiene candidatos).
+    """
+    p = np.asarray(puntuaciones, dtype=np.int64)
+    c = np.zeros(p.size, dtype=np.int64) if categorias is None else np.asarray(categorias, dtype=np.int64)
+    k = num_categorias or (int(c.max()) + 1 if c.size else 1)
+
+    orden = np.lexsort((p, c))
+    p, c = p[orden], c[orden]
+
+    n = np.bincount(c, minlength=k)
+    inicio = np.concatenate(([0], np.cumsum(n)[:-1]))
+    fin = inicio + n - 1
+    # Enteros < 2**53: las sumas en float64 son exactas
+    suma = np.bincount(c, weights=p, minlength=k)
+    suma2 = np.bincount(c, weights=p.astype(np.float64) ** 2, minlength=k)
+    con_datos = n > 0
+    media = np.divide(suma, n, out=np.zeros(k), where=con_datos)
+    varianza = np.divide(suma2, n, out=np.zeros(k), where=con_datos) - media ** 2
+    desviacion = np.sqrt(np.maximum(varianza, 0))
+
+    # Percentiles con interpolación lineal (como np.percentile) sobre cada tramo ordenado
+    cuantiles = {}
+    for q in PERCENTILES:
+        pos = q / 100 * np.maximum(n - 1, 0)
+        bajo = np.floor(pos).astype(np.int64)
+        alto = np.ceil(pos).astype(np.int64)
+        v_bajo = p[np.minimum(inicio + bajo, max(p.size - 1, 0))] if p.size else np.zeros(k)
+        v_alto = p[np.minimum(inicio + alto, max(p.size - 1, 0))] if p.size else np.zeros(k)
+        cuantiles[q] = v_bajo + (pos - bajo) * (v_alto - v_bajo)
+
+    # Rangos: [0,2) [2,4) [4,6) [6,8) [8,10]
+    limites = np.array(LIMITES_RANGOS[1:-1]) * ESCALA
+    cubo = np.searchsorted(limites, p, side='right')
+    num_rangos = len(LIMITES_RANGOS) - 1
+    rangos = np.bincount(c * num_rangos + cubo, minlength=k * num_rangos).reshape(k, num_rangos)
+
+    # Empates: tramos de valores iguales dentro de cada especialidad
+    nuevo = np.ones(p.size, dtype=bool)
+    nuevo[1:] = (p[1:] != p[:-1]) | (c[1:] != c[:-1])
+    comienzos = np.flatnonzero(nuevo)
+    longitudes = np.diff(np.append(comienzos, p.size))
+    grupo = c[comienzos]
+    distintos = np.bincount(grupo, minlength=k)
+    repetidos = longitudes > 1
+    empatados = np.bincount(grupo[repetidos], weights=longitudes[repetidos], minlength=k)
+    mayor = np.lexsort((-p[comienzos], -longitudes, grupo))   # por grupo: bloque más grande y más alto
+    primero = np.ones(mayor.size, dtype=bool)
+    primero[1:] = grupo[mayor][1:] != grupo[mayor][:-1]
+    bloque_max, moda = np.zeros(k, dtype=np.int64), np.zeros(k, dtype=np.int64)
+    bloque_max[grupo[mayor[primero]]] = longitudes[mayor[primero]]
+    moda[grupo[mayor[primero]]] = p[comienzos][mayor[primero]]
+
+    resultado = []
+    for i in range(k):
+        if not n[i]:
+            resultado.append(None)
+            continue
+        resultado.append({
+            'total': int(n[i]),
+            'media': round(float(media[i]) / ESCALA, 6),
+            'desviacion': round(float(desviacion[i]) / ESCALA, 6),
+            'minimo': int(p[inicio[i]]) / ESCALA,
+            'maximo': int(p[fin[i]]) / ESCALA,
+            'percentiles': {f"p{q}": round(float(cuantiles[q][i]) / ESCALA, 6) for q in PERCENTILES},
+            'rangos': {f"{a}-{b}": int(rangos[i, j])
+                       for j, (a, b) in enumerate(zip(LIMITES_RANGOS, LIMITES_RANGOS[1:]))},
+            'empates': {
+                'valores_distintos': int(distintos[i]),
+                'repetidos': int(n[i] - distintos[i]),
+                'candidatos_empatados': int(empatados[i]),
+                'bloque_maximo': int(bloque_max[i]),
+                'moda': int(moda[i]) / ESCALA,
+            },
+        })
+    return resultado
+
+
+def extremos(puntuaciones, k=EXTREMOS):
+    """Primeros y últimos k candidatos en orden del PDF: {'primeros': [[puesto, puntos]], 'ultimos': [...]}"""
+    p = np.asarray(puntuaciones)
+    ultimos = range(max(p.size - k, 0), p.size)
+    return {'primeros': [[i + 1, int(p[i]) / ESCALA] for i in range(min(k, p.size))],
+            'ultimos': [[i + 1, int(p[i]) / ESCALA] for i in ultimos]}
+
+
+def resumen_almacen(almacen=None):
+    """Resumen de todas las especialidades del almacén (y el global)"""
+    from almacen import cargar_almacen, SIN_VALOR
+
+    almacen = almacen or cargar_almacen()
+    config = cargar_especialidades()
+    descripciones = {e['codigo']: e['descripcion'] for e in config['especialidades'].values()}
+
+    por_especialidad = calcular(almacen.puntuacion, almacen.especialidad, len(almacen.codigos))
+    especialidades = {}
+    for esp, est in zip(almacen.meta['especialidades'], por_especialidad):
+        if est is None:
+            continue
+        paginas = almacen.pagina[almacen.tramo(esp['codigo'])]
+        paginas = paginas[paginas != SIN_VALOR]
+        est['descripcion'] = descripciones.get(esp['codigo'], esp['nombre'])
+        est['paginas'] = [int(paginas.min()), int(paginas.max())] if paginas.size else None
+        est.update(extremos(almacen.puntuacion[almacen.tramo(esp['codigo'])]))
+        especialidades[esp['codigo']] = est
+
+    return {
+        'generado': date.today().isoformat(),
+        'especialidades': especialidades,
+        'global': calcular(almacen.puntuacion)[0] if len(almacen) else None,
+    }
+
+
+def renderizar(codigo, descripcion, est):
+    """Texto de estadisticas_<especialidad>.txt a partir del resumen de una especialidad"""
+    lineas = [f"=== ESTADÍSTICAS {descripcion.upper()} ({codigo}) - 2025 ===",
+              f"Total candidatos: {est['total']}"]
+    if est['total']:
+        pct = est['percentiles']
+        empates = est['empates']
+        lineas += [
+            f"Puntuación máxima: {est['maximo']:.4f}",
+            f"Puntuación mínima: {est['minimo']:.4f}",
+            f"Puntuación media: {est['media']:.4f}",
+            f"Mediana: {pct['p50']:.4f}",
+            f"Desviación estándar: {est['desviacion']:.4f}",
+        ]
+        if est.get('paginas'):
+            lineas.append(f"Páginas procesadas: {est['paginas'][0]}-{est['paginas'][1]}")
+        lineas += ["", "CUARTILES:",
+                   f"Q1 (25%): {pct['p25']:.4f}",
+                   f"Q2 (50%): {pct['p50']:.4f}",
+                   f"Q3 (75%): {pct['p75']:.4f}",
+                   "", "DECILES:"]
+        lineas += [f"D{q // 10} ({q}%): {pct[f'p{q}']:.4f}" for q in PERCENTILES if q % 10 == 0]
+        lineas += ["", "DISTRIBUCIÓN POR RANGOS:"]
+        lineas += [f"{rango}: {n} candidatos ({n / est['total'] * 100:.1f}%)" for rango, n in est['rangos'].items()]
+        lineas += ["", "EMPATES:",
+                   f"Puntuaciones diferentes: {empates['valores_distintos']}",
+                   f"Candidatos con misma nota: {empates['repetidos']}",
+                   f"Candidatos que comparten nota: {empates['candidatos_empatados']}",
+                   f"Mayor empate: {empates['bloque_maximo']} candidatos con {empates['moda']:.4f}", ""]
+        for titulo, clave in (("PRIMEROS", 'primeros'), ("ÚLTIMOS", 'ultimos')):
+            if est.get(clave):
+                lineas.append(f"=== {titulo} {len(est[clave])} (orden PDF) ===")
+                lineas += [f"{puesto:3d}. {valor:.4f}" for puesto, valor in est[clave]]
+                lineas.append("")
+    lineas.append("Extraído por: @joanh")
+    return '\n'.join(lineas) + '\n'
+
+
+def escribir_estadisticas(codigo, descripcion, est):
+    """Escribe estadisticas_<especialidad>.txt en output/ de la especialidad"""
+    salida = nombres_salida(codigo)
+    ruta = salida['directorio'] / salida['estadisticas']
+    ruta.write_text(renderizar(codigo, descripcion, est), encoding='utf-8')
+    return ruta
+
+
+def guardar_resumen(resumen, ruta=RESUMEN_PATH):
+    """Guarda el resumen en JSON"""
+    ruta.parent.mkdir(exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(resumen, f, ensure_ascii=False, indent=2)
+    return ruta
+
+
+def main():
+    """Resumen de todas las especialidades y (opcionalmente) sus ficheros de estadísticas"""
+    parser = argparse.ArgumentParser(description="Estadísticas de todas las especialidades")
+    parser.add_argument('--escribir', action='store_true', help="Regenerar los estadisticas_*.txt")
+    args = parser.parse_args()
+
+    resumen = resumen_almacen()
+    ruta = guardar_resumen(resumen)
+    print(f"📊 Resumen de {len(resumen['especialidades'])} especialidades: {ruta.relative_to(RAIZ)}")
+    for codigo, est in resumen['especialidades'].items():
+        print(f"   {codigo}: {est['total']:5d} | media {est['media']:.4f} | mediana {est['percentiles']['p50']:.4f} "
+              f"| σ {est['desviacion']:.4f} | empatados {est['empates']['candidatos_empatados']}")
+        if args.escribir:
+            escribir_estadisticas(codigo, est['descripcion'], est)
+    if resumen['global']:
+        g = resumen['global']
+        print(f"🌐 Global: {g['total']} candidatos | media {g['media']:.4f} | σ {g['desviacion']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
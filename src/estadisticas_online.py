@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Estadísticas en línea y fusionables - Baremos 2025
+AcumuladorEstadisticas se actualiza candidato a candidato (o página a
+página) sin guardar la lista de puntuaciones y se puede fusionar con otros
+acumuladores, p.ej. los de cada bloque de páginas de extraccion_paralela.py:
+
+    - media y varianza de Welford (fusión con la fórmula de Chan)
+    - mínimo y máximo
+    - recuento exacto por diezmilésima (disperso: como mucho 100.001 claves),
+      que sirve de resumen de cuantiles fusionable y exacto
+
+Como las puntuaciones viven en una rejilla fija de 0,0001 puntos, el
+"sketch" de cuantiles no pierde precisión: los cuantiles y la mediana
+coinciden con np.quantile sobre todos los datos.
+
+Uso:
+    acumulador = AcumuladorEstadisticas()
+    acumulador.actualizar_lote(puntuaciones_pagina)     # diezmilésimas
+    total = acumulador_bloque_1 + acumulador_bloque_2
+    print(total.linea_progreso())
+
+Autor: @joanh
+"""
+
+from collections import Counter
+import numpy as np
+
+from puntuacion import ESCALA, a_fijo
+
+
+class AcumuladorEstadisticas:
+    """Estadísticas exactas hasta el momento de un flujo de puntuaciones"""
+
+    def __init__(self, puntuaciones=()):
+        self.n = 0
+        self._media = 0.0       # en diezmilésimas
+        self._m2 = 0.0          # suma de cuadrados de desviaciones (Welford)
+        self.minimo = None
+        self.maximo = None
+        self.conteos = Counter()
+        self.actualizar_lote(puntuaciones)
+
+    def actualizar(self, puntuacion):
+        """Añade una puntuación (entero en diezmilésimas)"""
+        valor = a_fijo(puntuacion, en_diezmilesimas=True)
+        self.n += 1
+        delta = valor - self._media
+        self._media += delta / self.n
+        self._m2 += delta * (valor - self._media)
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+        self.conteos[valor] += 1
+
+    def actualizar_lote(self, puntuaciones):
+        """Añade varias puntuaciones (p.ej. las de una página)"""
+        for puntuacion in puntuaciones:
+            self.actualizar(puntuacion)
+        return self
+
+    def fusionar(self, otro):
+        """Incorpora otro acumulador (de otra página, bloque o proceso)"""
+        if not otro.n:
+            return self
+        if not self.n:
+            self.n, self._media, self._m2 = otro.n, otro._media, otro._m2
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+            self.conteos = Counter(otro.conteos)
+            return self
+        n = self.n + otro.n
+        delta = otro._media - self._media
+        self._media += delta * otro.n / n
+        self._m2 += otro._m2 + delta ** 2 * self.n * otro.n / n
+        self.n = n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self.conteos.update(otro.conteos)
+        return self
+
+    def __add__(self, otro):
+        return AcumuladorEstadisticas().fusionar(self).fusionar(otro)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def media(self):
+        """Media en puntos"""
+        return self._media / ESCALA if self.n else None
+
+    @property
+    def varianza(self):
+        """Varianza poblacional en puntos² (como np.var)"""
+        return self._m2 / self.n / ESCALA ** 2 if self.n else None
+
+    @property
+    def desviacion(self):
+        """Desviación estándar poblacional en puntos (como np.std)"""
+        return self.varianza ** 0.5 if self.n else None
+
+    def cuantil(self, q):
+        """Cuantil(es) exactos en puntos con interpolación lineal (como np.quantile)"""
+        if not self.n:
+            return None
+        valores = np.array(sorted(self.conteos), dtype=np.int64)
+        acum = np.cumsum([self.conteos[v] for v in valores])
+        pos = np.asarray(q, dtype=np.float64) * (self.n - 1)
+        bajo, alto = np.floor(pos).astype(np.int64), np.ceil(pos).astype(np.int64)
+        v_bajo = valores[np.searchsorted(acum, bajo, side='right')]
+        v_alto = valores[np.searchsorted(acum, alto, side='right')]
+        resultado = (v_bajo + (pos - bajo) * (v_alto - v_bajo)) / ESCALA
+        return float(resultado) if resultado.ndim == 0 else resultado
+
+    @property
+    def mediana(self):
+        return self.cuantil(0.5)
+
+    def resumen(self):
+        """Diccionario con las estadísticas hasta el momento"""
+        if not self.n:
+            return {'total': 0}
+        q1, q2, q3 = self.cuantil([0.25, 0.5, 0.75])
+        return {
+            'total': self.n,
+            'media': self.media,
+            'desviacion': self.desviacion,
+            'minimo': self.minimo / ESCALA,
+            'maximo': self.maximo / ESCALA,
+            'q1': float(q1), 'mediana': float(q2), 'q3': float(q3),
+            'valores_distintos': len(self.conteos),
+        }
+
+    def linea_progreso(self):
+        """Texto corto para los mensajes de progreso de los extractores"""
+        if not self.n:
+            return "sin candidatos todavía"
+        return (f"{self.n} candidatos | media {self.media:.4f} | mediana {self.mediana:.4f} "
+                f"| σ {self.desviacion:.4f} | rango {self.minimo / ESCALA:.4f}-{self.maximo / ESCALA:.4f}")
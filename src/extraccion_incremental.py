@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Re-extracción incremental entre PDF provisional y definitivo - Baremos 2025
+Guarda junto a las salidas de cada especialidad un índice de huellas de
+página (SHA-256 del flujo de contenido bruto de cada página) con las líneas
+de candidato ya analizadas. Cuando llega un PDF nuevo:
+
+    1. Se vuelven a detectar los límites de cada especialidad en ese PDF
+       (indice_especialidades.py), salvo que el índice guardado sea del
+       mismo PDF; los rangos de config/ solo valen para el provisional.
+    2. Solo se vuelven a analizar las páginas cuya huella no aparece en el
+       índice (página nueva o modificada); las páginas idénticas, aunque se
+       hayan desplazado, reutilizan sus líneas.
+    3. En las especialidades con cambios, CSV, TXT y lista se conservan hasta
+       el primer registro afectado y solo se reescriben desde él (el número
+       de orden y la página de los siguientes pueden cambiar). Estadísticas
+       y artefacto binario se recalculan enteros (son agregados pequeños).
+
+Uso:
+    python src/extraccion_incremental.py [ruta_pdf] [--especialidades 006 007] [--procesos 4]
+
+Autor: @joanh
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import pdfplumber
+from pdfminer.pdftypes import resolve1
+
+from baremo_comun import (Candidato, cargar_especialidades, cargar_indice, ruta_pdf_original,
+                          nombres_salida, lineas_candidato, guardar_salidas)
+from cache_paginas import PaginasPDF, hash_pdf
+from datos import cargar_cabecera
+from indice_especialidades import generar_indice, guardar_indice
+from puntuacion import a_fijo
+
+
+def huella_pagina(page):
+    """SHA-256 de los flujos de contenido de la página (sin análisis de texto)"""
+    sha = hashlib.sha256()
+    contenidos = page.page_obj.contents or []
+    for flujo in contenidos:
+        flujo = resolve1(flujo)
+        sha.update(flujo.get_data() if hasattr(flujo, 'get_data') else bytes(flujo))
+    return sha.hexdigest()
+
+
+def ruta_huellas(codigo):
+    """output/huellas_<especialidad>.json"""
+    salida = nombres_salida(codigo)
+    return salida['directorio'] / f"huellas_{salida['directorio'].parent.name}.json"
+
+
+def cargar_huellas(codigo):
+    """
+    Índice guardado {huella: [(linea, puntuacion)]} o {} si no existe.
+    Las puntuaciones se normalizan a diezmilésimas (índices antiguos en float).
+    """
+    ruta = ruta_huellas(codigo)
+    if not ruta.exists():
+        return {}, None
+    with open(ruta, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+    # int = diezmilésimas (formato actual); float = puntos (índices antiguos)
+    return {p['huella']: [(linea, a_fijo(valor, en_diezmilesimas=isinstance(valor, int)))
+                          for linea, valor in p['lineas']]
+            for p in datos['paginas']}, datos
+
+
+def guardar_huellas(codigo, pdf_path, paginas):
+    """paginas: [(pagina, huella, [(linea, puntuacion)])]"""
+    datos = {
+        'pdf': os.path.basename(str(pdf_path)),
+        'sha256': hash_pdf(pdf_path),
+        'paginas': [{'pagina': p, 'huella': h, 'lineas': [list(l) for l in lineas]}
+                    for p, h, lineas in paginas],
+    }
+    with open(ruta_huellas(codigo), 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False)
+
+
+def limites_pdf(pdf_path, procesos=1):
+    """
+    Límites {codigo: {'pagina_inicio', 'pagina_fin', 'total_candidatos'}} del
+    PDF: los del índice guardado si es de este PDF; si no, se detectan de nuevo
+    y se guarda el índice.
+    """
+    indice = cargar_indice()
+    if indice and indice.get('sha256') == hash_pdf(pdf_path):
+        return indice['especialidades']
+    limites = generar_indice(pdf_path, procesos)
+    guardar_indice(limites, pdf_path)
+    return limites
+
+
+def registros_conservables(codigo, datos, paginas):
+    """
+    Registros iniciales que no cambian: los de las páginas iniciales con la
+    misma página y huella que en el índice anterior. 0 si las salidas no
+    corresponden a ese índice (p.ej. regeneradas por otro extractor).
+    """
+    if not datos:
+        return 0
+    anteriores = [(p['pagina'], p['huella']) for p in datos['paginas']]
+    try:
+        escritos = cargar_cabecera(codigo)['total']
+    except (FileNotFoundError, KeyError):
+        return 0
+    if escritos != sum(len(p['lineas']) for p in datos['paginas']):
+        return 0
+
+    conservar = 0
+    for (pagina, huella, lineas), anterior in zip(paginas, anteriores):
+        if (pagina, huella) != anterior:
+            break
+        conservar += len(lineas)
+    return conservar
+
+
+def actualizar_especialidad(pdf, paginas_cache, esp):
+    """
+    Reconstruye las páginas de una especialidad reutilizando las ya analizadas.
+    Devuelve (paginas, reanalizadas, cambios, conservar)
+    """
+    anteriores, datos = cargar_huellas(esp['codigo'])
+    orden_anterior = [(p['pagina'], p['huella']) for p in datos['paginas']] if datos else []
+
+    paginas, reanalizadas = [], 0
+    for num_pagina in range(esp['pagina_inicio'], min(esp['pagina_fin'], len(pdf.pages)) + 1):
+        huella = huella_pagina(pdf.pages[num_pagina - 1])
+        if huella in anteriores:
+            lineas = anteriores[huella]
+        else:
+            lineas = lineas_candidato(paginas_cache.texto(num_pagina - 1))
+            reanalizadas += 1
+        paginas.append((num_pagina, huella, lineas))
+
+    cambios = [(p, h) for p, h, _ in paginas] != orden_anterior
+    return paginas, reanalizadas, cambios, registros_conservables(esp['codigo'], datos, paginas)
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Re-extracción incremental por huellas de página")
+    parser.add_argument('pdf', nargs='?', default=None, help="PDF (provisional o definitivo)")
+    parser.add_argument('--especialidades', nargs='*', default=None, help="Códigos a actualizar (por defecto: todas)")
+    parser.add_argument('--procesos', type=int, default=1, help="Procesos para detectar los límites (por defecto: 1)")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    pdf_path = args.pdf or ruta_pdf_original(config)
+    if not os.path.exists(pdf_path):
+        print(f"❌ PDF no encontrado: {pdf_path}")
+        sys.exit(1)
+
+    especialidades = sorted(config['especialidades'].values(), key=lambda e: e['codigo'])
+    if args.especialidades:
+        especialidades = [e for e in especialidades if e['codigo'] in args.especialidades]
+
+    print("=== RE-EXTRACCIÓN INCREMENTAL - BAREMOS 2025 ===")
+    limites = limites_pdf(pdf_path, args.procesos)
+    with pdfplumber.open(pdf_path) as pdf, PaginasPDF(pdf_path) as paginas_cache:
+        for esp in especialidades:
+            if esp['codigo'] not in limites:
+                print(f"❌ {esp['codigo']} {esp['nombre']}: no encontrada en el PDF")
+                continue
+            esp.update(limites[esp['codigo']])
+            paginas, reanalizadas, cambios, conservar = actualizar_especialidad(pdf, paginas_cache, esp)
+            if not cambios:
+                print(f"✅ {esp['codigo']} {esp['nombre']}: sin cambios ({len(paginas)} páginas)")
+                continue
+
+            candidatos = (Candidato(orden, pagina, linea, puntuacion)
+                          for orden, (pagina, linea, puntuacion) in enumerate(
+                              ((p, l, s) for p, _, lineas in paginas for l, s in lineas), 1))
+            salida = guardar_salidas(esp['codigo'], esp['descripcion'], candidatos, conservar)
+            guardar_huellas(esp['codigo'], pdf_path, paginas)
+            print(f"🔄 {esp['codigo']} {esp['nombre']}: {reanalizadas}/{len(paginas)} páginas reanalizadas, "
+                  f"{salida['reescritos']}/{salida['total']} registros reescritos")
+
+    print("\n🎉 ACTUALIZACIÓN COMPLETADA")
+
+
+if __name__ == "__main__":
+    main()
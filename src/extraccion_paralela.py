@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Extracción paralela por páginas - Baremos 2025
+Divide un rango de páginas en bloques contiguos; cada proceso abre su
+propio manejador del PDF y analiza su bloque. El proceso principal fusiona
+los resultados en el orden exacto del PDF, de modo que las columnas
+Orden/Posicion coinciden con las de la extracción secuencial.
+
+Cada bloque devuelve también su AcumuladorEstadisticas, que el proceso
+principal fusiona a medida que terminan para mostrar estadísticas exactas
+hasta el momento.
+
+Uso:
+    python src/extraccion_paralela.py 006 [--procesos 8] [--pdf ruta] [--rapido]
+
+Autor: @joanh
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from baremo_comun import (Candidato, cargar_especialidades, buscar_especialidad,
+                          lineas_candidato, guardar_salidas)
+from cache_paginas import PaginasPDF
+from texto_rapido import PDFRapido
+from dividir_pdf import ruta_pdf_especialidad
+from estadisticas_online import AcumuladorEstadisticas
+
+
+def dividir_en_bloques(paginas, num_bloques):
+    """Divide la lista de páginas en bloques contiguos de tamaño similar"""
+    paginas = list(paginas)
+    num_bloques = max(1, min(num_bloques, len(paginas)))
+    tam, resto = divmod(len(paginas), num_bloques)
+    bloques, inicio = [], 0
+    for i in range(num_bloques):
+        fin = inicio + tam + (1 if i < resto else 0)
+        bloques.append(paginas[inicio:fin])
+        inicio = fin
+    return bloques
+
+
+def abrir_backend(pdf_path, backend='pdfplumber'):
+    """
+    'pdfplumber': texto de extract_text a través de la caché persistente.
+    'rapido': texto reconstruido directamente del flujo de contenido.
+    """
+    if backend == 'rapido':
+        return PDFRapido(pdf_path)
+    return PaginasPDF(pdf_path)
+
+
+def procesar_bloque(pdf_path, paginas, backend='pdfplumber'):
+    """
+    Trabajo de cada proceso: abre su propio PDF y devuelve
+    [(pagina, [(linea, puntuacion)])] para las páginas (1-based) del bloque.
+    """
+    resultado = []
+    with abrir_backend(pdf_path, backend) as pdf:
+        total_paginas = pdf.num_paginas()
+        for num_pagina in paginas:
+            if num_pagina > total_paginas:
+                print(f"⚠️ Página {num_pagina} fuera del PDF ({total_paginas} páginas)")
+                break
+            try:
+                texto = pdf.texto(num_pagina - 1)
+            except Exception as e:
+                print(f"❌ Error en página {num_pagina}: {e}")
+                texto = None
+            resultado.append((num_pagina, lineas_candidato(texto)))
+    return resultado
+
+
+def trabajo_bloque(pdf_path, paginas, backend='pdfplumber'):
+    """procesar_bloque más las estadísticas del bloque, calculadas en el propio proceso"""
+    resultado = procesar_bloque(pdf_path, paginas, backend)
+    acumulador = AcumuladorEstadisticas()
+    for _, lineas in resultado:
+        acumulador.actualizar_lote(puntuacion for _, puntuacion in lineas)
+    return resultado, acumulador
+
+
+def extraer_paginas_paralelo(pdf_path, paginas, procesos=None, bloques_por_proceso=4, backend='pdfplumber',
+                             estadisticas=None):
+    """
+    Extrae las líneas de candidato de las páginas indicadas usando un pool
+    de procesos. Devuelve [(pagina, [(linea, puntuacion)])] en orden del PDF.
+    Si se pasa un AcumuladorEstadisticas, se le fusionan las estadísticas de
+    cada bloque según terminan y se muestra el progreso.
+    """
+    paginas = sorted(paginas)
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        resultado, acumulador = trabajo_bloque(pdf_path, paginas, backend)
+        if estadisticas is not None:
+            estadisticas.fusionar(acumulador)
+        return resultado
+
+    # Varios bloques por proceso para equilibrar páginas lentas
+    bloques = dividir_en_bloques(paginas, procesos * bloques_por_proceso)
+    resultados = [None] * len(bloques)
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {pool.submit(trabajo_bloque, str(pdf_path), bloque, backend): i
+                   for i, bloque in enumerate(bloques)}
+        for terminados, futuro in enumerate(as_completed(futuros), 1):
+            resultados[futuros[futuro]], acumulador = futuro.result()
+            if estadisticas is not None:
+                estadisticas.fusionar(acumulador)
+                print(f"   🔄 Bloque {terminados}/{len(bloques)}: {estadisticas.linea_progreso()}")
+
+    # Fusión determinista: los bloques son contiguos y están indexados
+    return [pagina for bloque in resultados for pagina in bloque]
+
+
+def extraer_especialidad(pdf_path, esp, procesos=None, backend='pdfplumber', primera_pagina=1):
+    """
+    Devuelve los candidatos (Candidato) de una especialidad en orden del PDF.
+    primera_pagina: página del PDF completo que corresponde a la página 1 de
+    pdf_path (distinta de 1 cuando se abre un sub-PDF de dividir_pdf.py).
+    La columna Pagina siempre se refiere al PDF completo.
+    """
+    desplazamiento = primera_pagina - 1
+    paginas = range(esp['pagina_inicio'] - desplazamiento, esp['pagina_fin'] - desplazamiento + 1)
+    candidatos = []
+    estadisticas = AcumuladorEstadisticas()
+    for num_pagina, lineas in extraer_paginas_paralelo(pdf_path, paginas, procesos, backend=backend,
+                                                       estadisticas=estadisticas):
+        for linea, puntuacion in lineas:
+            candidatos.append(Candidato(len(candidatos) + 1, num_pagina + desplazamiento, linea, puntuacion))
+    return candidatos
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Extracción paralela de una especialidad")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 006)")
+    parser.add_argument('--procesos', type=int, default=None, help="Número de procesos (por defecto: CPUs)")
+    parser.add_argument('--pdf', default=None, help="PDF provisional completo")
+    parser.add_argument('--rapido', action='store_true', help="Backend rápido (flujo de contenido)")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    esp = buscar_especialidad(config, args.codigo)
+    if esp is None:
+        print(f"❌ Especialidad {args.codigo} no encontrada en config/especialidades.yaml")
+        sys.exit(1)
+
+    # Sub-PDF de la especialidad si existe (dividir_pdf.py), si no el PDF completo
+    pdf_path, primera_pagina = (args.pdf, 1) if args.pdf else ruta_pdf_especialidad(esp)
+    print(f"⚡ Extracción paralela {esp['codigo']} {esp['nombre']}")
+    print(f"📁 PDF: {os.path.basename(str(pdf_path))}")
+    print(f"📄 Páginas: {esp['pagina_inicio']}-{esp['pagina_fin']} | Procesos: {args.procesos or os.cpu_count()}")
+
+    backend = 'rapido' if args.rapido else 'pdfplumber'
+    candidatos = extraer_especialidad(pdf_path, esp, args.procesos, backend, primera_pagina)
+    if not candidatos:
+        print("❌ No se encontraron candidatos válidos")
+        sys.exit(1)
+
+    print(f"📊 Total candidatos: {len(candidatos)}")
+    salida = guardar_salidas(esp['codigo'], esp['descripcion'], candidatos)
+    print(f"✅ Archivos guardados en: {salida['directorio']}")
+
+
+if __name__ == "__main__":
+    main()
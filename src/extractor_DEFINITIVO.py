@@ -1,6 +1,10 @@
 import pdfplumber
 import re
 
+from puntuacion import ESCALA, MAXIMO, parsear, formatear, a_fijo, es_valida, empates
+
+UMBRAL_ALTO = a_fijo(9)  # 9,0000 en diezmilésimas
+
 print("=== EXTRACTOR DEFINITIVO INFORMÁTICA 331 ===")
 print("Basado en análisis forense del PDF")
 
@@ -30,10 +34,10 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
                         if match:
                             valor_str = match.group(1)
                             try:
-                                valor = float(valor_str.replace(',', '.'))
-                                if 0.0 <= valor <= 10.0:
+                                valor = parsear(valor_str)
+                                if es_valida(valor):
                                     puntuaciones_pagina.append(valor)
-                                    print(f"Página {num_pagina + 1}: {valor:.4f}")
+                                    print(f"Página {num_pagina + 1}: {formatear(valor)}")
                             except:
                                 pass
         
@@ -51,14 +55,16 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
     print("=== EXTRACCIÓN COMPLETADA ===")
     print(f"{'='*50}")
     
-    puntuaciones_unicas = list(set(puntuaciones_total))
-    puntuaciones_unicas.sort(reverse=True)
+    # Diezmilésimas enteras: los empates son exactos y no se descartan candidatos
+    puntuaciones_ordenadas = sorted(puntuaciones_total, reverse=True)
+    repetidas = empates(puntuaciones_total)
     
     print(f"Puntuaciones extraídas: {len(puntuaciones_total)}")
-    print(f"Puntuaciones únicas: {len(puntuaciones_unicas)}")
+    print(f"Puntuaciones distintas: {len(set(puntuaciones_total))}")
+    print(f"Puntuaciones empatadas: {len(repetidas)} valores ({sum(repetidas.values())} candidatos)")
     print(f"Objetivo: 331 candidatos")
     
-    if len(puntuaciones_unicas) >= 300:  # Cercano a 331
+    if len(puntuaciones_ordenadas) >= 300:  # Cercano a 331
         print("✅ EXTRACCIÓN EXITOSA")
         
         # Verificar con muestra conocida
@@ -66,7 +72,8 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
                     1.8000, 6.8500, 8.0000, 5.0000, 7.5833, 7.5000, 6.3750,
                     1.9167, 2.2500, 10.0000, 1.0000, 1.7500, 7.0042, 1.0000]
         
-        encontrados = sum(1 for v in conocidos if v in puntuaciones_unicas)
+        distintas = set(puntuaciones_total)
+        encontrados = sum(1 for v in conocidos if a_fijo(v) in distintas)
         print(f"Verificación: {encontrados}/{len(conocidos)} valores conocidos encontrados")
         
         if encontrados >= 18:  # Al menos 85%
@@ -74,51 +81,51 @@ with pdfplumber.open("rh03_257_2025_590_12_baremo_prov.pdf") as pdf:
             
             # GUARDAR DATOS REALES
             with open('INFORMATICA_107_DATOS_REALES.txt', 'w') as f:
-                for p in puntuaciones_unicas:
-                    f.write(f"{p:.4f}\n")
+                for p in puntuaciones_ordenadas:
+                    f.write(f"{formatear(p)}\n")
             print("💾 Guardado: INFORMATICA_107_DATOS_REALES.txt")
             
             # CSV
             try:
                 import pandas as pd
-                df = pd.DataFrame({'Puntuacion_Total': puntuaciones_unicas})
+                df = pd.DataFrame({'Puntuacion_Total': [formatear(p) for p in puntuaciones_ordenadas]})
                 df.to_csv('INFORMATICA_107_DATOS_REALES.csv', index=False)
                 print("💾 Guardado: INFORMATICA_107_DATOS_REALES.csv")
             except:
                 with open('INFORMATICA_107_DATOS_REALES.csv', 'w') as f:
                     f.write("Puntuacion_Total\n")
-                    for p in puntuaciones_unicas:
-                        f.write(f"{p:.4f}\n")
+                    for p in puntuaciones_ordenadas:
+                        f.write(f"{formatear(p)}\n")
                 print("💾 Guardado: INFORMATICA_107_DATOS_REALES.csv")
             
             # ESTADÍSTICAS FINALES
             print(f"\n=== ESTADÍSTICAS REALES ===")
-            print(f"📊 Total candidatos: {len(puntuaciones_unicas)}")
-            print(f"🏆 Puntuación máxima: {max(puntuaciones_unicas):.4f}")
-            print(f"📉 Puntuación mínima: {min(puntuaciones_unicas):.4f}")
-            print(f"📈 Media: {sum(puntuaciones_unicas)/len(puntuaciones_unicas):.4f}")
+            print(f"📊 Total candidatos: {len(puntuaciones_ordenadas)}")
+            print(f"🏆 Puntuación máxima: {formatear(max(puntuaciones_ordenadas))}")
+            print(f"📉 Puntuación mínima: {formatear(min(puntuaciones_ordenadas))}")
+            print(f"📈 Media: {sum(puntuaciones_ordenadas) / len(puntuaciones_ordenadas) / ESCALA:.4f}")
             
-            altos = [p for p in puntuaciones_unicas if p >= 9.0]
+            altos = [p for p in puntuaciones_ordenadas if p >= UMBRAL_ALTO]
             print(f"🎯 Puntuaciones >= 9.0: {len(altos)}")
             if altos:
-                print(f"    Valores: {sorted(altos, reverse=True)}")
+                print(f"    Valores: {[formatear(p) for p in sorted(altos, reverse=True)]}")
             
-            perfectos = [p for p in puntuaciones_unicas if p == 10.0]
+            perfectos = [p for p in puntuaciones_ordenadas if p == MAXIMO]
             print(f"💯 Puntuaciones perfectas (10.0): {len(perfectos)}")
             
             print(f"\n🏅 TOP 10:")
-            for i, p in enumerate(puntuaciones_unicas[:10]):
-                print(f"{i+1:2d}. {p:.4f}")
+            for i, p in enumerate(puntuaciones_ordenadas[:10]):
+                print(f"{i+1:2d}. {formatear(p)}")
             
             print(f"\n🎉 ¡MISIÓN CUMPLIDA!")
-            print(f"✅ {len(puntuaciones_unicas)} candidatos reales extraídos")
+            print(f"✅ {len(puntuaciones_ordenadas)} candidatos reales extraídos")
             print(f"📁 Archivos generados con datos auténticos del PDF")
             
         else:
             print(f"⚠️ Solo {encontrados} coincidencias - revisar")
     
     else:
-        print(f"❌ Solo {len(puntuaciones_unicas)} candidatos extraídos")
+        print(f"❌ Solo {len(puntuaciones_ordenadas)} candidatos extraídos")
         print("Revisar patrón de extracción")
 
 print("\n🎯 EXTRACTOR BASADO EN ANÁLISIS FORENSE")
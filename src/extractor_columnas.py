@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Extractor por columnas (coordenadas) - Baremos 2025
+Usa las posiciones x de page.chars para asignar cada token de una fila de
+candidato a una banda de columna fija. Las bandas se aprenden una vez por
+especialidad a partir de varias páginas repartidas por todo su rango (una
+columna vacía en una página aparece en otras) y se guardan en
+config/columnas_especialidades.yaml.
+
+Cada candidato produce un registro completo en una sola pasada, sin
+expresiones regulares por línea:
+    DNI enmascarado, nombre, total y cada apartado con su contador
+    (p.ej. '0,3333/4' → valor 3333 diezmilésimas, contador 4)
+
+No se pierde nada en silencio: si dos tokens caen en la misma banda se
+conserva el primero y se cuenta la colisión, y las filas sin total se cuentan
+como descartadas; ambas cosas se informan al final (con --reaprender si las
+bandas guardadas ya no valen).
+
+Uso:
+    python src/extractor_columnas.py 007 [--pdf ruta] [--reaprender]
+
+Autor: @joanh
+"""
+
+import os
+import sys
+import csv
+import argparse
+import yaml
+from bisect import bisect_right
+
+from baremo_comun import (RAIZ, cargar_especialidades, buscar_especialidad,
+                          ruta_pdf_original, nombres_salida)
+from cache_paginas import PaginasPDF
+from puntuacion import parsear, formatear
+
+COLUMNAS_PATH = RAIZ / "config" / "columnas_especialidades.yaml"
+TOLERANCIA_FILA = 2.0     # puntos de diferencia en 'top' dentro de una fila
+SEPARACION_TOKEN = 0.3    # hueco (en tamaños de fuente) que separa dos tokens
+SEPARACION_BANDA = 6.0    # hueco mínimo (puntos) entre centros de columnas distintas
+PAGINAS_APRENDIZAJE = 25  # páginas repartidas por el rango para aprender las bandas
+EJEMPLOS = 5              # incidencias que se muestran de cada tipo
+
+
+def agrupar_filas(chars):
+    """
+    Agrupa los caracteres en filas (por 'top') y cada fila en tokens.
+    Devuelve [[(texto, x0, x1)]] ordenado de arriba a abajo e izquierda a derecha.
+    """
+    filas = []
+    for c in sorted(chars, key=lambda c: (c['top'], c['x0'])):
+        if filas and abs(c['top'] - filas[-1][0]) <= TOLERANCIA_FILA:
+            filas[-1][1].append(c)
+        else:
+            filas.append((c['top'], [c]))
+
+    resultado = []
+    for _, fila in filas:
+        tokens = []
+        actual, x0, x1 = [], None, None
+        for c in sorted(fila, key=lambda c: c['x0']):
+            hueco = c['x0'] - x1 if x1 is not None else 0
+            if c['text'].isspace() or (actual and hueco > SEPARACION_TOKEN * (c['size'] or 1)):
+                if actual:
+                    tokens.append((''.join(actual), x0, x1))
+                actual, x0, x1 = [], None, None
+                if c['text'].isspace():
+                    continue
+            if not actual:
+                x0 = c['x0']
+            actual.append(c['text'])
+            x1 = c['x1']
+        if actual:
+            tokens.append((''.join(actual), x0, x1))
+        resultado.append(tokens)
+    return resultado
+
+
+def es_dni(token):
+    """Máscara de DNI: ****XXXX*"""
+    return len(token) == 9 and token.startswith('****') and token.endswith('*') and token[4:8].isdigit()
+
+
+def es_numero(token):
+    """Valor con 4 decimales, opcionalmente con contador: 4,8333 | 0,3333/4"""
+    valor, _, contador = token.partition('/')
+    entero, coma, decimales = valor.partition(',')
+    return (coma == ',' and entero.isdigit() and len(decimales) == 4 and decimales.isdigit()
+            and (not contador or contador.isdigit()))
+
+
+def filas_candidato(filas):
+    """Filas cuyo primer token es una máscara de DNI"""
+    return [fila for fila in filas if fila and es_dni(fila[0][0])]
+
+
+def aprender_bandas(filas):
+    """
+    Aprende las columnas numéricas agrupando los centros x de los tokens
+    numéricos de las filas de candidato. Devuelve los límites entre bandas
+    (puntos medios entre columnas consecutivas) y el inicio de la primera.
+    """
+    centros = sorted((x0 + x1) / 2 for fila in filas_candidato(filas)
+                     for texto, x0, x1 in fila[1:] if es_numero(texto))
+    if not centros:
+        return None
+
+    grupos = [[centros[0]]]
+    for centro in centros[1:]:
+        if centro - grupos[-1][-1] > SEPARACION_BANDA:
+            grupos.append([centro])
+        else:
+            grupos[-1].append(centro)
+
+    medias = [sum(g) / len(g) for g in grupos]
+    inicio_numeros = min(x0 for fila in filas_candidato(filas)
+                         for texto, x0, _ in fila[1:] if es_numero(texto))
+    return {
+        'inicio_numeros': round(inicio_numeros - 1, 2),
+        'centros': [round(m, 2) for m in medias],
+        'limites': [round((a + b) / 2, 2) for a, b in zip(medias, medias[1:])],
+    }
+
+
+def parsear_valor(token):
+    """'0,3333/4' → (3333, 4) | '4,8333' → (48333, None) en diezmilésimas"""
+    valor, _, contador = token.partition('/')
+    return parsear(valor), (int(contador) if contador else None)
+
+
+def paginas_aprendizaje(inicio, fin, n=PAGINAS_APRENDIZAJE):
+    """Hasta n páginas repartidas uniformemente entre inicio y fin (incluidas)"""
+    total = fin - inicio + 1
+    if total <= n:
+        return list(range(inicio, fin + 1))
+    return sorted({inicio + round(i * (total - 1) / (n - 1)) for i in range(n)})
+
+
+def extraer_registro(fila, bandas):
+    """
+    Convierte una fila de candidato en un registro estructurado. Si dos tokens
+    caen en la misma banda se conserva el primero y la banda se anota en
+    'colisiones'. Devuelve None si la fila no tiene total.
+    """
+    dni = fila[0][0]
+    nombre, valores, colisiones = [], [None] * len(bandas['centros']), []
+    for texto, x0, x1 in fila[1:]:
+        if x1 <= bandas['inicio_numeros'] or not es_numero(texto):
+            nombre.append(texto)
+            continue
+        banda = bisect_right(bandas['limites'], (x0 + x1) / 2)
+        if valores[banda] is not None:
+            colisiones.append(banda)
+            continue
+        valores[banda] = parsear_valor(texto)
+
+    if valores[0] is None:
+        return None
+    return {
+        'dni': dni,
+        'nombre': ' '.join(nombre),
+        'total': valores[0][0],
+        'apartados': valores[1:],
+        'colisiones': colisiones,
+    }
+
+
+def cargar_bandas(codigo):
+    """Bandas guardadas de una especialidad (o None)"""
+    if not COLUMNAS_PATH.exists():
+        return None
+    with open(COLUMNAS_PATH, 'r', encoding='utf-8') as f:
+        return (yaml.safe_load(f) or {}).get(codigo)
+
+
+def guardar_bandas(codigo, bandas):
+    """Añade/actualiza las bandas de una especialidad en config/columnas_especialidades.yaml"""
+    todas = {}
+    if COLUMNAS_PATH.exists():
+        with open(COLUMNAS_PATH, 'r', encoding='utf-8') as f:
+            todas = yaml.safe_load(f) or {}
+    todas[codigo] = bandas
+    with open(COLUMNAS_PATH, 'w', encoding='utf-8') as f:
+        f.write("# Generado por src/extractor_columnas.py - bandas x de columnas por especialidad\n")
+        yaml.safe_dump(todas, f, sort_keys=True)
+
+
+def extraer_columnas(pdf_path, esp, reaprender=False):
+    """
+    Devuelve (registros con 'pagina' en orden del PDF, incidencias) de una
+    especialidad; incidencias = {'colisiones': [(pagina, dni, bandas)],
+    'sin_total': [(pagina, dni)]}
+    """
+    bandas = None if reaprender else cargar_bandas(esp['codigo'])
+    registros = []
+    incidencias = {'colisiones': [], 'sin_total': []}
+
+    with PaginasPDF(pdf_path) as paginas:
+        if bandas is None:
+            muestra = paginas_aprendizaje(esp['pagina_inicio'], esp['pagina_fin'])
+            filas = [fila for num_pagina in muestra for fila in agrupar_filas(paginas.chars(num_pagina - 1))]
+            bandas = aprender_bandas(filas)
+            if bandas is None:
+                return registros, incidencias
+            bandas['paginas_aprendizaje'] = len(muestra)
+            guardar_bandas(esp['codigo'], bandas)
+            print(f"📐 Bandas aprendidas en {len(muestra)} páginas: {len(bandas['centros'])} columnas")
+
+        for num_pagina in range(esp['pagina_inicio'], esp['pagina_fin'] + 1):
+            for fila in filas_candidato(agrupar_filas(paginas.chars(num_pagina - 1))):
+                registro = extraer_registro(fila, bandas)
+                if registro is None:
+                    incidencias['sin_total'].append((num_pagina, fila[0][0]))
+                    continue
+                if registro['colisiones']:
+                    incidencias['colisiones'].append((num_pagina, registro['dni'], registro['colisiones']))
+                registro['pagina'] = num_pagina
+                registros.append(registro)
+    return registros, incidencias
+
+
+def guardar_registros(codigo, registros):
+    """Escribe apartados_<especialidad>.csv con todas las columnas del baremo"""
+    salida = nombres_salida(codigo)
+    num_apartados = max((len(r['apartados']) for r in registros), default=0)
+    ruta = salida['directorio'] / f"apartados_{salida['directorio'].parent.name}.csv"
+
+    cabecera = ['Orden', 'DNI', 'Nombre', 'Puntuacion_Total', 'Pagina']
+    for i in range(1, num_apartados + 1):
+        cabecera += [f'A{i}', f'A{i}_n']
+
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(cabecera)
+        for orden, r in enumerate(registros, 1):
+            fila = [orden, r['dni'], r['nombre'], formatear(r['total']), r['pagina']]
+            for apartado in r['apartados']:
+                valor, contador = apartado if apartado else (None, None)
+                fila += ['' if valor is None else formatear(valor), '' if contador is None else contador]
+            writer.writerow(fila)
+    return ruta
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Extracción por columnas con todos los apartados")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 007)")
+    parser.add_argument('--pdf', default=None, help="PDF provisional completo")
+    parser.add_argument('--reaprender', action='store_true', help="Volver a aprender las bandas de columnas")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    esp = buscar_especialidad(config, args.codigo)
+    if esp is None:
+        print(f"❌ Especialidad {args.codigo} no encontrada en config/especialidades.yaml")
+        sys.exit(1)
+
+    pdf_path = args.pdf or ruta_pdf_original(config)
+    if not os.path.exists(pdf_path):
+        print(f"❌ PDF no encontrado: {pdf_path}")
+        sys.exit(1)
+
+    print(f"📐 Extractor por columnas {esp['codigo']} {esp['nombre']}")
+    registros, incidencias = extraer_columnas(pdf_path, esp, args.reaprender)
+    if incidencias['colisiones']:
+        print(f"⚠️ {len(incidencias['colisiones'])} filas con dos valores en la misma banda "
+              f"(se conserva el primero; prueba --reaprender):")
+        for pagina, dni, bandas in incidencias['colisiones'][:EJEMPLOS]:
+            print(f"   pág. {pagina} {dni}: banda {', '.join('total' if b == 0 else f'A{b}' for b in bandas)}")
+    if incidencias['sin_total']:
+        print(f"⚠️ {len(incidencias['sin_total'])} filas de candidato descartadas por no tener total:")
+        for pagina, dni in incidencias['sin_total'][:EJEMPLOS]:
+            print(f"   pág. {pagina} {dni}")
+    if not registros:
+        print("❌ No se encontraron candidatos válidos")
+        sys.exit(1)
+
+    ruta = guardar_registros(esp['codigo'], registros)
+    print(f"📊 Total candidatos: {len(registros)}")
+    print(f"💾 CSV guardado: {ruta.name}")
+
+
+if __name__ == "__main__":
+    main()
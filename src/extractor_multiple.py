@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Extractor multi-especialidad - Baremos 2025
+Abre el PDF provisional completo UNA sola vez, recorre sus páginas en una
+única pasada y reparte las líneas de candidato de cada página a su
+especialidad según los rangos de config/especialidades.yaml.
+
+Uso:
+    python src/extractor_multiple.py [ruta_pdf] [--procesos N] [--rapido]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+
+from baremo_comun import Candidato, cargar_especialidades, ruta_pdf_original, guardar_salidas
+from extraccion_paralela import extraer_paginas_paralelo
+
+
+def mapa_paginas(especialidades):
+    """Devuelve {numero_pagina (1-based): clave_especialidad}"""
+    mapa = {}
+    for clave, esp in especialidades.items():
+        for num_pagina in range(esp['pagina_inicio'], esp['pagina_fin'] + 1):
+            if num_pagina in mapa:
+                print(f"⚠️ Página {num_pagina} asignada a {mapa[num_pagina]} y {clave}")
+            mapa[num_pagina] = clave
+    return mapa
+
+
+def extraer_todas(pdf_path, especialidades, procesos=1, backend='pdfplumber'):
+    """
+    Recorre el PDF una vez y devuelve {clave: [candidatos]} con los
+    candidatos de cada especialidad en orden del PDF.
+    Con procesos > 1 las páginas se reparten entre varios procesos y se
+    fusionan en el mismo orden que la pasada secuencial.
+    backend='rapido' lee el texto directamente del flujo de contenido.
+    """
+    mapa = mapa_paginas(especialidades)
+    resultados = {clave: [] for clave in especialidades}
+    print(f"📖 {len(mapa)} páginas con especialidad asignada | Procesos: {procesos}")
+
+    for num_pagina, lineas in extraer_paginas_paralelo(pdf_path, sorted(mapa), procesos, backend=backend):
+        clave = mapa[num_pagina]
+        for linea, puntuacion in lineas:
+            orden = len(resultados[clave]) + 1
+            resultados[clave].append(Candidato(orden, num_pagina, linea, puntuacion))
+
+    return resultados
+
+
+def main():
+    """Función principal"""
+    print("=== EXTRACTOR MULTI-ESPECIALIDAD - BAREMOS 2025 ===")
+
+    parser = argparse.ArgumentParser(description="Extracción de todas las especialidades en una pasada")
+    parser.add_argument('pdf', nargs='?', default=None, help="PDF provisional completo")
+    parser.add_argument('--procesos', type=int, default=1, help="Procesos en paralelo (por defecto: 1)")
+    parser.add_argument('--rapido', action='store_true', help="Backend rápido (flujo de contenido)")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    especialidades = config['especialidades']
+    pdf_path = args.pdf or ruta_pdf_original(config)
+
+    try:
+        resultados = extraer_todas(pdf_path, especialidades, args.procesos,
+                                   'rapido' if args.rapido else 'pdfplumber')
+    except Exception as e:
+        print(f"❌ Error abriendo PDF {pdf_path}: {e}")
+        sys.exit(1)
+
+    print(f"\n{'='*60}")
+    print("=== GUARDANDO SALIDAS POR ESPECIALIDAD ===")
+    print(f"{'='*60}")
+
+    total = 0
+    for clave, candidatos in sorted(resultados.items(), key=lambda x: especialidades[x[0]]['codigo']):
+        esp = especialidades[clave]
+        esperados = esp.get('total_candidatos')
+        estado = "✅" if esperados in (None, len(candidatos)) else "⚠️"
+        print(f"{estado} {esp['codigo']} {clave}: {len(candidatos)} candidatos (esperado: {esperados})")
+
+        if not candidatos:
+            continue
+        salida = guardar_salidas(esp['codigo'], esp['descripcion'], candidatos)
+        print(f"   💾 {salida['directorio'].relative_to(salida['directorio'].parents[2])}")
+        total += len(candidatos)
+
+    print(f"\n🎉 EXTRACCIÓN COMPLETADA: {total:,} candidatos en {len(resultados)} especialidades")
+
+
+if __name__ == "__main__":
+    main()
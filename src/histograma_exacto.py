@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Histograma exacto a 0,0001 puntos - Baremos 2025
+Las puntuaciones tienen exactamente 4 decimales entre 0 y 10, así que el
+histograma completo de una especialidad son 100.001 contadores (uno por
+diezmilésima), calculados con np.bincount sobre las puntuaciones en punto
+fijo. Se guarda en .cache/histogramas/ con clave SHA-256 del artefacto
+binario de la especialidad (datos.py) y se abre con memoria mapeada.
+
+A partir de él se obtienen en O(contadores), sin volver a los datos:
+histogramas con cualquier número de intervalos, función de distribución,
+cuantiles, rangos y media. Los bordes se redondean a la diezmilésima, así
+que una puntuación igual a un borde cae siempre en el intervalo que empieza
+en él (np.histogram sobre floats puede fallar por redondeo, p.ej. 1,2 con
+bins=25).
+
+Uso:
+    conteos = histograma_exacto('006')
+    frecuencias, bordes = histograma(conteos, bins=25)
+    cuantil(conteos, [0.25, 0.5, 0.75])
+
+    python src/histograma_exacto.py 006 [--bins 25]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+import numpy as np
+
+from baremo_comun import RAIZ
+from datos import cargar_puntuaciones, cargar_cabecera
+from puntuacion import ESCALA, MAXIMO, histograma as contar
+
+CACHE_DIR = RAIZ / ".cache" / "histogramas"
+
+
+def histograma_exacto(codigo):
+    """Contadores por diezmilésima (int32, longitud 100001) de una especialidad"""
+    puntuaciones = cargar_puntuaciones(codigo)
+    huella = cargar_cabecera(codigo)['sha256']
+    ruta = CACHE_DIR / f"{codigo}_{huella[:16]}.npy"
+    if not ruta.exists():
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_suffix('.tmp.npy')
+        np.save(temporal, contar(puntuaciones).astype(np.int32))
+        temporal.replace(ruta)
+    return np.load(ruta, mmap_mode='r')
+
+
+def acumulado(conteos):
+    """A[j] = candidatos con puntuación < j diezmilésimas (j = 0..100001)"""
+    return np.concatenate(([0], np.cumsum(conteos, dtype=np.int64)))
+
+
+def contar_intervalos(conteos, bordes, cerrar_ultimo=True):
+    """
+    Candidatos en cada [bordes[i], bordes[i+1]) (bordes en puntos); con
+    cerrar_ultimo el último intervalo incluye su extremo, como np.histogram.
+    """
+    a = acumulado(conteos)
+    fijos = np.round(np.asarray(bordes, dtype=np.float64) * ESCALA, 6)
+    inferior = np.clip(np.ceil(fijos[:-1]), 0, MAXIMO + 1).astype(np.int64)
+    superior = np.clip(np.ceil(fijos[1:]), 0, MAXIMO + 1).astype(np.int64)
+    if cerrar_ultimo and superior.size:
+        superior[-1] = np.clip(np.floor(fijos[-1]) + 1, 0, MAXIMO + 1)
+    return a[superior] - a[inferior]
+
+
+def histograma(conteos, bins=25, rango=(0.0, 10.0)):
+    """Como np.histogram(puntuaciones, bins, rango) con bordes exactos → (frecuencias, bordes)"""
+    bordes = np.asarray(bins, dtype=np.float64) if np.ndim(bins) else np.linspace(rango[0], rango[1], bins + 1)
+    return contar_intervalos(conteos, bordes), bordes
+
+
+def cdf(conteos):
+    """Fracción de candidatos con puntuación <= cada diezmilésima"""
+    total = int(np.sum(conteos))
+    return np.cumsum(conteos, dtype=np.int64) / total if total else np.zeros(len(conteos))
+
+
+def cuantil(conteos, q):
+    """Cuantiles (q en 0..1) con interpolación lineal, como np.quantile"""
+    q = np.asarray(q, dtype=np.float64)
+    acum = np.cumsum(conteos, dtype=np.int64)
+    total = int(acum[-1]) if acum.size else 0
+    if not total:
+        raise ValueError("Histograma vacío")
+    pos = q * (total - 1)
+    bajo, alto = np.floor(pos).astype(np.int64), np.ceil(pos).astype(np.int64)
+    # k-ésimo valor ordenado (0-based) = primera diezmilésima con acumulado > k
+    v_bajo = np.searchsorted(acum, bajo, side='right')
+    v_alto = np.searchsorted(acum, alto, side='right')
+    return (v_bajo + (pos - bajo) * (v_alto - v_bajo)) / ESCALA
+
+
+def rangos(conteos, limites=(0, 2, 4, 6, 8, 10)):
+    """{'0-2': n, ...} con el último rango cerrado (incluye el 10)"""
+    n = contar_intervalos(conteos, limites)
+    return {f"{a}-{b}": int(v) for a, b, v in zip(limites, limites[1:], n)}
+
+
+def media(conteos):
+    """Media en puntos a partir del histograma"""
+    total = int(np.sum(conteos))
+    return float(np.dot(np.arange(len(conteos), dtype=np.float64), conteos) / total / ESCALA) if total else 0.0
+
+
+def main():
+    """Resumen derivado del histograma exacto de una especialidad"""
+    parser = argparse.ArgumentParser(description="Histograma exacto a 0,0001 puntos")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 006)")
+    parser.add_argument('--bins', type=int, default=20, help="Intervalos del histograma a mostrar")
+    args = parser.parse_args()
+
+    try:
+        conteos = histograma_exacto(args.codigo)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    total = int(np.sum(conteos))
+    frecuencias, bordes = histograma(conteos, args.bins)
+    q1, q2, q3 = cuantil(conteos, [0.25, 0.5, 0.75])
+    print(f"📊 {args.codigo}: {total} candidatos | media {media(conteos):.4f} | "
+          f"Q1 {q1:.4f} | mediana {q2:.4f} | Q3 {q3:.4f}")
+    escala = max(frecuencias.max(), 1)
+    for a, b, n in zip(bordes, bordes[1:], frecuencias):
+        print(f"   {a:5.2f}-{b:5.2f} {n:5d} {'█' * int(40 * n / escala)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Índice de empates por especialidad - Baremos 2025
+Muchos candidatos comparten puntuación exacta (1,0000, 7,0000, 8,0000,
+10,0000...) y en esos bloques el puesto real lo decide el desempate por
+subapartados. TablaEmpates recoge, con una sola llamada a np.unique
+(return_index, return_counts) sobre las puntuaciones ordenadas de mayor a
+menor, cada puntuación distinta con:
+
+    candidatos   tamaño del bloque
+    primero      primer puesto del bloque (1 = mejor)
+    ultimo       último puesto del bloque
+    paginas      páginas del PDF donde aparecen (y mínima/máxima)
+
+Consultas: bloques más grandes, bloque de una puntuación y empate en el
+corte para N plazas (cuántos del bloque entran y cuántos quedan fuera, con
+la curva de simulador_corte.calcular_curva). Dentro de cada bloque se
+conserva el orden del PDF. Como en puntuacion.a_fijo, los números están en
+puntos salvo con en_diezmilesimas=True.
+
+Uso:
+    indice = IndiceEmpates()
+    indice['006'].mayores_bloques(5)
+    indice['006'].bloque(7)                 # 7,0000 puntos
+    indice['006'].en_corte(150)
+    python src/indice_empates.py 006 [--mayores 10] [--plazas 150]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+from functools import lru_cache
+import numpy as np
+
+from almacen import cargar_almacen, SIN_VALOR
+from puntuacion import ESCALA, a_fijo, array
+from simulador_corte import calcular_curva
+
+
+class TablaEmpates:
+    """Bloques de puntuaciones iguales de una especialidad"""
+
+    def __init__(self, puntuaciones, paginas=None, en_diezmilesimas=False):
+        puntuaciones = array(puntuaciones, en_diezmilesimas).astype(np.int64)
+        paginas = np.full(puntuaciones.size, SIN_VALOR) if paginas is None else np.asarray(paginas, dtype=np.int64)
+
+        # Orden de la clasificación: de mayor a menor, estable (orden del PDF en los empates)
+        orden = np.argsort(-puntuaciones, kind='stable')
+        negadas, primero, conteos = np.unique(-puntuaciones[orden], return_index=True, return_counts=True)
+        self.total = puntuaciones.size
+        self.orden = orden
+        self.valores = -negadas                  # diezmilésimas, de mayor a menor
+        self.candidatos = conteos
+        self.primero = primero + 1
+        self.ultimo = primero + conteos
+        # Páginas de cada bloque: tramos contiguos de self.paginas
+        self.paginas = paginas[orden]
+        self._curva = None
+        conocidas = self.paginas != SIN_VALOR
+        if self.total:
+            self.pagina_min = np.minimum.reduceat(np.where(conocidas, self.paginas, np.iinfo(np.int64).max), primero)
+            self.pagina_max = np.maximum.reduceat(np.where(conocidas, self.paginas, SIN_VALOR), primero)
+            self.pagina_min[self.pagina_max == SIN_VALOR] = SIN_VALOR
+        else:
+            self.pagina_min = self.pagina_max = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return self.valores.size
+
+    @property
+    def empatados(self):
+        """Candidatos que comparten puntuación con algún otro"""
+        return int(self.candidatos[self.candidatos > 1].sum())
+
+    def _bloque(self, i):
+        tramo = slice(self.primero[i] - 1, self.ultimo[i])
+        paginas = np.unique(self.paginas[tramo])
+        return {
+            'puntuacion': int(self.valores[i]) / ESCALA,
+            'candidatos': int(self.candidatos[i]),
+            'primero': int(self.primero[i]),
+            'ultimo': int(self.ultimo[i]),
+            'paginas': paginas[paginas != SIN_VALOR].tolist(),
+            'pagina_min': int(self.pagina_min[i]),
+            'pagina_max': int(self.pagina_max[i]),
+        }
+
+    def mayores_bloques(self, k=10):
+        """Los k bloques con más candidatos (a igualdad, la puntuación más alta primero)"""
+        seleccion = np.lexsort((-self.valores, -self.candidatos))[:k]
+        return [self._bloque(i) for i in seleccion]
+
+    def bloque(self, puntuacion, en_diezmilesimas=False):
+        """Bloque de una puntuación (None si nadie la tiene)"""
+        valor = a_fijo(puntuacion, en_diezmilesimas)
+        i = np.searchsorted(-self.valores, -valor)
+        if i < len(self) and self.valores[i] == valor:
+            return self._bloque(i)
+        return None
+
+    def en_corte(self, plazas):
+        """Bloque que contiene el puesto N, con cuántos entran y cuántos quedan fuera"""
+        if not 1 <= plazas <= self.total:
+            raise ValueError(f"Número de plazas fuera de rango (1-{self.total}): {plazas}")
+        if self._curva is None:
+            self._curva = calcular_curva(self.valores.repeat(self.candidatos)[::-1])
+        corte = int(self._curva['corte'][plazas - 1])
+        bloque = self.bloque(corte, en_diezmilesimas=True)
+        bloque['dentro'] = int(self._curva['dentro'][plazas - 1])
+        bloque['fuera'] = int(self._curva['fuera'][plazas - 1])
+        return bloque
+
+
+class IndiceEmpates:
+    """TablaEmpates de cada especialidad del almacén (se construyen al pedirlas)"""
+
+    def __init__(self, almacen=None):
+        self.almacen = almacen or cargar_almacen()
+        self._tablas = {}
+
+    def __getitem__(self, codigo):
+        if codigo not in self._tablas:
+            if codigo not in self.almacen.codigos:
+                raise KeyError(f"Especialidad {codigo} no está en el almacén")
+            tramo = self.almacen.tramo(codigo)
+            self._tablas[codigo] = TablaEmpates(self.almacen.puntuacion[tramo], self.almacen.pagina[tramo],
+                                                en_diezmilesimas=True)
+        return self._tablas[codigo]
+
+
+@lru_cache(maxsize=1)
+def indice_por_defecto():
+    """Índice sobre el almacén de output/almacen (se abre una sola vez)"""
+    return IndiceEmpates()
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Índice de empates de una especialidad")
+    parser.add_argument('codigo', help="Código de especialidad (p.ej. 006)")
+    parser.add_argument('--mayores', type=int, default=10, help="Número de bloques más grandes a mostrar")
+    parser.add_argument('--plazas', type=int, nargs='*', default=[], help="Empate en el corte para N plazas")
+    args = parser.parse_args()
+
+    try:
+        tabla = indice_por_defecto()[args.codigo]
+        cortes = [tabla.en_corte(n) for n in args.plazas]
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🎯 {args.codigo}: {tabla.total} candidatos | {len(tabla)} puntuaciones distintas | "
+          f"{tabla.empatados} empatados")
+    print(f"🔝 Mayores bloques de empate:")
+    for b in tabla.mayores_bloques(args.mayores):
+        paginas = f"págs. {b['pagina_min']}-{b['pagina_max']}" if b['paginas'] else "sin páginas"
+        print(f"   {b['puntuacion']:.4f}: {b['candidatos']:4d} candidatos "
+              f"(puestos {b['primero']}-{b['ultimo']}, {paginas})")
+    for n, b in zip(args.plazas, cortes):
+        if b['candidatos'] > 1:
+            print(f"✂️ {n} plazas: corte en {b['puntuacion']:.4f}, bloque de {b['candidatos']} "
+                  f"(puestos {b['primero']}-{b['ultimo']}): {b['dentro']} dentro, {b['fuera']} fuera por desempate")
+        else:
+            print(f"✂️ {n} plazas: corte en {b['puntuacion']:.4f}, sin empate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Índice de límites de especialidades - Baremos 2025
+Detecta automáticamente en qué página empieza y termina cada especialidad
+del PDF provisional completo y cuenta los candidatos por página a partir de
+las máscaras de DNI (****XXXX*). Cada página se interpreta una sola vez con
+el backend de flujo de contenido de texto_rapido.py (sin pdfplumber ni
+análisis de maquetación): la cabecera son los fragmentos de la franja
+superior y el recuento sale del texto de esos mismos fragmentos.
+
+El resultado se guarda en config/indice_especialidades.yaml y lo aplica
+cargar_especialidades() sobre los rangos escritos a mano en
+config/especialidades.yaml.
+
+Uso:
+    python src/indice_especialidades.py [ruta_pdf] [--procesos N]
+
+Autor: @joanh
+"""
+
+import re
+import os
+import sys
+import argparse
+import yaml
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+
+from baremo_comun import RAIZ, INDICE_PATH, cargar_especialidades, ruta_pdf_original
+from cache_paginas import hash_pdf
+from extraccion_paralela import dividir_en_bloques
+from texto_rapido import PDFRapido, reconstruir_lineas
+
+ALTO_CABECERA = 90  # puntos desde el borde superior
+PATRON_CABECERA = r'ESPECIALIDAD\s*:?\s*(\d{3})'
+PATRON_DNI = re.compile(r'\*{4}\d{4}\*')
+
+
+def texto_cabecera(fragmentos, altura, alto=ALTO_CABECERA):
+    """Texto de los fragmentos de la franja superior de la página"""
+    return reconstruir_lineas([f for f in fragmentos if altura - f[2] <= alto], altura)
+
+
+def contar_candidatos(fragmentos, altura):
+    """Número de máscaras de DNI de la página"""
+    return len(PATRON_DNI.findall(reconstruir_lineas(fragmentos, altura)))
+
+
+def escanear_bloque(pdf_path, paginas, patron=PATRON_CABECERA, alto=ALTO_CABECERA):
+    """Devuelve [(pagina, codigo_o_None, candidatos)] para las páginas (1-based)"""
+    regex = re.compile(patron, re.IGNORECASE)
+    resultado = []
+    with PDFRapido(pdf_path) as pdf:
+        for num_pagina in paginas:
+            fragmentos, altura = pdf.fragmentos(num_pagina - 1)
+            match = regex.search(texto_cabecera(fragmentos, altura, alto))
+            resultado.append((num_pagina, match.group(1) if match else None,
+                              contar_candidatos(fragmentos, altura)))
+    return resultado
+
+
+def construir_indice(escaneo, codigos_validos):
+    """
+    Agrupa el escaneo por especialidad. Cada cabecera reconocida cambia la
+    especialidad actual; solo las páginas sin cabecera heredan la de la página
+    anterior. Las especialidades que no están en la configuración se saltan
+    (con sus páginas sin cabecera) en lugar de sumarse a la vecina.
+    """
+    indice = {}
+    actual = None
+    for num_pagina, codigo, candidatos in escaneo:
+        if codigo is not None:
+            actual = codigo if codigo in codigos_validos else None
+        if actual is None:
+            continue
+        entrada = indice.setdefault(actual, {'pagina_inicio': num_pagina, 'pagina_fin': num_pagina,
+                                             'total_candidatos': 0})
+        if num_pagina < entrada['pagina_fin']:
+            print(f"⚠️ Especialidad {actual} reaparece en la página {num_pagina}")
+        entrada['pagina_fin'] = num_pagina
+        entrada['total_candidatos'] += candidatos
+    return indice
+
+
+def generar_indice(pdf_path, procesos=1):
+    """Escanea el PDF completo y devuelve el índice {codigo: rango y candidatos}"""
+    config = cargar_especialidades(aplicar_indice=False)
+    patron = config['configuracion'].get('patron_cabecera', PATRON_CABECERA)
+    codigos = {e['codigo'] for e in config['especialidades'].values()}
+
+    with PDFRapido(pdf_path) as pdf:
+        total_paginas = pdf.num_paginas()
+    print(f"📖 Escaneando cabeceras de {total_paginas} páginas...")
+
+    paginas = range(1, total_paginas + 1)
+    if procesos == 1:
+        escaneo = escanear_bloque(pdf_path, paginas, patron)
+    else:
+        bloques = dividir_en_bloques(paginas, procesos * 4)
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = [pool.submit(escanear_bloque, str(pdf_path), b, patron) for b in bloques]
+            escaneo = [fila for futuro in futuros for fila in futuro.result()]
+
+    return construir_indice(escaneo, codigos)
+
+
+def guardar_indice(indice, pdf_path):
+    """Escribe config/indice_especialidades.yaml"""
+    contenido = {
+        'pdf': os.path.basename(str(pdf_path)),
+        'sha256': hash_pdf(pdf_path),
+        'generado': date.today().isoformat(),
+        'especialidades': {codigo: indice[codigo] for codigo in sorted(indice)},
+    }
+    with open(INDICE_PATH, 'w', encoding='utf-8') as f:
+        f.write("# Generado por src/indice_especialidades.py - no editar a mano\n")
+        yaml.safe_dump(contenido, f, allow_unicode=True, sort_keys=False)
+    return INDICE_PATH
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Índice de páginas por especialidad")
+    parser.add_argument('pdf', nargs='?', default=None, help="PDF provisional completo")
+    parser.add_argument('--procesos', type=int, default=1, help="Procesos en paralelo (por defecto: 1)")
+    args = parser.parse_args()
+
+    config = cargar_especialidades(aplicar_indice=False)
+    pdf_path = args.pdf or ruta_pdf_original(config)
+    if not os.path.exists(pdf_path):
+        print(f"❌ PDF no encontrado: {pdf_path}")
+        sys.exit(1)
+
+    print("=== ÍNDICE DE ESPECIALIDADES - BAREMOS 2025 ===")
+    indice = generar_indice(pdf_path, args.procesos)
+
+    # Comparar con los rangos escritos a mano
+    manuales = {e['codigo']: e for e in config['especialidades'].values()}
+    for codigo in sorted(manuales):
+        esp = manuales[codigo]
+        if codigo not in indice:
+            print(f"❌ {codigo} {esp['nombre']}: no encontrada en el PDF")
+            continue
+        detectado = indice[codigo]
+        coincide = (detectado['pagina_inicio'], detectado['pagina_fin'],
+                    detectado['total_candidatos']) == (esp['pagina_inicio'], esp['pagina_fin'],
+                                                       esp.get('total_candidatos'))
+        print(f"{'✅' if coincide else '⚠️'} {codigo} {esp['nombre']}: "
+              f"páginas {detectado['pagina_inicio']}-{detectado['pagina_fin']}, "
+              f"{detectado['total_candidatos']} candidatos "
+              f"(config: {esp['pagina_inicio']}-{esp['pagina_fin']}, {esp.get('total_candidatos')})")
+
+    ruta = guardar_indice(indice, pdf_path)
+    print(f"\n💾 Índice guardado: {ruta.relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Índice SQLite de candidatos - Baremos 2025
+Exportación opcional del almacén columnar (almacen.py) a una base SQLite con
+índices para consultas puntuales:
+
+    (especialidad, puntuacion DESC)  → puesto de una puntuación en su especialidad
+    dni                              → DNI enmascarado (****XXXX*)
+    apellidos                        → apellidos normalizados (sin tildes, mayúsculas)
+
+El DNI, el nombre y la línea completa se toman de las salidas de los
+extractores que los conservan (CSV con Linea_Completa o apartados_*.csv).
+Toda la carga se hace con executemany en una única transacción.
+
+Uso:
+    python src/indice_sqlite.py --construir
+    python src/indice_sqlite.py --rango 011 6,8333
+    python src/indice_sqlite.py --buscar "ABAD ROMERO"
+
+Autor: @joanh
+"""
+
+import re
+import csv
+import sys
+import sqlite3
+import argparse
+import unicodedata
+
+from baremo_comun import RAIZ, nombres_salida
+from almacen import cargar_almacen, SIN_VALOR
+from puntuacion import parsear, formatear
+
+BD_PATH = RAIZ / "output" / "candidatos_2025.sqlite"
+PATRON_LINEA = re.compile(r"^(\*{4}\d{4}\*)\s+(.+?)\s+\d{1,2}[,\.]\d{4}\b")
+
+ESQUEMA = """
+CREATE TABLE especialidades (
+    codigo TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    total INTEGER NOT NULL
+);
+CREATE TABLE candidatos (
+    especialidad TEXT NOT NULL,
+    orden INTEGER NOT NULL,
+    pagina INTEGER,
+    puntuacion INTEGER NOT NULL,   -- diezmilésimas (ver puntuacion.py)
+    dni TEXT,
+    nombre TEXT,
+    apellidos TEXT,                -- normalizados para búsqueda
+    linea TEXT,
+    PRIMARY KEY (especialidad, orden)
+);
+"""
+
+INDICES = """
+CREATE INDEX idx_especialidad_puntuacion ON candidatos (especialidad, puntuacion DESC);
+CREATE INDEX idx_dni ON candidatos (dni);
+CREATE INDEX idx_apellidos ON candidatos (apellidos);
+"""
+
+
+def normalizar(texto):
+    """'Ábad  Romero' → 'ABAD ROMERO' (sin tildes ni signos, espacios simples)"""
+    texto = unicodedata.normalize('NFKD', texto or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c)).upper()
+    return ' '.join(re.sub(r'[^A-Z0-9 ]', ' ', texto).split())
+
+
+def identidades(codigo, total):
+    """
+    [(dni, nombre, linea)] en orden del PDF desde las salidas del extractor, o
+    None si ninguna conserva los datos del candidato para todas las filas.
+    """
+    salida = nombres_salida(codigo)
+    apartados = salida['directorio'] / f"apartados_{salida['directorio'].parent.name}.csv"
+    if apartados.exists():
+        with open(apartados, 'r', encoding='utf-8') as f:
+            filas = [(r['DNI'], r['Nombre'], None) for r in csv.DictReader(f)]
+        if len(filas) == total:
+            return filas
+
+    ruta = salida['directorio'] / salida['csv']
+    if ruta.exists():
+        with open(ruta, 'r', encoding='utf-8') as f:
+            lector = csv.DictReader(f)
+            if 'Linea_Completa' in (lector.fieldnames or []):
+                filas = []
+                for r in lector:
+                    match = PATRON_LINEA.match(r['Linea_Completa'])
+                    filas.append((match.group(1), match.group(2), r['Linea_Completa']) if match
+                                 else (None, None, r['Linea_Completa']))
+                if len(filas) == total:
+                    return filas
+    return None
+
+
+def filas_candidatos(almacen):
+    """Genera las tuplas a insertar especialidad a especialidad"""
+    for esp in almacen.meta['especialidades']:
+        tramo = almacen.tramo(esp['codigo'])
+        orden = almacen.orden[tramo].tolist()
+        pagina = almacen.pagina[tramo].tolist()
+        puntuacion = almacen.puntuacion[tramo].tolist()
+        datos = identidades(esp['codigo'], esp['total']) or [(None, None, None)] * esp['total']
+        for i, (dni, nombre, linea) in enumerate(datos):
+            apellidos = normalizar(nombre.split(',')[0]) if nombre else None
+            yield (esp['codigo'], orden[i], None if pagina[i] == SIN_VALOR else pagina[i],
+                   puntuacion[i], dni, nombre, apellidos, linea)
+
+
+def construir_bd(ruta=BD_PATH, almacen=None):
+    """Crea la base de datos desde cero en una sola transacción"""
+    almacen = almacen or cargar_almacen()
+    if ruta.exists():
+        ruta.unlink()
+
+    conexion = sqlite3.connect(ruta)
+    try:
+        with conexion:
+            conexion.executescript(ESQUEMA)
+            conexion.executemany("INSERT INTO especialidades VALUES (?, ?, ?)",
+                                 [(e['codigo'], e['nombre'], e['total']) for e in almacen.meta['especialidades']])
+            conexion.executemany("INSERT INTO candidatos VALUES (?, ?, ?, ?, ?, ?, ?, ?)", filas_candidatos(almacen))
+            conexion.executescript(INDICES)
+        conexion.execute("ANALYZE")
+    finally:
+        conexion.close()
+    return ruta
+
+
+def conectar(ruta=BD_PATH):
+    """Abre la base de datos (construyéndola si no existe)"""
+    if not ruta.exists():
+        construir_bd(ruta)
+    conexion = sqlite3.connect(ruta)
+    conexion.row_factory = sqlite3.Row
+    return conexion
+
+
+def rango(conexion, codigo, puntuacion):
+    """
+    Puesto que obtiene una puntuación (diezmilésimas) en su especialidad:
+    {'puesto', 'empatados', 'total'} (puesto = candidatos con más puntos + 1)
+    """
+    especialidad = conexion.execute("SELECT total FROM especialidades WHERE codigo = ?", (codigo,)).fetchone()
+    if especialidad is None:
+        raise KeyError(f"Especialidad {codigo} no está en el índice")
+    # Dos recuentos por rango sobre idx_especialidad_puntuacion (sin recorrer la especialidad entera)
+    contar = "SELECT COUNT(*) FROM candidatos WHERE especialidad = ? AND puntuacion {} ?"
+    por_encima = conexion.execute(contar.format('>'), (codigo, puntuacion)).fetchone()[0]
+    empatados = conexion.execute(contar.format('='), (codigo, puntuacion)).fetchone()[0]
+    return {'puesto': por_encima + 1, 'empatados': empatados, 'total': especialidad['total']}
+
+
+def buscar_nombre(conexion, texto, limite=50):
+    """Candidatos cuyos apellidos normalizados empiezan por texto (en todas las especialidades)"""
+    prefijo = normalizar(texto)
+    if not prefijo:
+        return []
+    siguiente = prefijo[:-1] + chr(ord(prefijo[-1]) + 1)
+    return conexion.execute(
+        """SELECT especialidad, orden, pagina, puntuacion, dni, nombre FROM candidatos
+           WHERE apellidos >= ? AND apellidos < ? ORDER BY apellidos, especialidad LIMIT ?""",
+        (prefijo, siguiente, limite)).fetchall()
+
+
+def buscar_dni(conexion, dni):
+    """Candidatos con ese DNI enmascarado (****XXXX*)"""
+    return conexion.execute(
+        "SELECT especialidad, orden, pagina, puntuacion, dni, nombre FROM candidatos WHERE dni = ?",
+        (dni,)).fetchall()
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Índice SQLite de candidatos")
+    parser.add_argument('--construir', action='store_true', help="Reconstruir la base de datos")
+    parser.add_argument('--rango', nargs=2, metavar=('CODIGO', 'PUNTUACION'), help="Puesto de una puntuación")
+    parser.add_argument('--buscar', default=None, help="Apellidos (prefijo) en todas las especialidades")
+    parser.add_argument('--dni', default=None, help="DNI enmascarado (****XXXX*)")
+    args = parser.parse_args()
+
+    if args.construir:
+        ruta = construir_bd()
+        print(f"💾 Índice SQLite: {ruta.relative_to(RAIZ)} ({ruta.stat().st_size / 1024:.0f} KB)")
+
+    conexion = conectar()
+    try:
+        if args.rango:
+            codigo, valor = args.rango
+            try:
+                r = rango(conexion, codigo, parsear(valor))
+            except KeyError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            print(f"🏅 {formatear(parsear(valor))} en {codigo}: puesto {r['puesto']} de {r['total']}"
+                  + (f" ({r['empatados']} empatados)" if r['empatados'] > 1 else ""))
+
+        resultados = []
+        if args.buscar:
+            resultados += buscar_nombre(conexion, args.buscar)
+        if args.dni:
+            resultados += buscar_dni(conexion, args.dni)
+        for r in resultados:
+            print(f"   {r['especialidad']} #{r['orden']:<5} {formatear(r['puntuacion'])} "
+                  f"{r['dni'] or ''} {r['nombre'] or ''} (página {r['pagina'] or '?'})")
+        if (args.buscar or args.dni) and not resultados:
+            print("🔍 Sin resultados")
+    finally:
+        conexion.close()
+
+
+if __name__ == "__main__":
+    main()
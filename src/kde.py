@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Estimación de densidad por núcleos (KDE) con FFT - Baremos 2025
+Las distribuciones de puntuaciones son multimodales (picos en 1, 7, 8 y 10
+puntos), así que la normal ajustada de los visualizadores las representa mal.
+Este módulo parte del histograma exacto por diezmilésima (histograma_exacto.py)
+y lo convoluciona con un núcleo gaussiano mediante FFT: el coste es
+O(G log G) con G = 100.001 celdas, independiente del número de candidatos,
+frente a O(n·m) de scipy.stats.gaussian_kde.
+
+    - Ancho de banda: 'silverman' (por defecto), 'scott' o un valor en puntos
+    - Reflexión en 0 y 10 para que la densidad no se escape de la escala
+    - Caché en .cache/kde/ con clave SHA-256 de los datos y el ancho
+
+Uso:
+    x, y = kde_especialidad('006', puntos=1001)     # y: densidad por punto
+    x, y = kde_puntuaciones(puntuaciones)           # floats o diezmilésimas
+    python src/kde.py [006 ...] [--ancho silverman] [--comparar]
+
+Autor: @joanh
+"""
+
+import sys
+import time
+import hashlib
+import argparse
+import numpy as np
+from scipy.signal import fftconvolve
+
+from baremo_comun import RAIZ
+from datos import cargar_cabecera
+from histograma_exacto import histograma_exacto, cuantil
+from puntuacion import ESCALA, MAXIMO, histograma as contar
+
+CACHE_DIR = RAIZ / ".cache" / "kde"
+PASO = 1 / ESCALA
+ANCHURA_NUCLEO = 4      # el núcleo se corta a ±4 anchos de banda
+REJILLA = np.arange(MAXIMO + 1) / ESCALA
+
+
+def ancho_banda(conteos, metodo='silverman'):
+    """Ancho de banda en puntos a partir del histograma exacto"""
+    if not isinstance(metodo, str):
+        return float(metodo)
+    conteos = np.asarray(conteos, dtype=np.float64)
+    n = conteos.sum()
+    media = np.dot(REJILLA, conteos) / n
+    sigma = np.sqrt(max(np.dot((REJILLA - media) ** 2, conteos) / (n - 1), 0)) if n > 1 else 0.0
+    if metodo == 'scott':
+        ancho = 1.06 * sigma * n ** (-1 / 5)
+    elif metodo == 'silverman':
+        q1, q3 = cuantil(conteos, [0.25, 0.75])
+        dispersion = min(sigma, (q3 - q1) / 1.34) or sigma
+        ancho = 0.9 * dispersion * n ** (-1 / 5)
+    else:
+        raise ValueError(f"Método de ancho de banda desconocido: {metodo}")
+    return max(ancho, PASO)
+
+
+def densidad(conteos, ancho, reflejar=True):
+    """
+    Densidad (por punto) en cada diezmilésima de 0 a 10 por convolución FFT
+    del histograma exacto con un núcleo gaussiano de 'ancho' puntos.
+    """
+    conteos = np.asarray(conteos, dtype=np.float64)
+    n = conteos.sum()
+    mitad = min(int(np.ceil(ANCHURA_NUCLEO * ancho / PASO)), MAXIMO)
+    desplazamientos = np.arange(-mitad, mitad + 1) * PASO
+    nucleo = np.exp(-0.5 * (desplazamientos / ancho) ** 2) / (ancho * np.sqrt(2 * np.pi))
+    completa = fftconvolve(conteos, nucleo / n)      # posiciones -mitad .. MAXIMO + mitad
+    resultado = completa[mitad:mitad + MAXIMO + 1].copy()
+    if reflejar:
+        # Reflexión en 0 y 10: la masa que saldría de la escala se pliega hacia dentro
+        resultado[1:mitad + 1] += completa[:mitad][::-1]
+        resultado[MAXIMO - mitad:MAXIMO] += completa[MAXIMO + mitad + 1:][::-1]
+    return np.maximum(resultado, 0)     # el redondeo de la FFT puede dar -1e-17
+
+
+def _cache(clave, conteos, ancho, reflejar):
+    """Densidad en la rejilla completa con caché en .cache/kde/"""
+    ancho = ancho_banda(conteos, ancho)
+    ruta = CACHE_DIR / f"{clave[:16]}_{round(ancho * ESCALA)}_{int(reflejar)}.npy"
+    if ruta.exists():
+        return np.load(ruta, mmap_mode='r'), ancho
+    valores = densidad(conteos, ancho, reflejar).astype(np.float32)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_suffix('.tmp.npy')
+    np.save(temporal, valores)
+    temporal.replace(ruta)
+    return valores, ancho
+
+
+def _muestrear(valores, puntos):
+    """(x, y) en 'puntos' posiciones equiespaciadas entre 0 y 10"""
+    if puntos is None:
+        return REJILLA, np.asarray(valores, dtype=np.float64)
+    x = np.linspace(0, 10, puntos)
+    return x, np.interp(x, REJILLA, valores)
+
+
+def kde_especialidad(codigo, ancho='silverman', puntos=1001, reflejar=True):
+    """KDE de una especialidad (histograma exacto cacheado) → (x, densidad)"""
+    conteos = histograma_exacto(codigo)
+    clave = f"{codigo}_{cargar_cabecera(codigo)['sha256']}"
+    valores, _ = _cache(hashlib.sha256(clave.encode()).hexdigest(), conteos, ancho, reflejar)
+    return _muestrear(valores, puntos)
+
+
+def kde_puntuaciones(puntuaciones, ancho='silverman', puntos=1001, reflejar=True):
+    """KDE de una lista de puntuaciones (floats en puntos o diezmilésimas) → (x, densidad)"""
+    p = np.asarray(puntuaciones)
+    fijos = np.round(p * ESCALA).astype(np.int32) if np.issubdtype(p.dtype, np.floating) else p.astype(np.int32)
+    valores, _ = _cache(hashlib.sha256(fijos.tobytes()).hexdigest(), contar(fijos), ancho, reflejar)
+    return _muestrear(valores, puntos)
+
+
+def main():
+    """Función principal"""
+    from almacen import cargar_almacen
+
+    parser = argparse.ArgumentParser(description="KDE por FFT sobre la rejilla de 0,0001 puntos")
+    parser.add_argument('codigos', nargs='*', help="Códigos de especialidad (por defecto: todas)")
+    parser.add_argument('--ancho', default='silverman', help="silverman, scott o ancho en puntos")
+    parser.add_argument('--comparar', action='store_true', help="Comparar con scipy.stats.gaussian_kde")
+    args = parser.parse_args()
+
+    try:
+        ancho = float(args.ancho)
+    except ValueError:
+        ancho = args.ancho
+    codigos = args.codigos or cargar_almacen().codigos
+
+    for codigo in codigos:
+        try:
+            conteos = histograma_exacto(codigo)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        h = ancho_banda(conteos, ancho)
+        inicio = time.perf_counter()
+        valores = densidad(conteos, h)
+        duracion = time.perf_counter() - inicio
+        x, y = kde_especialidad(codigo, ancho)
+        modas = x[1:-1][(y[1:-1] > y[:-2]) & (y[1:-1] > y[2:])]
+        linea = (f"📈 {codigo}: h={h:.4f} | {duracion * 1000:.1f} ms | integral {valores.sum() * PASO:.4f}"
+                 f" | modas {', '.join(f'{m:.2f}' for m in modas[:6])}")
+        if args.comparar:
+            from scipy.stats import gaussian_kde
+            puntuaciones = np.repeat(REJILLA, np.asarray(conteos))
+            inicio = time.perf_counter()
+            referencia = gaussian_kde(puntuaciones, bw_method=h / puntuaciones.std(ddof=1))(x)
+            linea += f" | gaussian_kde {(time.perf_counter() - inicio) * 1000:.0f} ms"
+            interior = (x > 4 * h) & (x < 10 - 4 * h)
+            linea += f" (dif. máx. {np.abs(kde_especialidad(codigo, ancho, reflejar=False)[1] - referencia)[interior].max():.2e})"
+        print(linea)
+
+
+if __name__ == "__main__":
+    main()
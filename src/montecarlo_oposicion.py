@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Simulación Monte Carlo de la clasificación final - Baremos 2025
+El baremo es solo la fase de concurso. La nota final del concurso-oposición
+pondera 2/3 la fase de oposición y 1/3 la de concurso:
+
+    nota_final = (2 · oposición + concurso) / 3
+
+y solo pueden obtener plaza quienes aprueban la oposición (nota >= 5).
+
+Cada simulación elige una distribución plausible de notas de oposición (media
+y desviación al azar dentro de los intervalos indicados), asigna una nota a
+cada candidato real de la especialidad, combina con su baremo y marca a los N
+primeros. De ahí se estima, para cada puntuación de baremo, la probabilidad
+de quedar entre los N primeros, y la distribución de la nota final de corte.
+
+Las simulaciones se hacen por lotes vectorizados (matriz [lote, candidatos])
+de memoria acotada (MEMORIA_LOTE) y se reparten en un pool de procesos; cada
+tarea tiene su semilla derivada con np.random.SeedSequence de (semilla,
+especialidad, bloque) y devuelve solo agregados (aciertos por candidato y un
+AcumuladorEstadisticas de la nota de corte, que se fusiona con la fórmula de
+Chan), así que el resultado es reproducible y la memoria no depende del
+número de simulaciones.
+
+Uso:
+    python src/montecarlo_oposicion.py [--simulaciones 10000] [--plazas 006=150 ...]
+        [--proporcion 0.1] [--media 4 6] [--desviacion 1.5 2.5] [--procesos 8]
+
+Autor: @joanh
+"""
+
+import os
+import json
+import time
+import argparse
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from baremo_comun import RAIZ
+from almacen import cargar_almacen
+from estadisticas_online import AcumuladorEstadisticas
+from puntuacion import ESCALA, array
+
+RESULTADO_PATH = RAIZ / "output" / "montecarlo_2025.json"
+MEMORIA_LOTE = 32 * 1024 * 1024     # bytes por matriz de notas de un lote
+SIMULACIONES_POR_TAREA = 5000
+PESO_OPOSICION = 2
+PESO_CONCURSO = 1
+NOTA_APROBADO = 5.0
+
+
+def nota_final(oposicion, concurso):
+    """Ponderación oficial: (2 · oposición + concurso) / 3"""
+    return (PESO_OPOSICION * oposicion + PESO_CONCURSO * concurso) / (PESO_OPOSICION + PESO_CONCURSO)
+
+
+def simular_bloque(baremo, plazas, simulaciones, semilla, media=(4.0, 6.0), desviacion=(1.5, 2.5)):
+    """
+    Trabajo de cada proceso: 'simulaciones' clasificaciones de una especialidad.
+    baremo: puntuaciones en puntos. Devuelve (aciertos por candidato, número
+    de simulaciones, AcumuladorEstadisticas de la nota final de corte en
+    diezmilésimas, simulaciones con menos aprobados que plazas).
+    """
+    rng = np.random.default_rng(semilla)
+    n = baremo.size
+    plazas = min(plazas, n)
+    lote = max(1, MEMORIA_LOTE // (n * 8))
+    aciertos = np.zeros(n, dtype=np.int64)
+    cortes = AcumuladorEstadisticas()
+    sin_cubrir = 0
+
+    for inicio in range(0, simulaciones, lote):
+        b = min(lote, simulaciones - inicio)
+        mu = rng.uniform(*media, size=(b, 1))
+        sigma = rng.uniform(*desviacion, size=(b, 1))
+        oposicion = np.clip(rng.normal(mu, sigma, size=(b, n)), 0, 10)
+        final = nota_final(oposicion, baremo)
+        final[oposicion < NOTA_APROBADO] = -np.inf
+        # Nota final del N-ésimo: se compara con ella en lugar de ordenar cada fila
+        corte = np.partition(final, n - plazas, axis=1)[:, n - plazas]
+        aciertos += np.count_nonzero((final >= corte[:, None]) & np.isfinite(final), axis=0)
+        cubiertas = np.isfinite(corte)
+        sin_cubrir += int(b - cubiertas.sum())
+        cortes.actualizar_lote(array(corte[cubiertas]))
+    return aciertos, simulaciones, cortes, sin_cubrir
+
+
+def montecarlo(plazas, simulaciones=10000, almacen=None, procesos=None, semilla=2025,
+               media=(4.0, 6.0), desviacion=(1.5, 2.5)):
+    """
+    plazas: {codigo: N}. Devuelve {codigo: resumen} con la probabilidad de
+    quedar entre los N primeros para cada puntuación de baremo distinta.
+    """
+    almacen = almacen or cargar_almacen()
+    tareas = []
+    for i, codigo in enumerate(almacen.codigos):
+        if codigo not in plazas:
+            continue
+        baremo = np.asarray(almacen.puntuacion[almacen.tramo(codigo)]) / ESCALA
+        for j, inicio in enumerate(range(0, simulaciones, SIMULACIONES_POR_TAREA)):
+            semilla_bloque = np.random.SeedSequence(semilla, spawn_key=(i, j))
+            tareas.append((codigo, baremo, plazas[codigo],
+                           min(SIMULACIONES_POR_TAREA, simulaciones - inicio), semilla_bloque))
+
+    procesos = procesos or os.cpu_count() or 1
+    argumentos = [(b, p, s, sem, media, desviacion) for _, b, p, s, sem in tareas]
+    if procesos == 1:
+        parciales = [simular_bloque(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            parciales = list(pool.map(simular_bloque, *zip(*argumentos)))
+
+    # Agregación en streaming: solo se suman contadores
+    agregados = {}
+    for (codigo, baremo, *_), (aciertos, sims, cortes, sin_cubrir) in zip(tareas, parciales):
+        a = agregados.setdefault(codigo, {'baremo': baremo, 'aciertos': 0, 'simulaciones': 0,
+                                          'cortes': AcumuladorEstadisticas(), 'sin_cubrir': 0})
+        a['aciertos'] = a['aciertos'] + aciertos
+        a['simulaciones'] += sims
+        a['cortes'].fusionar(cortes)
+        a['sin_cubrir'] += sin_cubrir
+
+    resultados = {}
+    for codigo, a in agregados.items():
+        valores, inverso = np.unique(np.round(a['baremo'] * ESCALA).astype(np.int64), return_inverse=True)
+        por_valor = np.bincount(inverso, weights=a['aciertos']) / np.bincount(inverso) / a['simulaciones']
+        cortes = a['cortes']
+        resultados[codigo] = {
+            'plazas': int(min(plazas[codigo], a['baremo'].size)),
+            'total': int(a['baremo'].size),
+            'simulaciones': a['simulaciones'],
+            'plazas_sin_cubrir': a['sin_cubrir'] / a['simulaciones'],
+            'corte_medio': round(cortes.media, 4) if cortes.n else None,
+            'corte_desviacion': round(cortes.desviacion, 4) if cortes.n else None,
+            'puntuaciones': (valores / ESCALA).tolist(),
+            'probabilidad': np.round(por_valor, 6).tolist(),
+        }
+    return resultados
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Monte Carlo de la clasificación final (oposición + concurso)")
+    parser.add_argument('--simulaciones', type=int, default=10000, help="Simulaciones por especialidad")
+    parser.add_argument('--plazas', nargs='*', default=[], help="codigo=N (p.ej. 006=150)")
+    parser.add_argument('--proporcion', type=float, default=0.1,
+                        help="Plazas como fracción de candidatos para las especialidades sin --plazas")
+    parser.add_argument('--media', type=float, nargs=2, default=(4.0, 6.0), help="Intervalo de la nota media de oposición")
+    parser.add_argument('--desviacion', type=float, nargs=2, default=(1.5, 2.5), help="Intervalo de su desviación")
+    parser.add_argument('--procesos', type=int, default=None, help="Número de procesos (por defecto: CPUs)")
+    parser.add_argument('--semilla', type=int, default=2025, help="Semilla (resultados reproducibles)")
+    args = parser.parse_args()
+
+    almacen = cargar_almacen()
+    plazas = {e['codigo']: max(1, round(e['total'] * args.proporcion)) for e in almacen.meta['especialidades']}
+    plazas.update({codigo: int(n) for codigo, n in (p.split('=') for p in args.plazas)})
+
+    inicio = time.perf_counter()
+    resultados = montecarlo(plazas, args.simulaciones, almacen, args.procesos, args.semilla,
+                            tuple(args.media), tuple(args.desviacion))
+    duracion = time.perf_counter() - inicio
+
+    for codigo, r in resultados.items():
+        probabilidad = np.array(r['probabilidad'])
+        puntuaciones = np.array(r['puntuaciones'])
+        mitad = puntuaciones[probabilidad >= 0.5]
+        linea = f"🎲 {codigo}: {r['plazas']} plazas / {r['total']}"
+        if r['corte_medio'] is None:
+            linea += " | ⚠️ ninguna simulación cubre todas las plazas"
+        else:
+            linea += f" | corte final {r['corte_medio']:.2f} ± {r['corte_desviacion']:.2f}"
+            if r['plazas_sin_cubrir']:
+                linea += f" (sin cubrir en el {r['plazas_sin_cubrir']:.1%})"
+        linea += (f" | P ≥ 50% desde baremo {mitad.min():.4f}" if mitad.size else
+                  f" | P máxima {probabilidad.max():.1%} (baremo {puntuaciones[probabilidad.argmax()]:.4f})")
+        print(linea)
+
+    total = sum(r['total'] for r in resultados.values())
+    RESULTADO_PATH.parent.mkdir(exist_ok=True)
+    with open(RESULTADO_PATH, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generado': date.today().isoformat(),
+            'simulaciones': args.simulaciones,
+            'semilla': args.semilla,
+            'media_oposicion': list(args.media),
+            'desviacion_oposicion': list(args.desviacion),
+            'especialidades': resultados,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"⏱️ {total} candidatos × {args.simulaciones} simulaciones en {duracion:.1f}s")
+    print(f"💾 {RESULTADO_PATH.relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Pruebas de normalidad y bondad de ajuste - Baremos 2025
+Shapiro-Wilk solo admite hasta 5.000 datos, así que no sirve para el conjunto
+global de candidatos. Este módulo aplica a cada especialidad y al global:
+
+    - Anderson-Darling (normal)
+    - D'Agostino K² (asimetría y curtosis)
+    - Lilliefors: KS frente a la normal con media y σ estimadas de los propios
+      datos (el KS clásico con parámetros ajustados da p-valores demasiado
+      altos). Necesita statsmodels, que es opcional: sin él no se calcula
+    - Kolmogorov-Smirnov de dos muestras frente a la mezcla empírica de las
+      demás especialidades (¿se distingue del resto?)
+    - Shapiro-Wilk, solo cuando n <= 5000
+
+Los resultados se guardan en .cache/normalidad/ con clave SHA-256 de las
+puntuaciones (y de la mezcla), así que volver a generar los informes no
+repite los cálculos mientras los datos no cambien.
+
+Uso:
+    pruebas = pruebas_normalidad(puntuaciones)       # puntos
+    pruebas = pruebas_normalidad(fijos, en_diezmilesimas=True)
+    python src/normalidad.py [--alfa 0.05]
+
+Autor: @joanh
+"""
+
+import json
+import hashlib
+import warnings
+import argparse
+import numpy as np
+from scipy import stats
+
+from baremo_comun import RAIZ
+from almacen import cargar_almacen
+from puntuacion import ESCALA, array
+
+try:
+    from statsmodels.stats.diagnostic import lilliefors
+except ImportError:     # statsmodels es opcional (solo para Lilliefors)
+    lilliefors = None
+
+CACHE_DIR = RAIZ / ".cache" / "normalidad"
+RESULTADO_PATH = RAIZ / "output" / "normalidad_2025.json"
+LIMITE_SHAPIRO = 5000
+VERSION = 2     # cambiar si cambian las pruebas para invalidar la caché
+
+
+def huella(*arrays):
+    """SHA-256 de las puntuaciones (diezmilésimas) que intervienen en las pruebas"""
+    h = hashlib.sha256(f"v{VERSION}".encode())
+    for a in arrays:
+        h.update(np.ascontiguousarray(a, dtype=np.int32).tobytes())
+        h.update(b'|')
+    return h.hexdigest()
+
+
+def calcular_pruebas(fijos, mezcla=None, alfa=0.05):
+    """Pruebas sin caché; fijos y mezcla en diezmilésimas"""
+    x = fijos / ESCALA
+    n = x.size
+    mu, sigma = float(x.mean()), float(x.std(ddof=1))
+    resultado = {'total': int(n), 'media': round(mu, 6), 'desviacion': round(sigma, 6),
+                 'asimetria': round(float(stats.skew(x)), 6),
+                 'curtosis': round(float(stats.kurtosis(x)), 6)}
+
+    with warnings.catch_warnings():
+        # SciPy >= 1.17 avisa del cambio a p-valores; se siguen usando los valores críticos
+        warnings.simplefilter('ignore', FutureWarning)
+        ad = stats.anderson(x, dist='norm')
+    critico = float(np.interp(alfa * 100, ad.significance_level[::-1], ad.critical_values[::-1]))
+    resultado['anderson'] = {'estadistico': round(float(ad.statistic), 6),
+                             'critico': round(critico, 6),
+                             'normal': bool(ad.statistic < critico)}
+
+    k2, p = stats.normaltest(x)
+    resultado['dagostino'] = {'estadistico': round(float(k2), 6), 'p_valor': float(p), 'normal': bool(p > alfa)}
+
+    if lilliefors is not None:
+        d, p = lilliefors(x, dist='norm', pvalmethod='table')
+        resultado['lilliefors'] = {'estadistico': round(float(d), 6), 'p_valor': float(p), 'normal': bool(p > alfa)}
+
+    if mezcla is not None and mezcla.size:
+        d, p = stats.ks_2samp(x, mezcla / ESCALA)
+        resultado['ks_mezcla'] = {'estadistico': round(float(d), 6), 'p_valor': float(p),
+                                  'igual_que_mezcla': bool(p > alfa)}
+
+    if 3 <= n <= LIMITE_SHAPIRO:
+        w, p = stats.shapiro(x)
+        resultado['shapiro'] = {'estadistico': round(float(w), 6), 'p_valor': float(p), 'normal': bool(p > alfa)}
+    return resultado
+
+
+def pruebas_normalidad(puntuaciones, mezcla=None, alfa=0.05, en_diezmilesimas=False):
+    """
+    Pruebas de normalidad (con caché por huella de los datos). Como en
+    puntuacion.array, los números están en puntos salvo con en_diezmilesimas=True.
+    """
+    fijos = array(puntuaciones, en_diezmilesimas)
+    mezcla = None if mezcla is None else array(mezcla, en_diezmilesimas)
+    # Con y sin statsmodels los resultados difieren: entra en la clave de la caché
+    clave = huella(fijos, *([] if mezcla is None else [mezcla]),
+                   np.array([round(alfa * ESCALA), lilliefors is not None]))
+    ruta = CACHE_DIR / f"{clave[:24]}.json"
+    if ruta.exists():
+        return json.loads(ruta.read_text(encoding='utf-8'))
+    resultado = calcular_pruebas(fijos, mezcla, alfa)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_suffix('.tmp')
+    temporal.write_text(json.dumps(resultado, ensure_ascii=False), encoding='utf-8')
+    temporal.replace(ruta)
+    return resultado
+
+
+def normalidad_almacen(almacen=None, alfa=0.05):
+    """{codigo: pruebas, ..., 'global': pruebas} para todas las especialidades del almacén"""
+    almacen = almacen or cargar_almacen()
+    todas = np.asarray(almacen.puntuacion)
+    resultados = {}
+    for codigo in almacen.codigos:
+        tramo = almacen.tramo(codigo)
+        resto = np.concatenate((todas[:tramo.start], todas[tramo.stop:]))
+        resultados[codigo] = pruebas_normalidad(todas[tramo], resto, alfa, en_diezmilesimas=True)
+    resultados['global'] = pruebas_normalidad(todas, alfa=alfa, en_diezmilesimas=True)
+    return resultados
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Pruebas de normalidad por especialidad y global")
+    parser.add_argument('--alfa', type=float, default=0.05, help="Nivel de significación")
+    args = parser.parse_args()
+
+    resultados = normalidad_almacen(alfa=args.alfa)
+    if lilliefors is None:
+        print("⚠️ statsmodels no está instalado: se omite Lilliefors")
+    marca = lambda ok: "✅" if ok else "❌"
+    for codigo, r in resultados.items():
+        linea = (f"📊 {codigo:>6}: n={r['total']:5d} | AD {r['anderson']['estadistico']:7.2f} {marca(r['anderson']['normal'])}"
+                 f" | K² p={r['dagostino']['p_valor']:.2e} {marca(r['dagostino']['normal'])}")
+        if 'lilliefors' in r:
+            linea += f" | Lilliefors p={r['lilliefors']['p_valor']:.2e} {marca(r['lilliefors']['normal'])}"
+        if 'ks_mezcla' in r:
+            linea += f" | KS resto D={r['ks_mezcla']['estadistico']:.3f}"
+        print(linea)
+
+    RESULTADO_PATH.parent.mkdir(exist_ok=True)
+    with open(RESULTADO_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'alfa': args.alfa, 'pruebas': resultados}, f, ensure_ascii=False, indent=2)
+    print(f"💾 {RESULTADO_PATH.relative_to(RAIZ)}")
+
+
+if __name__ == "__main__":
+    main()
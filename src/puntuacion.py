@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Representación exacta de puntuaciones - Baremos 2025
+Las puntuaciones del baremo tienen siempre 4 decimales (4,8333), así que se
+guardan como enteros en diezmilésimas (48333) en lugar de float64:
+    - igualdad y empates exactos (sin abs(a - b) < 0.0001)
+    - int32: la mitad de memoria que float64 en los arrays
+    - histogramas y empates con np.bincount sobre 0..100000
+
+Se usa desde el análisis de líneas (lineas_candidato) hasta la escritura de
+salidas y las estadísticas; solo se convierte a float al presentar.
+
+Uso:
+    from puntuacion import parsear, formatear
+    parsear('4,8333')   # 48333
+    formatear(48333)    # '4.8333'
+    a_fijo(7)           # 70000 (puntos); a_fijo(48333, en_diezmilesimas=True)
+
+Autor: @joanh
+"""
+
+import numpy as np
+
+DECIMALES = 4
+ESCALA = 10 ** DECIMALES          # 1 punto = 10000 diezmilésimas
+MAXIMO = 10 * ESCALA              # 10,0000
+TIPO = np.int32
+
+
+def parsear(texto):
+    """'4,8333' | '4.8333' → 48333 (sin pasar por float; ValueError si no es válido)"""
+    entero, _, decimales = texto.strip().replace(',', '.').partition('.')
+    if not entero.isdigit() or (decimales and not decimales.isdigit()) or len(decimales) > DECIMALES:
+        raise ValueError(f"Puntuación no válida: {texto!r}")
+    return int(entero) * ESCALA + int(decimales.ljust(DECIMALES, '0') or 0)
+
+
+def a_fijo(valor, en_diezmilesimas=False):
+    """
+    Convierte a diezmilésimas. Los números están en puntos (7 → 70000) salvo
+    con en_diezmilesimas=True, que exige un entero ya en punto fijo
+    (48333 → 48333); las cadenas se analizan con parsear.
+    """
+    if en_diezmilesimas:
+        if not isinstance(valor, (int, np.integer)):
+            raise TypeError(f"Se esperaba un entero en diezmilésimas: {valor!r}")
+        return int(valor)
+    if isinstance(valor, str):
+        return parsear(valor)
+    if isinstance(valor, (int, np.integer)):
+        return int(valor) * ESCALA
+    return int(round(float(valor) * ESCALA))
+
+
+def a_float(fijo):
+    """48333 → 4.8333 (solo para presentación o librerías externas)"""
+    return fijo / ESCALA
+
+
+def formatear(fijo, separador='.'):
+    """48333 → '4.8333' (exacto, sin redondeos de float)"""
+    signo = '-' if fijo < 0 else ''
+    entero, decimales = divmod(abs(int(fijo)), ESCALA)
+    return f"{signo}{entero}{separador}{decimales:0{DECIMALES}d}"
+
+
+def es_valida(fijo):
+    """Dentro del rango del baremo (0 a 10 puntos)"""
+    return 0 <= fijo <= MAXIMO
+
+
+def array(valores, en_diezmilesimas=False):
+    """
+    Array int32 de diezmilésimas a partir de números en puntos o cadenas; con
+    en_diezmilesimas=True, de enteros ya en punto fijo.
+    """
+    valores = np.asarray(valores)
+    if en_diezmilesimas:
+        if valores.dtype.kind not in 'iu':
+            raise TypeError(f"Se esperaban enteros en diezmilésimas (dtype {valores.dtype})")
+        return valores.astype(TIPO)
+    if valores.dtype.kind in 'iu':
+        return (valores.astype(np.int64) * ESCALA).astype(TIPO)
+    if valores.dtype.kind == 'f':
+        return np.rint(valores * ESCALA).astype(TIPO)
+    return np.fromiter((a_fijo(v) for v in valores.ravel()), dtype=TIPO, count=valores.size)
+
+
+def histograma(fijos):
+    """Recuento exacto por valor: índice = diezmilésimas (0..100000)"""
+    return np.bincount(np.asarray(fijos, dtype=np.int64), minlength=MAXIMO + 1)
+
+
+def empates(fijos):
+    """{puntuación: número de candidatos} para las puntuaciones repetidas"""
+    conteos = histograma(fijos)
+    repetidas = np.flatnonzero(conteos > 1)
+    return {int(v): int(conteos[v]) for v in repetidas}
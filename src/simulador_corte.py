@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Simulador de nota de corte - Baremos 2025
+Con N plazas (o puestos en la lista de interinos) en una especialidad, la
+nota de corte es la puntuación del candidato N-ésimo. El simulador devuelve
+para cada N:
+
+    corte      puntuación del último candidato que entra
+    empatados  candidatos con exactamente la nota de corte
+    dentro     empatados que entran (los demás dependen del desempate)
+    fuera      empatados que se quedan fuera
+    margen     corte - puntuación del primer candidato que no entra (0 si
+               hay empate en el límite; -1 diezmilésima si entran todos)
+
+La curva completa (N = 1..total) se calcula en una sola pasada vectorizada
+sobre las puntuaciones ordenadas del almacén (ordenadas.npy) y se guarda en
+output/cortes/corte_<codigo>.npz, con la huella SHA-256 de la especialidad
+para regenerarla cuando cambian los datos. Los visualizadores pueden dibujar
+la curva directamente con cargar_curva().
+
+Uso:
+    simular({'006': 150, '107': 20})
+    python src/simulador_corte.py 006=150 107=20 [--curvas]
+
+Autor: @joanh
+"""
+
+import sys
+import argparse
+import numpy as np
+
+from baremo_comun import RAIZ
+from consulta_rango import IndiceRangos, rangos_ordenadas
+from puntuacion import ESCALA
+
+CORTES_DIR = RAIZ / "output" / "cortes"
+
+
+def calcular_curva(ordenadas):
+    """
+    Curva de corte para N = 1..n a partir de las puntuaciones ordenadas de
+    menor a mayor (diezmilésimas). Devuelve arrays int32 de longitud n.
+    La posición de cada nota de corte sale de la misma búsqueda que
+    IndiceRangos.rangos (rangos_ordenadas).
+    """
+    ordenadas = np.asarray(ordenadas, dtype=np.int64)
+    n = ordenadas.size
+    descendentes = ordenadas[::-1]
+    corte = descendentes
+    r = rangos_ordenadas(ordenadas, corte)
+    empatados = r['empatados']
+    plazas = np.arange(1, n + 1)
+    dentro = plazas - r['por_encima']
+    siguiente = np.append(descendentes[1:], corte[-1] + 1 if n else 0)   # margen -1 cuando entran todos
+    return {
+        'plazas': plazas.astype(np.int32),
+        'corte': corte.astype(np.int32),
+        'empatados': empatados.astype(np.int32),
+        'dentro': dentro.astype(np.int32),
+        'fuera': (empatados - dentro).astype(np.int32),
+        'margen': (corte - siguiente).astype(np.int32),
+    }
+
+
+class SimuladorCorte:
+    """Curvas de corte por especialidad con caché en output/cortes/"""
+
+    def __init__(self, indice=None, directorio=CORTES_DIR):
+        self.indice = indice or IndiceRangos()
+        self.directorio = directorio
+        self.huellas = {e['codigo']: e['sha256'] for e in self.indice.almacen.meta['especialidades']}
+        self._curvas = {}
+
+    def curva(self, codigo):
+        """Curva de corte de una especialidad (la genera si falta o está desfasada)"""
+        if codigo in self._curvas:
+            return self._curvas[codigo]
+        ruta = self.directorio / f"corte_{codigo}.npz"
+        huella = self.huellas.get(codigo)
+        if ruta.exists():
+            with np.load(ruta) as datos:
+                if str(datos['sha256']) == huella:
+                    self._curvas[codigo] = {clave: datos[clave] for clave in datos.files if clave != 'sha256'}
+                    return self._curvas[codigo]
+        curva = calcular_curva(self.indice.puntuaciones(codigo))
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        np.savez(ruta, sha256=np.array(huella), **curva)
+        self._curvas[codigo] = curva
+        return curva
+
+    def simular(self, plazas):
+        """
+        plazas: {codigo: N} o vector de N en el orden de las especialidades
+        del almacén. Devuelve {codigo: {'plazas', 'corte', 'empatados',
+        'dentro', 'fuera', 'margen'}} con corte y margen en puntos. Con N mayor
+        que el número de candidatos entran todos.
+        """
+        if not isinstance(plazas, dict):
+            plazas = dict(zip(self.indice.almacen.codigos, plazas))
+        resultado = {}
+        for codigo, n in plazas.items():
+            curva = self.curva(codigo)
+            if n < 1:
+                raise ValueError(f"Número de plazas no válido para {codigo}: {n}")
+            i = min(int(n), len(curva['plazas'])) - 1
+            resultado[codigo] = {
+                'plazas': int(n),
+                'total': len(curva['plazas']),
+                'corte': int(curva['corte'][i]) / ESCALA,
+                'empatados': int(curva['empatados'][i]),
+                'dentro': int(curva['dentro'][i]),
+                'fuera': int(curva['fuera'][i]),
+                'margen': max(int(curva['margen'][i]), 0) / ESCALA,
+                'entran_todos': int(n) >= len(curva['plazas']),
+            }
+        return resultado
+
+
+def cargar_curva(codigo):
+    """Curva de corte de una especialidad con corte y margen en puntos (para dibujar)"""
+    curva = SimuladorCorte().curva(codigo)
+    return {**curva, 'corte': curva['corte'] / ESCALA, 'margen': curva['margen'] / ESCALA}
+
+
+def simular(plazas):
+    """simular({'006': 150}) con el almacén de output/almacen"""
+    return SimuladorCorte().simular(plazas)
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Nota de corte con N plazas por especialidad")
+    parser.add_argument('plazas', nargs='*', help="codigo=N (p.ej. 006=150)")
+    parser.add_argument('--curvas', action='store_true', help="Generar las curvas de todas las especialidades")
+    args = parser.parse_args()
+
+    simulador = SimuladorCorte()
+    if args.curvas:
+        for codigo in simulador.indice.almacen.codigos:
+            curva = simulador.curva(codigo)
+            print(f"📈 {codigo}: curva de {len(curva['plazas'])} puntos → corte_{codigo}.npz")
+
+    try:
+        plazas = {codigo: int(n) for codigo, n in (p.split('=') for p in args.plazas)}
+        resultado = simulador.simular(plazas)
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    for codigo, r in resultado.items():
+        if r['entran_todos']:
+            print(f"✅ {codigo}: {r['plazas']} plazas para {r['total']} candidatos, entran todos")
+            continue
+        linea = f"✂️ {codigo}: {r['plazas']} plazas → corte {r['corte']:.4f} | margen {r['margen']:.4f}"
+        if r['fuera']:
+            linea += f" | ⚠️ {r['empatados']} empatados en el corte: {r['dentro']} dentro, {r['fuera']} fuera"
+        print(linea)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Extracción rápida de texto desde el flujo de contenido - Baremos 2025
+Para las páginas generadas por máquina del baremo, el análisis de
+maquetación completo de pdfminer (extract_text) hace mucho más trabajo del
+necesario. Este backend lee directamente los flujos de contenido de cada
+página, interpreta los operadores de texto (BT/ET, Tf, Td, TD, Tm, T*, TL,
+Tc, Tw, Tz, Tj, TJ, ', ") con su matriz de texto y la CTM (cm, q/Q), genera
+tuplas (x, y, texto) y reconstruye las líneas agrupando por y.
+
+Incluye una comprobación de equivalencia contra pdfplumber: los registros
+completos que acaban en las salidas (nombre, total, apartados con sus
+contadores y página) deben coincidir, en páginas de muestra o en todo el
+rango de una especialidad (--especialidad).
+
+Limitaciones: no entra en Form XObjects (Do) ni aplica Trise; las páginas
+del baremo no los usan.
+
+Uso:
+    python src/texto_rapido.py --verificar [ruta_pdf] [--paginas 925 926 1062]
+    python src/texto_rapido.py --verificar --especialidad 006
+
+Autor: @joanh
+"""
+
+import re
+import sys
+import time
+import argparse
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfinterp import PDFResourceManager, PDFContentParser
+from pdfminer.pdftypes import PDFObjRef, resolve1, dict_value
+from pdfminer.psparser import PSKeyword, PSEOF, keyword_name, literal_name
+
+from baremo_comun import cargar_especialidades, buscar_especialidad, ruta_pdf_original, lineas_candidato
+from puntuacion import parsear
+
+TOLERANCIA_Y = 3.0   # misma tolerancia vertical que pdfplumber (y_tolerance)
+TOLERANCIA_X = 3.0   # hueco que inserta un espacio (x_tolerance de pdfplumber)
+
+PATRON_REGISTRO = re.compile(r"^\*{4}\d{4}\*\s+([^\d]+?)\s+\d{1,2}[,\.]\d{4}\b(.*)$")
+PATRON_APARTADO = re.compile(r"\b(\d{1,2},\d{4})(?:/(\d+))?")
+CAMPOS = ('nombre', 'total', 'apartados', 'pagina')
+
+
+def multiplicar(a, b):
+    """Producto de matrices afines PDF (a, b, c, d, e, f)"""
+    a0, b0, c0, d0, e0, f0 = a
+    a1, b1, c1, d1, e1, f1 = b
+    return (a0 * a1 + b0 * c1, a0 * b1 + b0 * d1,
+            c0 * a1 + d0 * c1, c0 * b1 + d0 * d1,
+            e0 * a1 + f0 * c1 + e1, e0 * b1 + f0 * d1 + f1)
+
+
+IDENTIDAD = (1, 0, 0, 1, 0, 0)
+
+
+def cargar_fuentes(rsrcmgr, recursos):
+    """Fuentes del diccionario de recursos: {nombre: PDFFont}"""
+    fuentes = {}
+    fuentes_dict = dict_value(dict_value(recursos).get('Font', {})) if recursos else {}
+    for nombre, spec in fuentes_dict.items():
+        objid = spec.objid if isinstance(spec, PDFObjRef) else None
+        fuentes[nombre] = rsrcmgr.get_font(objid, dict_value(spec))
+    return fuentes
+
+
+def fragmentos_pagina(pagina, rsrcmgr):
+    """
+    Interpreta el flujo de contenido de una PDFPage y devuelve
+    [(x_inicio, x_fin, y, texto)] en espacio de página
+    """
+    fuentes = cargar_fuentes(rsrcmgr, pagina.resources)
+    flujos = [resolve1(c) for c in (pagina.contents or [])]
+    try:
+        parser = PDFContentParser(flujos)
+    except PSEOF:
+        return []
+
+    ctm, pila_ctm = IDENTIDAD, []
+    tm = tlm = IDENTIDAD
+    fuente, tam = None, 0.0
+    tc = tw = 0.0
+    tz = 1.0
+    tl = 0.0
+    operandos = []
+    fragmentos = []
+
+    def mostrar(cadena):
+        nonlocal tm
+        if fuente is None:
+            return
+        texto, avance = [], 0.0
+        for cid in fuente.decode(cadena):
+            try:
+                texto.append(fuente.to_unichr(cid))
+            except Exception:
+                texto.append('?')
+            ancho = fuente.char_width(cid) * tam + tc
+            if cid == 32 and not fuente.is_multibyte():
+                ancho += tw
+            avance += ancho * tz
+        trm = multiplicar(tm, ctm)
+        x_fin = multiplicar((1, 0, 0, 1, avance, 0), trm)[4]
+        fragmentos.append((trm[4], x_fin, trm[5], ''.join(texto)))
+        tm = multiplicar((1, 0, 0, 1, avance, 0), tm)
+
+    def nueva_linea(tx, ty):
+        nonlocal tm, tlm
+        tlm = multiplicar((1, 0, 0, 1, tx, ty), tlm)
+        tm = tlm
+
+    while True:
+        try:
+            _, obj = parser.nextobject()
+        except PSEOF:
+            break
+        if not isinstance(obj, PSKeyword):
+            operandos.append(obj)
+            continue
+
+        op = keyword_name(obj)
+        args, operandos = operandos, []
+        try:
+            if op == 'q':
+                pila_ctm.append(ctm)
+            elif op == 'Q':
+                ctm = pila_ctm.pop() if pila_ctm else IDENTIDAD
+            elif op == 'cm':
+                ctm = multiplicar(tuple(args[-6:]), ctm)
+            elif op == 'BT':
+                tm = tlm = IDENTIDAD
+            elif op == 'Tf':
+                fuente, tam = fuentes.get(literal_name(args[-2])), float(args[-1])
+            elif op == 'Tc':
+                tc = float(args[-1])
+            elif op == 'Tw':
+                tw = float(args[-1])
+            elif op == 'Tz':
+                tz = float(args[-1]) / 100
+            elif op == 'TL':
+                tl = float(args[-1])
+            elif op == 'Td':
+                nueva_linea(args[-2], args[-1])
+            elif op == 'TD':
+                tl = -float(args[-1])
+                nueva_linea(args[-2], args[-1])
+            elif op == 'Tm':
+                tm = tlm = tuple(float(v) for v in args[-6:])
+            elif op == 'T*':
+                nueva_linea(0, -tl)
+            elif op == 'Tj':
+                mostrar(args[-1])
+            elif op == "'":
+                nueva_linea(0, -tl)
+                mostrar(args[-1])
+            elif op == '"':
+                tw, tc = float(args[-3]), float(args[-2])
+                nueva_linea(0, -tl)
+                mostrar(args[-1])
+            elif op == 'TJ':
+                for elemento in args[-1]:
+                    if isinstance(elemento, bytes):
+                        mostrar(elemento)
+                    else:
+                        tm = multiplicar((1, 0, 0, 1, -float(elemento) / 1000 * tam * tz, 0), tm)
+        except (IndexError, TypeError, ValueError):
+            continue  # operador mal formado: se ignora como haría un visor
+
+    return fragmentos
+
+
+def reconstruir_lineas(fragmentos, altura):
+    """Agrupa los fragmentos por y (de arriba a abajo) y los une por x"""
+    filas = []
+    for x0, x1, y, texto in sorted(fragmentos, key=lambda f: (-f[2], f[0])):
+        top = altura - y
+        if filas and abs(top - filas[-1][0]) <= TOLERANCIA_Y:
+            filas[-1][1].append((x0, x1, texto))
+        else:
+            filas.append((top, [(x0, x1, texto)]))
+
+    lineas = []
+    for _, fila in filas:
+        partes, x_anterior = [], None
+        for x0, x1, texto in sorted(fila):
+            if x_anterior is not None and x0 - x_anterior > TOLERANCIA_X \
+                    and not partes[-1].endswith(' ') and not texto.startswith(' '):
+                partes.append(' ')
+            partes.append(texto)
+            x_anterior = x1
+        lineas.append(''.join(partes).strip())
+    return '\n'.join(l for l in lineas if l)
+
+
+class PDFRapido:
+    """Mismo interfaz que PaginasPDF (num_paginas, texto) con el backend rápido"""
+
+    def __init__(self, pdf_path):
+        self._f = open(pdf_path, 'rb')
+        self._doc = PDFDocument(PDFParser(self._f))
+        self._paginas = list(PDFPage.create_pages(self._doc))
+        self._rsrcmgr = PDFResourceManager(caching=True)
+
+    def num_paginas(self):
+        return len(self._paginas)
+
+    def fragmentos(self, indice):
+        """([(x_inicio, x_fin, y, texto)], altura) de la página (índice 0-based)"""
+        pagina = self._paginas[indice]
+        x0, y0, x1, y1 = pagina.mediabox
+        return fragmentos_pagina(pagina, self._rsrcmgr), y1
+
+    def texto(self, indice):
+        """Texto de la página (índice 0-based) reconstruido desde el flujo de contenido"""
+        return reconstruir_lineas(*self.fragmentos(indice))
+
+    def cerrar(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def registros(texto, num_pagina):
+    """
+    [(nombre, total, apartados, pagina)] de las líneas de candidato de una
+    página; apartados = ((valor, contador o None), ...) en diezmilésimas
+    """
+    resultado = []
+    for linea, total in lineas_candidato(texto):
+        nombre, resto = PATRON_REGISTRO.match(linea).groups()
+        apartados = tuple((parsear(valor), int(contador) if contador else None)
+                          for valor, contador in PATRON_APARTADO.findall(resto))
+        resultado.append((nombre.strip(), total, apartados, num_pagina))
+    return resultado
+
+
+def primera_diferencia(registros_rapido, registros_plumber):
+    """(posición, campo, valor rápido, valor pdfplumber) del primer registro distinto o None"""
+    for i, (a, b) in enumerate(zip(registros_rapido, registros_plumber)):
+        for campo, x, y in zip(CAMPOS, a, b):
+            if x != y:
+                return i, campo, x, y
+    if len(registros_rapido) != len(registros_plumber):
+        i = min(len(registros_rapido), len(registros_plumber))
+        return i, 'registros', len(registros_rapido), len(registros_plumber)
+    return None
+
+
+def verificar_equivalencia(pdf_path, paginas):
+    """
+    Compara, página a página (1-based), los registros completos obtenidos con
+    el backend rápido y con pdfplumber. Devuelve (paginas_iguales, diferencias)
+    con diferencias = [(pagina, primera_diferencia)]
+    """
+    import pdfplumber
+
+    iguales, diferencias = 0, []
+    t_rapido = t_plumber = 0.0
+    with PDFRapido(pdf_path) as rapido, pdfplumber.open(pdf_path) as pdf:
+        for num_pagina in paginas:
+            inicio = time.perf_counter()
+            registros_rapido = registros(rapido.texto(num_pagina - 1), num_pagina)
+            t_rapido += time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            registros_plumber = registros(pdf.pages[num_pagina - 1].extract_text(), num_pagina)
+            t_plumber += time.perf_counter() - inicio
+
+            diferencia = primera_diferencia(registros_rapido, registros_plumber)
+            if diferencia is None:
+                iguales += 1
+            else:
+                diferencias.append((num_pagina, diferencia))
+
+    print(f"⏱️ pdfplumber: {t_plumber:.2f}s | rápido: {t_rapido:.2f}s "
+          f"(x{t_plumber / t_rapido if t_rapido else 0:.1f})")
+    return iguales, diferencias
+
+
+def main():
+    """Comprobación de equivalencia en páginas de muestra"""
+    parser = argparse.ArgumentParser(description="Backend rápido de texto y verificación")
+    parser.add_argument('pdf', nargs='?', default=None, help="PDF a verificar")
+    parser.add_argument('--verificar', action='store_true', help="Comparar con pdfplumber")
+    parser.add_argument('--paginas', type=int, nargs='*', default=None,
+                        help="Páginas (1-based); por defecto la primera y última de cada especialidad")
+    parser.add_argument('--especialidad', default=None, help="Todas las páginas de una especialidad (p.ej. 006)")
+    args = parser.parse_args()
+
+    config = cargar_especialidades()
+    pdf_path = args.pdf or ruta_pdf_original(config)
+
+    paginas = args.paginas
+    if args.especialidad:
+        esp = buscar_especialidad(config, args.especialidad)
+        if esp is None:
+            print(f"❌ Especialidad no encontrada: {args.especialidad}")
+            sys.exit(1)
+        paginas = list(range(esp['pagina_inicio'], esp['pagina_fin'] + 1))
+    if not paginas:
+        with PDFRapido(pdf_path) as rapido:
+            total = rapido.num_paginas()
+        paginas = sorted({p for e in config['especialidades'].values()
+                          for p in (e['pagina_inicio'], e['pagina_fin']) if p <= total}) or [1]
+
+    if not args.verificar:
+        with PDFRapido(pdf_path) as rapido:
+            for num_pagina in paginas:
+                print(f"--- Página {num_pagina} ---")
+                print(rapido.texto(num_pagina - 1))
+        return
+
+    print(f"🔍 Verificando {len(paginas)} páginas de {pdf_path}")
+    iguales, diferencias = verificar_equivalencia(pdf_path, paginas)
+    for num_pagina, (posicion, campo, a, b) in diferencias[:5]:
+        print(f"❌ Página {num_pagina}, registro {posicion + 1}: {campo} distinto")
+        print(f"   rápido:     {a}")
+        print(f"   pdfplumber: {b}")
+    print(f"{'✅' if not diferencias else '⚠️'} {iguales}/{len(paginas)} páginas equivalentes")
+    sys.exit(0 if not diferencias else 1)
+
+
+if __name__ == "__main__":
+    main()